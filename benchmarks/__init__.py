@@ -0,0 +1 @@
+# 성능 측정 스크립트 모음 (레포지토리 루트에서 `python -m benchmarks.<모듈명>` 으로 실행)
@@ -0,0 +1,143 @@
+import argparse
+import json
+import os
+import sys
+import tempfile
+import time
+from employment_app import create_app
+from employment_app.models import db, Company, JobPosting, Skill, JobPostingSkill
+from employment_app.services import (
+    SARAMIN_BASE_URL, CrawlStats, crawl_job_posts, crawl_company_info, save_job_posts, save_company_info,
+    run_crawl_pipeline, extract_posting_id
+)
+from .saramin_stub import SaraminStubServer, FIXTURE_DIR
+
+EXPECTED_PATH = os.path.join(FIXTURE_DIR, 'expected_records.json')
+EXPECTED_PAGES = 3  # 기대 레코드 파일을 만든 검색 결과 페이지 수
+
+
+def canonical(records, base_url):
+    """
+    비교용 레코드 변환
+    (대역 서버 주소 -> 사람인 주소, 실행 날짜에 따라 달라지는 마감 연도/상태 제외)
+    """
+    result = []
+    for record in records:
+        item = {}
+        for key, value in record.items():
+            if key == '상태':
+                continue
+            if key == '마감일':
+                value = value.strftime('%m-%d') if value else None
+            elif hasattr(value, 'isoformat'):
+                value = value.isoformat()
+            elif isinstance(value, str):
+                value = value.replace(base_url, SARAMIN_BASE_URL)
+            item[key] = value
+        result.append(item)
+    return result
+
+
+def db_counts():
+    return {
+        'companies': Company.query.count(),
+        'job_postings': JobPosting.query.count(),
+        'skills': Skill.query.count(),
+        'job_posting_skills': JobPostingSkill.query.count(),
+    }
+
+
+def run(parser, pages, pipeline=False, keyword='python'):
+    """
+    대역 서버 + 임시 SQLite DB로 크롤링 -> 저장 전체 과정을 실행
+    """
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        app = create_app({'SQLALCHEMY_DATABASE_URI': f"sqlite:///{os.path.join(tmp_dir, 'bench.db')}"})
+        try:
+            import fakeredis  # 설치되어 있으면 Redis 서버 없이 실행 (기술 캐시 등)
+            app.redis_client = fakeredis.FakeRedis(decode_responses=True)
+        except ImportError:
+            pass  # 설정된 Redis(REDIS_HOST / REDIS_PORT) 사용
+
+        with app.app_context(), SaraminStubServer() as stub:
+            db.create_all()
+            stats = CrawlStats()
+
+            def fetch_company(company_name, company_link):
+                return crawl_company_info(company_name, company_link, parser=parser, delay=0, stats=stats)
+
+            start = time.perf_counter()
+            if pipeline:
+                job_data, saved_jobs = [], []
+
+                def persist(records):
+                    job_data.extend(records)
+                    saved_jobs.extend(save_job_posts(records, fetch_company, stats=stats))
+
+                run_crawl_pipeline(keyword, pages, persist, parser=parser, base_url=stub.base_url, stats=stats)
+                # 파이프라인은 페이지 완료 순서대로 저장하므로 비교를 위해 공고 순서 정렬
+                job_data.sort(key=lambda job: extract_posting_id(job))
+            else:
+                job_data = crawl_job_posts(keyword, pages, parser=parser, base_url=stub.base_url, delay=0, stats=stats)
+                saved_jobs = save_job_posts(job_data, fetch_company, stats=stats)
+
+            company_link = f"{stub.base_url}/zf_user/company-info/view?csn=BENCHMARK"
+            company_data = fetch_company('(주)벤치마크', company_link)
+            save_company_info(company_data, stats=stats)
+            elapsed = time.perf_counter() - start
+
+            counts = db_counts()
+            db.session.remove()
+            db.engine.dispose()
+
+        return {
+            'elapsed': elapsed,
+            'stats': stats,
+            'saved_jobs': len(saved_jobs),
+            'records': {
+                'job_posts': canonical(job_data, stub.base_url),
+                'company_info': canonical(company_data, stub.base_url),
+            },
+            'db': counts,
+        }
+
+
+def main():
+    parser = argparse.ArgumentParser(description='녹화된 HTML 기반 오프라인 크롤러 벤치마크 및 회귀 테스트')
+    parser.add_argument('--parser', default='auto', help='HTML 파서 백엔드 (auto / selectolax / lxml / html.parser)')
+    parser.add_argument('--pages', type=int, default=EXPECTED_PAGES, help='크롤링할 검색 결과 페이지 수')
+    parser.add_argument('--pipeline', action='store_true', help='fetch -> parse(프로세스 풀) -> persist 파이프라인으로 실행')
+    parser.add_argument('--update', action='store_true', help='기대 레코드 파일(expected_records.json) 갱신')
+    args = parser.parse_args()
+
+    result = run(args.parser, args.pages, pipeline=args.pipeline)
+    stats = result['stats']
+    elapsed = result['elapsed']
+
+    print(f"parser={args.parser} pipeline={args.pipeline} pages={stats.pages} records={stats.records} saved_jobs={result['saved_jobs']}")
+    print(f"elapsed {elapsed:.3f}s | {stats.pages / elapsed:.1f} pages/s | {stats.records / elapsed:.1f} records/s")
+    print(f"fetch {stats.seconds['fetch']:.3f}s | parse {stats.seconds['parse']:.3f}s | db {stats.seconds['db']:.3f}s")
+
+    expected = {'records': result['records'], 'db': result['db']}
+    if args.update:
+        with open(EXPECTED_PATH, 'w', encoding='utf-8') as f:
+            json.dump(expected, f, ensure_ascii=False, indent=2)
+        print(f"기대 레코드 갱신: {EXPECTED_PATH}")
+        return
+
+    with open(EXPECTED_PATH, encoding='utf-8') as f:
+        stored = json.load(f)
+
+    if args.pages != EXPECTED_PAGES:
+        print(f"기대 레코드는 {EXPECTED_PAGES}페이지 기준이므로 비교를 건너뜁니다.")
+        return
+
+    failures = [key for key in ('records', 'db') if stored[key] != expected[key]]
+    if failures:
+        print(f"회귀 발생: {', '.join(failures)} 이(가) 기대값과 다릅니다.")
+        sys.exit(1)
+    print("extracted records and db contents match expected_records.json")
+
+
+if __name__ == '__main__':
+    main()
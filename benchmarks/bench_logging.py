@@ -0,0 +1,146 @@
+import argparse
+import json
+import logging
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime
+from logging.handlers import RotatingFileHandler
+from flask import current_app, request
+from employment_app import create_app
+from employment_app.error_log import access_logger
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+MODES = ['none', 'sync', 'queue']
+
+
+def build_app(mode, tmp_dir, env, sample_rate):
+    """
+    로깅 방식별 앱 생성
+    - none: 로그 기록 안 함 (기준)
+    - sync: 이전 방식 (요청 스레드에서 RotatingFileHandler(maxBytes=10000)로 기록, 요청 시작/응답 f-string 로그)
+    - queue: 현재 방식 (QueueHandler + 리스너 스레드, JSON, 요청 로그 샘플링)
+    """
+    log_file = os.path.join(tmp_dir, f'{mode}.log')
+    app = create_app({
+        'ENV': env, 'ENABLE_MIGRATE': False, 'METRICS_ENABLED': False,
+        'SQLALCHEMY_DATABASE_URI': 'sqlite:///:memory:',
+        'LOG_FILE': log_file, 'LOG_REQUEST_SAMPLE_RATE': sample_rate,
+    })
+    queue_handler = app.extensions['log_queue_handler']
+    for handler in queue_handler.handlers:
+        if type(handler) is logging.StreamHandler:
+            handler.setStream(open(os.devnull, 'w'))  # 콘솔 출력은 측정에서 제외
+
+    if mode == 'none':
+        app.logger.disabled = True
+        access_logger.disabled = True
+    elif mode == 'sync':
+        access_logger.disabled = True
+        app.logger.removeHandler(queue_handler)
+        file_handler = RotatingFileHandler(log_file, maxBytes=10000, backupCount=3)
+        file_handler.setFormatter(logging.Formatter('%(asctime)s - %(levelname)s - %(message)s'))
+        app.logger.addHandler(file_handler)
+
+        @app.before_request
+        def log_request():
+            app.logger.info(f"Request started: {request.method} {request.url} at {datetime.now()}")
+
+        @app.after_request
+        def log_response(response):
+            app.logger.info(f"Response: {response.status_code} at {datetime.now()}")
+            return response
+    else:
+        app.logger.disabled = False
+        access_logger.disabled = False
+
+    # 컨트롤러처럼 요청마다 로그 한 줄을 남기는 엔드포인트
+    @app.route('/_bench/logging/<int:item_id>')
+    def bench_logging(item_id):
+        current_app.logger.info(f"Item {item_id} retrieved successfully")
+        return {'item_id': item_id}
+
+    return app, queue_handler
+
+
+def run_child(mode, args):
+    """
+    한 가지 로깅 방식으로 요청을 반복 실행 (앱/로거 상태가 섞이지 않도록 모드마다 새 프로세스에서 실행)
+    """
+    logging.basicConfig(stream=open(os.devnull, 'w'))  # 루트 로거 콘솔 출력 제외
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        app, queue_handler = build_app(mode, tmp_dir, args.env, args.sample_rate)
+        client = app.test_client()
+        for i in range(args.warmup):
+            client.get(f'/_bench/logging/{i}')
+
+        start = time.perf_counter()
+        for i in range(args.requests):
+            client.get(f'/_bench/logging/{i}')
+        per_request = (time.perf_counter() - start) / args.requests * 1e6
+
+        # 큐에 남은 로그를 모두 기록하는 데 걸린 시간 (요청 처리 시간에는 포함되지 않음)
+        start = time.perf_counter()
+        queue_handler.stop()
+        drain_ms = (time.perf_counter() - start) * 1000
+
+        log_lines = 0
+        for name in os.listdir(tmp_dir):
+            with open(os.path.join(tmp_dir, name), 'rb') as f:
+                log_lines += sum(1 for _ in f)
+    print(json.dumps({'per_request_us': per_request, 'drain_ms': drain_ms, 'log_lines': log_lines}))
+
+
+def measure(mode, args):
+    command = [
+        sys.executable, '-m', 'benchmarks.bench_logging', '--child', mode,
+        '--requests', str(args.requests), '--warmup', str(args.warmup),
+        '--env', args.env, '--sample-rate', str(args.sample_rate),
+    ]
+    result = subprocess.run(command, cwd=ROOT_DIR, capture_output=True, text=True)
+    if result.returncode != 0:
+        raise RuntimeError(result.stderr)
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+
+def main():
+    parser = argparse.ArgumentParser(description='요청당 로깅 오버헤드 벤치마크')
+    parser.add_argument('--requests', type=int, default=2000, help='측정 1회당 요청 수')
+    parser.add_argument('--repeat', type=int, default=5, help='방식별 측정 횟수 (방식을 번갈아 실행, 중앙값 사용)')
+    parser.add_argument('--warmup', type=int, default=200, help='측정 전 요청 수')
+    parser.add_argument('--env', default='dev', help="앱 ENV ('prod'면 ERROR 레벨, 그 외 DEBUG 레벨)")
+    parser.add_argument('--sample-rate', type=float, default=0.1, help='queue 방식의 요청 로그 샘플링 비율')
+    parser.add_argument('--max-overhead-us', type=float, default=None, help='queue 방식의 허용 요청당 오버헤드 (마이크로초)')
+    parser.add_argument('--child', choices=MODES, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        run_child(args.child, args)
+        return
+
+    runs = {mode: [] for mode in MODES}
+    for _ in range(args.repeat):
+        for mode in MODES:
+            runs[mode].append(measure(mode, args))
+
+    results = {mode: statistics.median(run['per_request_us'] for run in runs[mode]) for mode in MODES}
+    baseline = results['none']
+    print(f"requests={args.requests} repeat={args.repeat} env={args.env} sample_rate={args.sample_rate}")
+    for mode in MODES:
+        drain_ms = statistics.median(run['drain_ms'] for run in runs[mode])
+        log_lines = runs[mode][-1]['log_lines']
+        print(f"{mode:>5}: {results[mode]:8.1f} us/request | overhead {results[mode] - baseline:7.1f} us "
+              f"| log lines {log_lines} | drain {drain_ms:.1f} ms")
+
+    overhead = results['queue'] - baseline
+    if args.max_overhead_us is not None and overhead > args.max_overhead_us:
+        print(f"로깅 오버헤드 초과: {overhead:.1f} us > {args.max_overhead_us} us")
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,109 @@
+import argparse
+import os
+import statistics
+import sys
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from employment_app import create_app
+from employment_app.models import db
+
+EMAIL = 'bench{index}@example.com'
+PASSWORD = 'Bench!Passw0rd'
+
+
+def percentile(values, ratio):
+    values = sorted(values)
+    return values[min(len(values) - 1, int(len(values) * ratio))] if values else 0.0
+
+
+def run(clients, requests, rounds, workers, queue_timeout):
+    """
+    동시 로그인 부하 + 그 사이 가벼운 API(/jobs/facets) 응답 시간 측정
+    """
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        app = create_app({
+            'SQLALCHEMY_DATABASE_URI': f"sqlite:///{os.path.join(tmp_dir, 'bench.db')}",
+            'BCRYPT_LOG_ROUNDS': rounds,
+            'PASSWORD_HASH_WORKERS': workers,
+            'PASSWORD_HASH_QUEUE_TIMEOUT': queue_timeout,
+        })
+        try:
+            import fakeredis  # 설치되어 있으면 Redis 서버 없이 실행
+            app.redis_client = fakeredis.FakeRedis(decode_responses=True)
+        except ImportError:
+            pass  # 설정된 Redis(REDIS_HOST / REDIS_PORT) 사용
+
+        with app.app_context():
+            db.create_all()
+
+        client = app.test_client()
+        for index in range(clients):
+            client.post('/auth/register', json={'name': 'bench', 'email': EMAIL.format(index=index), 'password': PASSWORD})
+
+        login_latencies, other_latencies, statuses = [], [], {}
+        lock = threading.Lock()
+        done = threading.Event()
+
+        def login(index):
+            client = app.test_client()
+            start = time.perf_counter()
+            response = client.post('/auth/login', json={'email': EMAIL.format(index=index % clients), 'password': PASSWORD})
+            elapsed = time.perf_counter() - start
+            with lock:
+                login_latencies.append(elapsed)
+                statuses[response.status_code] = statuses.get(response.status_code, 0) + 1
+
+        def probe():
+            # 로그인 부하 중 해싱과 무관한 API의 응답 시간
+            client = app.test_client()
+            while not done.is_set():
+                start = time.perf_counter()
+                client.get('/jobs/facets')
+                other_latencies.append(time.perf_counter() - start)
+                time.sleep(0.01)
+
+        prober = threading.Thread(target=probe, daemon=True)
+        prober.start()
+        start = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=clients) as executor:
+            list(executor.map(login, range(requests)))
+        elapsed = time.perf_counter() - start
+        done.set()
+        prober.join()
+
+    return {
+        'elapsed': elapsed,
+        'logins_per_second': requests / elapsed,
+        'login_p50': statistics.median(login_latencies),
+        'login_p95': percentile(login_latencies, 0.95),
+        'other_p50': statistics.median(other_latencies) if other_latencies else 0.0,
+        'other_p95': percentile(other_latencies, 0.95),
+        'statuses': statuses,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description='동시 로그인 처리량 벤치마크 (bcrypt 해싱 풀)')
+    parser.add_argument('--clients', type=int, default=16, help='동시 로그인 요청 수')
+    parser.add_argument('--requests', type=int, default=64, help='전체 로그인 요청 수')
+    parser.add_argument('--rounds', type=int, default=12, help='bcrypt 비용 (BCRYPT_LOG_ROUNDS)')
+    parser.add_argument('--workers', type=int, default=2, help='해싱 풀 크기 (PASSWORD_HASH_WORKERS, 0: CPU 코어 수)')
+    parser.add_argument('--queue-timeout', type=float, default=30.0, help='해싱 대기 최대 시간 (PASSWORD_HASH_QUEUE_TIMEOUT)')
+    args = parser.parse_args()
+
+    if args.requests < 1 or args.clients < 1:
+        print("--clients, --requests는 1 이상이어야 합니다.")
+        sys.exit(1)
+
+    result = run(args.clients, args.requests, args.rounds, args.workers, args.queue_timeout)
+    print(f"clients={args.clients} requests={args.requests} rounds={args.rounds} workers={args.workers}")
+    print(f"elapsed {result['elapsed']:.3f}s | {result['logins_per_second']:.1f} logins/s")
+    print(f"login p50 {result['login_p50'] * 1000:.1f}ms | p95 {result['login_p95'] * 1000:.1f}ms")
+    print(f"other api p50 {result['other_p50'] * 1000:.1f}ms | p95 {result['other_p95'] * 1000:.1f}ms")
+    print(f"status codes {result['statuses']}")
+
+
+if __name__ == '__main__':
+    main()
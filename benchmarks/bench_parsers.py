@@ -0,0 +1,77 @@
+import argparse
+import glob
+import os
+import time
+from employment_app.services.saramin_parser import PARSER_BACKENDS, JobPostParser, CompanyInfoParser
+
+FIXTURE_DIR = os.path.join(os.path.dirname(__file__), 'fixtures')
+
+
+def load_fixtures():
+    """
+    녹화된 사람인 HTML 픽스처 로드
+    """
+    search_pages = []
+    for path in sorted(glob.glob(os.path.join(FIXTURE_DIR, 'search_page_*.html'))):
+        with open(path, encoding='utf-8') as f:
+            search_pages.append(f.read())
+    with open(os.path.join(FIXTURE_DIR, 'company_info.html'), encoding='utf-8') as f:
+        company_page = f.read()
+    return search_pages, company_page
+
+
+def bench_backend(backend, search_pages, company_page, rounds):
+    """
+    백엔드별 초당 처리 페이지 수 측정
+    """
+    job_parser = JobPostParser(backend)
+    company_parser = CompanyInfoParser(backend)
+
+    start = time.perf_counter()
+    for _ in range(rounds):
+        for html in search_pages:
+            job_parser.parse(html)
+    job_elapsed = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for _ in range(rounds):
+        company_parser.parse(company_page, '벤치마크')
+    company_elapsed = time.perf_counter() - start
+
+    return {
+        'search_pages_per_sec': rounds * len(search_pages) / job_elapsed,
+        'company_pages_per_sec': rounds / company_elapsed,
+        'jobs': [job_parser.parse(html) for html in search_pages],
+        'company': company_parser.parse(company_page, '벤치마크'),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description='사람인 파서 백엔드 벤치마크')
+    parser.add_argument('--rounds', type=int, default=50, help='픽스처 반복 횟수')
+    args = parser.parse_args()
+
+    search_pages, company_page = load_fixtures()
+    results = {}
+
+    print(f"{'backend':<12} {'search pages/s':>15} {'company pages/s':>16}")
+    for backend in PARSER_BACKENDS:
+        try:
+            result = bench_backend(backend, search_pages, company_page, args.rounds)
+        except ImportError:
+            print(f"{backend:<12} {'(미설치)':>15}")
+            continue
+        results[backend] = result
+        print(f"{backend:<12} {result['search_pages_per_sec']:>15.1f} {result['company_pages_per_sec']:>16.1f}")
+
+    # 모든 백엔드가 동일한 레코드를 생성하는지 확인
+    baseline = results.get('html.parser')
+    for backend, result in results.items():
+        assert result['jobs'] == baseline['jobs'], f"{backend} 채용공고 레코드가 html.parser 결과와 다릅니다."
+        assert result['company'] == baseline['company'], f"{backend} 회사 레코드가 html.parser 결과와 다릅니다."
+    print(f"records identical across {len(results)} backends "
+          f"({sum(len(jobs) for jobs in baseline['jobs'])} jobs, {len(baseline['company'])} company)")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,65 @@
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# 새 프로세스에서 create_app() 소요 시간과 최대 RSS 측정
+PROBE = '''
+import json, resource, time
+start = time.perf_counter()
+from employment_app import create_app
+imported = time.perf_counter()
+create_app({"ENABLE_MIGRATE": %(migrate)s})
+end = time.perf_counter()
+print(json.dumps({
+    "import_seconds": imported - start,
+    "create_app_seconds": end - imported,
+    "total_seconds": end - start,
+    "max_rss_mb": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024,
+}))
+'''
+
+
+def measure(migrate):
+    result = subprocess.run(
+        [sys.executable, '-c', PROBE % {'migrate': migrate}],
+        cwd=ROOT_DIR, capture_output=True, text=True
+    )
+    if result.returncode != 0:
+        raise RuntimeError(result.stderr)
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+
+def main():
+    parser = argparse.ArgumentParser(description='create_app() 시작 시간 / 메모리 벤치마크')
+    parser.add_argument('--runs', type=int, default=5, help='측정 횟수 (매번 새 프로세스)')
+    parser.add_argument('--migrate', action='store_true', help='Flask-Migrate 포함하여 측정 (flask CLI 기준)')
+    parser.add_argument('--max-seconds', type=float, default=1.0, help='허용 시작 시간 (중앙값, 초)')
+    parser.add_argument('--max-rss-mb', type=float, default=120, help='허용 최대 RSS (MB)')
+    args = parser.parse_args()
+
+    runs = [measure(args.migrate) for _ in range(args.runs)]
+    total = statistics.median(run['total_seconds'] for run in runs)
+    imports = statistics.median(run['import_seconds'] for run in runs)
+    create = statistics.median(run['create_app_seconds'] for run in runs)
+    rss = max(run['max_rss_mb'] for run in runs)
+
+    print(f"runs={args.runs} migrate={args.migrate}")
+    print(f"import {imports:.3f}s | create_app {create:.3f}s | total {total:.3f}s (median) | max rss {rss:.1f} MB")
+
+    failures = []
+    if total > args.max_seconds:
+        failures.append(f"시작 시간 {total:.3f}s > {args.max_seconds}s")
+    if rss > args.max_rss_mb:
+        failures.append(f"RSS {rss:.1f} MB > {args.max_rss_mb} MB")
+    if failures:
+        print(f"시작 예산 초과: {', '.join(failures)}")
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
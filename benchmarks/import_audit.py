@@ -0,0 +1,62 @@
+import argparse
+import os
+import subprocess
+import sys
+from collections import defaultdict
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# 앱 시작 시 로드되면 안 되는 무거운 선택 의존성 (크롤링 등 필요한 경로에서만 로드)
+DEFAULT_FORBIDDEN = ['pandas', 'numpy', 'bs4', 'requests', 'lxml', 'selectolax', 'alembic']
+
+DEFAULT_TARGET = 'from employment_app import create_app; create_app({"ENABLE_MIGRATE": False})'
+
+
+def collect_import_times(target):
+    """
+    `python -X importtime`으로 대상 코드를 새 프로세스에서 실행하여 모듈별 (자체, 누적) 로드 시간(us) 수집
+    """
+    result = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', target],
+        cwd=ROOT_DIR, capture_output=True, text=True
+    )
+    if result.returncode != 0:
+        raise RuntimeError(result.stderr)
+
+    modules = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith('import time:') or 'cumulative' in line:
+            continue
+        self_us, cumulative_us, name = line[len('import time:'):].split('|')
+        modules[name.strip()] = (int(self_us), int(cumulative_us))
+    return modules
+
+
+def main():
+    parser = argparse.ArgumentParser(description='앱 시작 시 import 시간 감사 도구')
+    parser.add_argument('--target', default=DEFAULT_TARGET, help='측정할 파이썬 코드')
+    parser.add_argument('--top', type=int, default=15, help='출력할 최상위 패키지 수')
+    parser.add_argument('--forbid', default=','.join(DEFAULT_FORBIDDEN), help='로드되면 실패 처리할 패키지 목록 (쉼표 구분)')
+    args = parser.parse_args()
+
+    modules = collect_import_times(args.target)
+
+    # 최상위 패키지별 자체 로드 시간 합계
+    packages = defaultdict(int)
+    for name, (self_us, _) in modules.items():
+        packages[name.split('.')[0]] += self_us
+
+    total_ms = sum(packages.values()) / 1000
+    print(f"{len(modules)} modules imported, {total_ms:.1f} ms total")
+    print(f"{'package':<28} {'self ms':>10} {'share':>7}")
+    for name, self_us in sorted(packages.items(), key=lambda item: item[1], reverse=True)[:args.top]:
+        print(f"{name:<28} {self_us / 1000:>10.1f} {self_us / 1000 / total_ms:>7.1%}")
+
+    forbidden = [name for name in args.forbid.split(',') if name and name in packages]
+    if forbidden:
+        print(f"시작 시 로드되면 안 되는 패키지가 로드되었습니다: {', '.join(forbidden)}")
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
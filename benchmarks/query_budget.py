@@ -0,0 +1,89 @@
+import argparse
+import os
+import sys
+import tempfile
+from employment_app import create_app
+from employment_app.models import db, User, Company, JobPosting, Bookmark, Application, Inquiry, Review
+from employment_app.services import password_hasher
+
+EMAIL = 'budget@example.com'
+PASSWORD = 'Budget!Passw0rd'
+
+# 점검할 엔드포인트 (허용 개수는 각 핸들러의 @query_budget 값)
+ENDPOINTS = [
+    ('GET', '/bookmarks', True),
+    ('GET', '/applications?job_post_id=1', True),  # 조회 스키마에서 job_post_id가 필수
+    ('GET', '/inquiry', True),
+    ('GET', '/reviews', False),
+    ('GET', '/auth/dashboard', True),
+]
+
+
+def seed(items):
+    """
+    사용자 1명 + 회사/공고 items개 + 공고별 북마크/지원/문의/리뷰
+    """
+    user = User(name='budget', email=EMAIL, password=password_hasher.hash(PASSWORD))
+    db.session.add(user)
+    db.session.flush()
+    for index in range(items):
+        company = Company(name=f'company {index}')
+        db.session.add(company)
+        db.session.flush()
+        job = JobPosting(company_id=company.company_id, title=f'job {index}', status='open')
+        db.session.add(job)
+        db.session.flush()
+        db.session.add_all([
+            Bookmark(user_id=user.user_id, job_post_id=job.job_post_id),
+            Application(user_id=user.user_id, job_post_id=job.job_post_id, company_id=company.company_id, status='submitted'),
+            Inquiry(user_id=user.user_id, job_post_id=job.job_post_id, title='문의', message='문의 내용'),
+            Review(user_id=user.user_id, company_id=company.company_id, rating=5, review_text='리뷰'),
+        ])
+    db.session.commit()
+
+
+def main():
+    parser = argparse.ArgumentParser(description='목록 API의 요청당 SQL 실행 수를 @query_budget 값과 비교')
+    parser.add_argument('--items', type=int, default=20, help='사용자별 북마크/지원/문의/리뷰 개수')
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        app = create_app({
+            'SQLALCHEMY_DATABASE_URI': f"sqlite:///{os.path.join(tmp_dir, 'budget.db')}",
+            'SQL_QUERY_COUNT_HEADER': True,
+            'BCRYPT_LOG_ROUNDS': 4,
+            'RATE_LIMIT_ENABLED': False,
+        })
+        try:
+            import fakeredis  # 설치되어 있으면 Redis 서버 없이 실행
+            app.redis_client = fakeredis.FakeRedis(decode_responses=True)
+        except ImportError:
+            pass  # 설정된 Redis(REDIS_HOST / REDIS_PORT) 사용
+
+        with app.app_context():
+            db.create_all()
+            seed(args.items)
+
+        client = app.test_client()
+        token = client.post('/auth/login', json={'email': EMAIL, 'password': PASSWORD}).get_json()['data']['access_token']
+        app.redis_client.flushdb()  # 사용자 캐시가 없는 상태(최악의 경우)로 측정
+
+        failures = []
+        for method, path, auth in ENDPOINTS:
+            headers = {'Authorization': f'Bearer {token}'} if auth else {}
+            response = client.open(path, method=method, headers=headers)
+            count = int(response.headers.get('X-SQL-Query-Count', 0))
+            budget = response.headers.get('X-SQL-Query-Budget')
+            print(f"{method} {path:<30} status={response.status_code} queries={count} budget={budget}")
+            if response.status_code != 200:
+                failures.append(f"{path} 응답 코드 {response.status_code}")
+            elif budget is not None and count > int(budget):
+                failures.append(f"{path} {count} > {budget}")
+
+    if failures:
+        print(f"쿼리 예산 초과: {', '.join(failures)}")
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,87 @@
+import os
+import shutil
+import sys
+import tempfile
+import time
+from employment_app import create_app
+from employment_app.models import db, Company, Review
+from benchmarks.query_budget import seed, EMAIL, PASSWORD
+
+STICKY_SECONDS = 1
+
+
+def review_count(client, headers=None):
+    return len(client.get('/reviews?limit=100', headers=headers or {}).get_json()['data']['Reviews'])
+
+
+def main():
+    """
+    SQLite 파일 3개(주 DB, 복제본 2개)로 읽기/쓰기 라우팅과 쓰기 직후 주 DB 고정을 확인
+    - 복제본마다 리뷰 수를 다르게 만들어 어느 DB에서 응답했는지 구분
+    """
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        paths = {name: os.path.join(tmp_dir, f'{name}.db') for name in ['primary', 'replica_a', 'replica_b']}
+        app = create_app({
+            'SQLALCHEMY_DATABASE_URI': f"sqlite:///{paths['primary']}",
+            'SQLALCHEMY_REPLICA_URIS': [f"sqlite:///{paths['replica_a']}", f"sqlite:///{paths['replica_b']}"],
+            'REPLICA_STICKY_SECONDS': STICKY_SECONDS,
+            'BCRYPT_LOG_ROUNDS': 4,
+            'RATE_LIMIT_ENABLED': False,
+        })
+        try:
+            import fakeredis  # 설치되어 있으면 Redis 서버 없이 실행
+            app.redis_client = fakeredis.FakeRedis(decode_responses=True)
+        except ImportError:
+            pass  # 설정된 Redis(REDIS_HOST / REDIS_PORT) 사용
+
+        # 주 DB: 리뷰 3개 -> 복제본 A: 3개 복사 -> 주 DB에 1개 추가 후 복제본 B: 4개 복사 -> 주 DB에 1개 더 추가 (5개)
+        with app.app_context():
+            db.create_all(bind_key=None)
+            seed(3)
+            db.engine.dispose()
+            shutil.copy(paths['primary'], paths['replica_a'])
+            company = Company.query.first()
+            for replica in ['replica_b', None]:
+                db.session.add(Review(user_id=1, company_id=company.company_id, rating=4, review_text='추가 리뷰'))
+                db.session.commit()
+                if replica:
+                    db.engine.dispose()
+                    shutil.copy(paths['primary'], paths[replica])
+
+        failures = []
+        client = app.test_client()
+
+        # 1. 읽기 요청은 복제본 두 개에 번갈아 분산
+        counts = {review_count(client) for _ in range(4)}
+        print(f"GET /reviews 리뷰 수: {sorted(counts)} (복제본 3/4, 주 DB 5)")
+        if counts != {3, 4}:
+            failures.append("읽기 요청이 복제본에 라운드 로빈으로 분산되지 않음")
+
+        # 2. 쓰기 요청은 주 DB로, 직후 같은 사용자의 읽기도 주 DB로
+        token = client.post('/auth/login', json={'email': EMAIL, 'password': PASSWORD}).get_json()['data']['access_token']
+        headers = {'Authorization': f'Bearer {token}'}
+        response = client.post('/reviews', json={'company_id': 1, 'rating': 5, 'review_text': '새 리뷰'}, headers=headers)
+        sticky = review_count(client, headers)
+        print(f"POST /reviews {response.status_code} -> 직후 GET /reviews 리뷰 수: {sticky} (주 DB 6)")
+        if response.status_code != 201 or sticky != 6:
+            failures.append("쓰기 직후 읽기가 주 DB로 고정되지 않음")
+
+        # 3. 고정 시간이 지나면 다시 복제본으로
+        time.sleep(STICKY_SECONDS + 0.2)
+        released = review_count(client, headers)
+        print(f"{STICKY_SECONDS}초 후 GET /reviews 리뷰 수: {released} (복제본 3/4)")
+        if released not in (3, 4):
+            failures.append("고정 시간이 지난 뒤에도 주 DB에서 읽음")
+
+        with app.app_context():
+            db.session.remove()
+            for engine in db.engines.values():
+                engine.dispose()
+
+    if failures:
+        print(f"복제본 라우팅 실패: {', '.join(failures)}")
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
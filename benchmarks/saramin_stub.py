@@ -0,0 +1,82 @@
+import os
+import threading
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+from urllib.parse import urlparse, parse_qs
+
+FIXTURE_DIR = os.path.join(os.path.dirname(__file__), 'fixtures')
+
+# 검색 결과 마지막 페이지 이후에 돌려줄 빈 결과 페이지
+EMPTY_SEARCH_PAGE = '<html><body><div id="recruit_info_list"></div></body></html>'
+
+
+class SaraminStubHandler(BaseHTTPRequestHandler):
+    """
+    녹화된 HTML 픽스처를 사람인과 같은 경로로 응답하는 핸들러
+    - /zf_user/search/recruit?recruitPage=N -> fixtures/search_page_N.html
+    - /zf_user/company-info/view?csn=...    -> fixtures/company_info.html
+    """
+
+    def do_GET(self):
+        url = urlparse(self.path)
+        query = parse_qs(url.query)
+
+        if url.path == '/zf_user/search/recruit':
+            page = query.get('recruitPage', ['1'])[0]
+            body = self.server.read_fixture(f'search_page_{page}.html', EMPTY_SEARCH_PAGE)
+        elif url.path == '/zf_user/company-info/view':
+            body = self.server.read_fixture('company_info.html')
+        else:
+            body = None
+
+        if body is None:
+            self.send_response(404)
+            self.end_headers()
+            return
+
+        payload = body.encode('utf-8')
+        self.send_response(200)
+        self.send_header('Content-Type', 'text/html; charset=utf-8')
+        self.send_header('Content-Length', str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def log_message(self, format, *args):
+        # 요청 로그 출력 생략
+        pass
+
+
+class SaraminStubServer(ThreadingHTTPServer):
+    """
+    로컬 사람인 대역 서버 (with 문으로 사용, 임의 포트에서 백그라운드 실행)
+    """
+
+    daemon_threads = True
+
+    def __init__(self, fixture_dir=FIXTURE_DIR, host='127.0.0.1', port=0):
+        super().__init__((host, port), SaraminStubHandler)
+        self.fixture_dir = fixture_dir
+        self._cache = {}
+        self._thread = None
+
+    @property
+    def base_url(self):
+        host, port = self.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def read_fixture(self, name, default=None):
+        if name not in self._cache:
+            path = os.path.join(self.fixture_dir, name)
+            if not os.path.exists(path):
+                return default
+            with open(path, encoding='utf-8') as f:
+                self._cache[name] = f.read()
+        return self._cache[name]
+
+    def __enter__(self):
+        self._thread = threading.Thread(target=self.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc_info):
+        self.shutdown()
+        self.server_close()
@@ -15,6 +15,23 @@ class Config:
         f"{os.getenv('DB_NAME', 'database_name')}"
     )
     SQLALCHEMY_TRACK_MODIFICATIONS = False
+    # 읽기 전용 복제본 (쉼표로 구분, GET 요청을 라운드 로빈으로 분산)
+    SQLALCHEMY_REPLICA_URIS = [uri.strip() for uri in os.getenv("DB_REPLICA_URIS", "").split(",") if uri.strip()]
+    REPLICA_STICKY_SECONDS = int(os.getenv("REPLICA_STICKY_SECONDS", 5))  # 쓰기 후 해당 사용자의 읽기를 주 DB로 보내는 시간 (초)
+    # 커넥션 풀 설정 (워커 프로세스마다 적용, SQLALCHEMY_ENGINE_OPTIONS는 create_app에서 생성)
+    DB_POOL_SIZE = int(os.getenv("DB_POOL_SIZE", 5))  # 유지할 커넥션 수
+    DB_MAX_OVERFLOW = int(os.getenv("DB_MAX_OVERFLOW", 10))  # 풀이 가득 찼을 때 추가로 열 수 있는 커넥션 수
+    DB_POOL_TIMEOUT = int(os.getenv("DB_POOL_TIMEOUT", 10))  # 커넥션 획득 최대 대기 시간 (초)
+    DB_POOL_RECYCLE = int(os.getenv("DB_POOL_RECYCLE", 1800))  # 이 시간(초)보다 오래된 커넥션은 다시 연결
+    DB_POOL_PRE_PING = os.getenv("DB_POOL_PRE_PING", "true").lower() == "true"  # 커넥션 사용 전 연결 확인 (장애 조치 후 끊긴 연결 제거)
+    DB_STATEMENT_TIMEOUT = int(os.getenv("DB_STATEMENT_TIMEOUT", 30000))  # SQL 최대 실행 시간 (밀리초, 0이면 제한 없음, PostgreSQL)
+    DB_APPLICATION_NAME = os.getenv("DB_APPLICATION_NAME", "employment_app")  # pg_stat_activity에 표시할 이름 (PostgreSQL)
+    DB_STARTUP_CHECK = os.getenv("DB_STARTUP_CHECK", "false").lower() == "true"  # 앱 생성 시 DB 연결 확인 (SELECT 1)
+    ENABLE_MIGRATE = os.getenv("ENABLE_MIGRATE", "true").lower() == "true"  # Flask-Migrate(`flask db`) 초기화 여부
+    METRICS_ENABLED = os.getenv("METRICS_ENABLED", "true").lower() == "true"  # GET /metrics (Prometheus 형식 지표) 사용 여부
+    METRICS_MULTIPROC_DIR = os.getenv("METRICS_MULTIPROC_DIR", "")  # 워커별 지표 파일 디렉터리 (gunicorn 워커 합산용, 비우면 현재 프로세스만)
+    METRICS_FLUSH_INTERVAL = float(os.getenv("METRICS_FLUSH_INTERVAL", 1.0))  # 워커별 지표 파일 기록 간격 (초)
+    SQL_QUERY_COUNT_HEADER = os.getenv("SQL_QUERY_COUNT_HEADER", "false").lower() == "true"  # 응답에 요청당 SQL 실행 수 헤더 추가 (개발/점검용)
     SECRET_KEY = os.getenv("SECRET_KEY", "default_secret_key")
 
     # Redis 연결 정보
@@ -22,6 +39,11 @@ class Config:
     REDIS_PORT = int(os.getenv('REDIS_PORT', 6379))
     REDIS_DB = int(os.getenv('REDIS_DB', 0))
     REDIS_PASSWORD = os.getenv('REDIS_PASSWORD', None)
+    REDIS_MAX_CONNECTIONS = int(os.getenv('REDIS_MAX_CONNECTIONS', 50))  # 프로세스당 최대 커넥션 수
+    REDIS_SOCKET_TIMEOUT = float(os.getenv('REDIS_SOCKET_TIMEOUT', 0.5))  # 명령 응답 대기 시간 (초)
+    REDIS_CONNECT_TIMEOUT = float(os.getenv('REDIS_CONNECT_TIMEOUT', 0.5))  # 연결 대기 시간 (초)
+    REDIS_BREAKER_THRESHOLD = int(os.getenv('REDIS_BREAKER_THRESHOLD', 5))  # 연속 실패 시 회로를 여는 횟수
+    REDIS_BREAKER_RESET = float(os.getenv('REDIS_BREAKER_RESET', 30))  # 회로가 열린 뒤 다시 시도하기까지의 시간 (초)
 
     # JWT 설정
     JWT_SECRET_KEY = os.getenv("SECRET_KEY", "your_jwt_secret_key")  # JWT 인증용 시크릿 키
@@ -30,6 +52,46 @@ class Config:
     JWT_TOKEN_LOCATION = ["headers"]  # 토큰을 헤더에서 읽음
     JWT_HEADER_NAME = "Authorization"  # JWT 토큰의 헤더 이름
     JWT_HEADER_TYPE = "Bearer"  # JWT 토큰 타입 (Bearer)
+    TOKEN_AUDIT_DB = os.getenv("TOKEN_AUDIT_DB", "false").lower() == "true"  # 토큰 발급 내역을 tokens 테이블에 백그라운드 기록
+    BCRYPT_LOG_ROUNDS = int(os.getenv("BCRYPT_LOG_ROUNDS", 12))  # bcrypt 해싱 비용 (변경 시 다음 로그인에서 재해싱)
+    PASSWORD_HASH_WORKERS = int(os.getenv("PASSWORD_HASH_WORKERS", 2))  # 프로세스당 동시 해싱 수 (0: CPU 코어 수)
+    PASSWORD_HASH_QUEUE_TIMEOUT = float(os.getenv("PASSWORD_HASH_QUEUE_TIMEOUT", 2.0))  # 해싱 대기 최대 시간 (초, 초과 시 503)
+    USER_CACHE_TTL = int(os.getenv("USER_CACHE_TTL", 60))  # 인증 사용자 Redis 캐시 만료 시간 (초, 0이면 사용 안 함)
+    BOOKMARK_SET_TTL = int(os.getenv("BOOKMARK_SET_TTL", 86400))  # 사용자별 북마크 공고 ID 집합 Redis 만료 시간 (초)
+    DASHBOARD_CACHE_TTL = int(os.getenv("DASHBOARD_CACHE_TTL", 300))  # 마이페이지 Redis 캐시 만료 시간 (초)
+    RATING_CACHE_TTL = int(os.getenv("RATING_CACHE_TTL", 600))  # 회사 평점 요약 Redis 사본 만료 시간 (초)
+
+    # 요청 수 제한 설정 (형식: 횟수/second|minute|hour|day, 비워두면 제한 없음)
+    RATE_LIMIT_ENABLED = os.getenv("RATE_LIMIT_ENABLED", "true").lower() == "true"  # 요청 수 제한 사용 여부
+    RATE_LIMIT_LOGIN = os.getenv("RATE_LIMIT_LOGIN", "10/minute")  # 로그인 (IP별, 이메일별)
+    RATE_LIMIT_REGISTER = os.getenv("RATE_LIMIT_REGISTER", "5/minute")  # 회원가입 (IP별)
+    RATE_LIMIT_REFRESH = os.getenv("RATE_LIMIT_REFRESH", "30/minute")  # 토큰 재발급 (IP별, 사용자별)
+    RATE_LIMIT_CRAWL = os.getenv("RATE_LIMIT_CRAWL", "5/hour")  # 크롤링 (IP별)
+
+    # 채용 공고 캐시 설정
+    JOB_CACHE_TTL = int(os.getenv("JOB_CACHE_TTL", 3600))  # 공고 목록/집계 캐시 만료 시간 (초)
+
+    # 크롤링 설정
+    CRAWL_PARSER = os.getenv("CRAWL_PARSER", "auto")  # HTML 파서 백엔드 (auto / selectolax / lxml / html.parser)
+    CRAWL_MAX_PAGES = int(os.getenv("CRAWL_MAX_PAGES", 50))  # 증분 크롤링 최대 페이지 수 (안전 상한)
+    CRAWL_CHECKPOINT_TTL = int(os.getenv("CRAWL_CHECKPOINT_TTL", 60 * 60 * 24 * 90))  # 증분 크롤링 체크포인트 보관 기간 (초)
+    CRAWL_PIPELINE_MIN_PAGES = int(os.getenv("CRAWL_PIPELINE_MIN_PAGES", 10))  # 이 페이지 수 이상이면 fetch/parse/persist 파이프라인 사용
+    CRAWL_FETCH_WORKERS = int(os.getenv("CRAWL_FETCH_WORKERS", 4))  # 파이프라인 다운로드 스레드 수
+    CRAWL_PARSE_WORKERS = int(os.getenv("CRAWL_PARSE_WORKERS", 0))  # 파이프라인 파싱 프로세스 수 (0: CPU 코어 수)
+    CRAWL_QUEUE_SIZE = int(os.getenv("CRAWL_QUEUE_SIZE", 8))  # 단계 사이 큐 크기 (메모리 상한)
+
+    # 로깅 설정 (JSON 한 줄 형식, 별도 스레드에서 파일 기록)
+    LOG_FILE = os.getenv("LOG_FILE", "app.log")
+    LOG_MAX_BYTES = int(os.getenv("LOG_MAX_BYTES", 50 * 1024 * 1024))  # 로그 파일 로테이션 크기 (바이트)
+    LOG_BACKUP_COUNT = int(os.getenv("LOG_BACKUP_COUNT", 5))  # 보관할 이전 로그 파일 수
+    LOG_FLUSH_INTERVAL = float(os.getenv("LOG_FLUSH_INTERVAL", 0.2))  # 큐에 쌓인 로그를 기록하는 간격 (초)
+    LOG_REQUEST_SAMPLE_RATE = float(os.getenv("LOG_REQUEST_SAMPLE_RATE", 0.1))  # 요청 로그를 남길 비율 (0~1, 5xx/느린 요청은 항상 기록)
+    LOG_SLOW_REQUEST_MS = float(os.getenv("LOG_SLOW_REQUEST_MS", 1000))  # 느린 요청 기준 (밀리초)
+
+    # 워커 시작 시 미리 요청할 경로 (gunicorn.conf.py의 post_worker_init, 쉼표로 구분)
+    WORKER_WARMUP_PATHS = [path.strip() for path in os.getenv(
+        "WORKER_WARMUP_PATHS", "/jobs/sort?sort=view_desc,/jobs/sort?sort=posted_date_desc,/jobs/facets"
+    ).split(",") if path.strip()]
 
     # Swagger/OpenAPI 설정
     API_TITLE = "Swagger UI"
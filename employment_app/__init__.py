@@ -1,20 +1,20 @@
 from flask import Flask, jsonify
-from flask_migrate import Migrate
 from config import Config
 from flask_smorest import Api
 from .views.main_routes import main_blueprint
 from .controllers import api_blueprint, init_api
-from .models import db # models에 선언된 db 객체 사용
+from .models import db, mark_sticky # models에 선언된 db 객체 사용
 from .schemas import swagger_security_schemes
 from .extensions import bcrypt, jwt # 확장 프로그램 사용
 from .error_log import configure_error_handlers, configure_logger, monitor_performance
+from .commands import init_commands
 from sqlalchemy.exc import OperationalError
 from sqlalchemy import text  # text를 import
 from flask_marshmallow import Marshmallow
-from redis import Redis  # Redis 임포트
+from werkzeug.local import LocalProxy
 
-def create_app():
-    """Flask 애플리케이션을 생성하고 설정합니다."""
+def create_app(config_overrides=None):
+    """Flask 애플리케이션을 생성하고 설정합니다. (config_overrides: 테스트/벤치마크용 설정 덮어쓰기)"""
     
     # Flask 앱 초기화
     app = Flask(
@@ -25,15 +25,28 @@ def create_app():
 
     # Flask 설정을 로드합니다.
     app.config.from_object(Config)
+    app.config.update(config_overrides or {})
 
     ma = Marshmallow(app)
 
     # 모델 임포트
-    from .models.model import User, Company, JobPosting, Skill, JobPostingSkill, Token, Bookmark, Application
-
-    # 데이터베이스 초기화
+    from .models.model import User, Company, JobPosting, Skill, JobPostingSkill, JobFacetCount, JobEngagement, Token, Bookmark, Application, CompanyRating
+
+    # 데이터베이스 초기화 (커넥션 풀 옵션은 DB_* 설정으로 생성)
+    from .services.db_service import engine_options
+    app.config.setdefault('SQLALCHEMY_ENGINE_OPTIONS', engine_options(app.config))
+    binds = app.config.setdefault('SQLALCHEMY_BINDS', {})
+    for index, uri in enumerate(app.config['SQLALCHEMY_REPLICA_URIS']):
+        binds.setdefault(f'replica_{index}', {'url': uri, **engine_options({**app.config, 'SQLALCHEMY_DATABASE_URI': uri})})
     db.init_app(app)
-    Migrate(app, db)
+
+    # 쓰기 직후 같은 사용자의 읽기를 잠시 주 DB로 고정 (복제 지연 대비)
+    app.after_request(mark_sticky)
+
+    # 마이그레이션 확장 (alembic 로드 비용이 커서 `flask db` 명령이 필요한 경우에만 초기화)
+    if app.config['ENABLE_MIGRATE']:
+        from flask_migrate import Migrate
+        Migrate(app, db)
 
     # extensions(확장) 초기화 
     bcrypt.init_app(app)
@@ -58,24 +71,37 @@ def create_app():
     app.register_blueprint(main_blueprint)  # 기본 라우트 등록
     app.register_blueprint(api_blueprint, url_prefix='/api')  # API 관련 라우트 등록
 
-    # Redis 클라이언트 초기화
+    # CLI 명령 등록 (flask skills ...)
+    init_commands(app)
+
+    # Redis 클라이언트 초기화 (처음 사용할 때 생성)
+    redis_clients = []
+
     def get_redis_client():
-        return Redis(host=app.config['REDIS_HOST'], 
-                     port=app.config['REDIS_PORT'], 
-                     db=app.config['REDIS_DB'], 
-                     password=app.config['REDIS_PASSWORD'], 
-                     decode_responses=True)
+        if not redis_clients:
+            # 커넥션 풀 + 타임아웃 + 회로 차단기 (Redis 장애 시 캐시를 건너뛰고 DB로 처리)
+            from .services.cache_service import create_redis_client
+            redis_clients.append(create_redis_client(app.config, app.logger))
+        return redis_clients[0]
+
+    def reset_redis_client(close=True):
+        # 다음 사용 시 새 커넥션 풀 생성 (gunicorn fork 후 워커별로 다시 연결)
+        if redis_clients and close:
+            redis_clients[0].connection_pool.disconnect()
+        redis_clients.clear()
 
     # 애플리케이션에 Redis 클라이언트 추가
-    app.redis_client = get_redis_client()
-
-    # 데이터베이스 연결 확인
-    with app.app_context():
-        try:
-            db.session.execute(text("SELECT 1"))  # 데이터베이스 연결 확인 쿼리
-            print("Database connected successfully!")
-        except OperationalError as e:
-            print("Database connection failed:", e)
+    app.redis_client = LocalProxy(get_redis_client)
+    app.reset_redis_client = reset_redis_client
+
+    # 데이터베이스 연결 확인 (설정 시에만, 워커 부팅 시간 단축)
+    if app.config['DB_STARTUP_CHECK']:
+        with app.app_context():
+            try:
+                db.session.execute(text("SELECT 1"))  # 데이터베이스 연결 확인 쿼리
+                print("Database connected successfully!")
+            except OperationalError as e:
+                print("Database connection failed:", e)
 
     # 로깅 설정
     configure_logger(app)
@@ -0,0 +1,15 @@
+def init_commands(app):
+    """
+    Flask CLI 명령 등록 (예: flask skills normalize)
+    """
+    from .skill_commands import skills_cli
+    from .job_commands import jobs_cli
+    from .review_commands import reviews_cli
+    from .bookmark_commands import bookmarks_cli
+    from .application_commands import applications_cli
+
+    app.cli.add_command(skills_cli)
+    app.cli.add_command(jobs_cli)
+    app.cli.add_command(reviews_cli)
+    app.cli.add_command(bookmarks_cli)
+    app.cli.add_command(applications_cli)
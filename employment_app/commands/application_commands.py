@@ -0,0 +1,16 @@
+import click
+from flask.cli import AppGroup
+from ..models import db, Application
+from ..services import delete_duplicates
+
+applications_cli = AppGroup('applications', help='지원 내역 관리 명령')
+
+
+@applications_cli.command('dedupe')
+def dedupe_command():
+    """
+    같은 사용자/공고의 중복 지원 내역 정리 (uq_applications_user_job 유니크 제약 마이그레이션 전에 실행)
+    """
+    deleted = delete_duplicates(Application, Application.apply_id, [Application.user_id, Application.job_post_id])
+    db.session.commit()
+    click.echo(f"중복 지원 내역 {deleted}건 삭제")
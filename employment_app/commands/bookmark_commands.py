@@ -0,0 +1,16 @@
+import click
+from flask.cli import AppGroup
+from ..models import db, Bookmark
+from ..services import delete_duplicates
+
+bookmarks_cli = AppGroup('bookmarks', help='북마크 관리 명령')
+
+
+@bookmarks_cli.command('dedupe')
+def dedupe_command():
+    """
+    같은 사용자/공고의 중복 북마크 정리 (uq_bookmarks_user_job 유니크 제약 마이그레이션 전에 실행)
+    """
+    deleted = delete_duplicates(Bookmark, Bookmark.bookmark_id, [Bookmark.user_id, Bookmark.job_post_id])
+    db.session.commit()
+    click.echo(f"중복 북마크 {deleted}건 삭제")
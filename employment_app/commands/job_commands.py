@@ -0,0 +1,33 @@
+import click
+from flask.cli import AppGroup
+from ..services import refresh_job_facets, invalidate_job_cache, flush_engagement, rebuild_engagement
+
+jobs_cli = AppGroup('jobs', help='채용 공고 관리 명령')
+
+
+@jobs_cli.command('refresh-facets')
+def refresh_facets_command():
+    """
+    전체 공고 집계 테이블(job_facet_counts) 재계산 및 공고 목록 캐시 무효화
+    """
+    refresh_job_facets()
+    invalidate_job_cache()
+    click.echo("공고 집계 재계산 완료")
+
+
+@jobs_cli.command('flush-engagement')
+def flush_engagement_command():
+    """
+    Redis의 공고별 지원자/북마크/문의 수 중 바뀐 값을 job_engagement_counts 테이블에 저장 (크론으로 주기 실행)
+    """
+    count = flush_engagement()
+    click.echo(f"공고 참여 카운터 저장 완료 ({count}개 공고)")
+
+
+@jobs_cli.command('rebuild-engagement')
+def rebuild_engagement_command():
+    """
+    지원/북마크/문의 테이블로 공고별 카운터 재계산 및 Redis 카운터 초기화
+    """
+    count = rebuild_engagement()
+    click.echo(f"공고 참여 카운터 재계산 완료 ({count}개 공고)")
@@ -0,0 +1,14 @@
+import click
+from flask.cli import AppGroup
+from ..services import rebuild_company_ratings
+
+reviews_cli = AppGroup('reviews', help='리뷰 관리 명령')
+
+
+@reviews_cli.command('rebuild-ratings')
+def rebuild_ratings_command():
+    """
+    reviews 테이블로 회사 평점 집계(company_ratings) 재계산 및 Redis 사본 초기화
+    """
+    count = rebuild_company_ratings()
+    click.echo(f"회사 평점 집계 재계산 완료 ({count}개 회사)")
@@ -0,0 +1,71 @@
+import click
+from flask.cli import AppGroup
+from sqlalchemy import select, delete, literal
+from ..models import db, Skill, JobPostingSkill
+from ..services import dialect_insert, skill_matcher, skill_registry, SKILL_STOPWORDS
+
+skills_cli = AppGroup('skills', help='기술(skills) 테이블 관리 명령')
+
+
+def _move_postings(source, target):
+    """
+    source 기술에 연결된 공고를 target 기술로 옮기고 source 연결 삭제 (이미 연결된 공고는 건너뜀)
+    """
+    postings = select(JobPostingSkill.job_post_id, literal(target.skill_id)).where(
+        JobPostingSkill.skill_id == source.skill_id
+    )
+    db.session.execute(
+        dialect_insert(JobPostingSkill)
+        .from_select(['job_post_id', 'skill_id'], postings)
+        .on_conflict_do_nothing(index_elements=['job_post_id', 'skill_id'])
+    )
+    db.session.execute(delete(JobPostingSkill).where(JobPostingSkill.skill_id == source.skill_id))
+
+
+@skills_cli.command('normalize')
+@click.option('--dry-run', is_flag=True, help='변경 내용만 출력하고 DB는 수정하지 않음')
+def normalize_skills_command(dry_run):
+    """
+    별칭으로 저장된 기술을 표준 기술명으로 병합 (예: 파이썬 -> Python, '외' 삭제)
+    """
+    skills = Skill.query.order_by(Skill.skill_id).all()
+    by_name = {skill.name: skill for skill in skills}
+    renamed = merged = removed = 0
+
+    for skill in skills:
+        if skill.name in SKILL_STOPWORDS:
+            click.echo(f"삭제: {skill.name}")
+            if not dry_run:
+                db.session.execute(delete(JobPostingSkill).where(JobPostingSkill.skill_id == skill.skill_id))
+                db.session.delete(skill)
+            removed += 1
+            continue
+
+        canonical = skill_matcher.canonical(skill.name)
+        if not canonical or canonical == skill.name:
+            continue
+
+        target = by_name.get(canonical)
+        if target is None:
+            # 표준 기술명이 아직 없으면 이름만 변경
+            click.echo(f"이름 변경: {skill.name} -> {canonical}")
+            by_name[canonical] = skill
+            if not dry_run:
+                skill.name = canonical
+                db.session.flush()
+            renamed += 1
+        else:
+            click.echo(f"병합: {skill.name} -> {canonical}")
+            if not dry_run:
+                _move_postings(skill, target)
+                db.session.delete(skill)
+            merged += 1
+
+    if dry_run:
+        db.session.rollback()
+    else:
+        db.session.commit()
+        # 모든 프로세스의 기술명 캐시 무효화
+        skill_registry.invalidate()
+
+    click.echo(f"이름 변경 {renamed}건, 병합 {merged}건, 삭제 {removed}건" + (" (dry-run)" if dry_run else ""))
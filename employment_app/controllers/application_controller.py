@@ -1,12 +1,12 @@
 from flask.views import MethodView
 from flask_smorest import Blueprint as SmorestBlueprint
-from datetime import datetime
 from flask import current_app
+from sqlalchemy import update
 from sqlalchemy.orm import joinedload
-from ..models import db, Application, JobPosting, User
-from ..schemas import ApplicationSchema, ApplicationListSchema, SuccessResponseSchema, ErrorResponseSchema
-from ..error_log import success_response, AuthenticationError, ValidationError
-from ..services import apply_sorting
+from ..models import db, Application, JobPosting
+from ..schemas import ApplicationSchema, ApplicationListSchema, ApplicationBatchSchema, SuccessResponseSchema, ErrorResponseSchema
+from ..error_log import success_response, AuthenticationError, ValidationError, query_budget
+from ..services import apply_sorting, current_user, apply_to_job, apply_to_jobs, invalidate_dashboard, record_engagement, bookmarked_job_ids
 from flask_jwt_extended import jwt_required, get_jwt_identity
 
 applications_ns = SmorestBlueprint('Applications', 'Applications', url_prefix='/applications', description="공고 지원 관련 API")
@@ -23,37 +23,30 @@ class ApplicationStatus(MethodView):
         지원하기
         """
         identity = get_jwt_identity()
-        user = User.query.filter_by(email=identity).first()
+        user = current_user()
 
         if not user:
-            current_app.logger.error(f"User not found for email: {identity} at {datetime.now()}")
+            current_app.logger.error(f"User not found for email: {identity}")
             raise AuthenticationError("사용자 인증 실패")
 
         job_post_id = request.get("job_post_id")
-        
-        # 중복 지원 체크
-        existing_application = Application.query.filter_by(user_id=user.user_id, job_post_id=job_post_id).first()
-        if existing_application:
+
+        # 지원 정보 저장 (중복 지원은 (user_id, job_post_id) 유니크 제약으로 제외, 회사 ID는 같은 구문에서 조회)
+        application_data = apply_to_job(user.user_id, job_post_id, resume_url=request.get("resume_url"))
+        db.session.commit()
+        if application_data:
+            invalidate_dashboard(user.user_id)
+            record_engagement([job_post_id], 'applications', 1)
+
+        if not application_data:
+            if db.session.query(JobPosting.job_post_id).filter_by(job_post_id=job_post_id).first() is None:
+                current_app.logger.error(f"Job posting not found: {job_post_id}")
+                raise ValidationError("존재하지 않는 채용 공고입니다.")
             current_app.logger.error("already applied position")
             raise ValidationError("이미 지원한 직무입니다.")
-        
-        job_post = JobPosting.query.get(job_post_id)
-        
-        # 지원 정보 저장
-        application = Application(
-            user_id=user.user_id,
-            job_post_id=job_post_id,
-            company_id=job_post.company_id,
-            status="submitted",  # 기본 상태
-            resume_url=request.get("resume_url")  # 이력서 첨부 (선택)
-        )
-        db.session.add(application)
-        db.session.commit()
-
-        application_data = application.to_dict()
 
         # 로그 기록
-        current_app.logger.info(f"User {user.name} applied for job posting {job_post_id} at {datetime.now()}")
+        current_app.logger.info(f"User {user.name} applied for job posting {job_post_id}")
         
         return success_response({"apply_id": application_data}), 201
 
@@ -62,22 +55,26 @@ class ApplicationStatus(MethodView):
     @applications_ns.arguments(ApplicationSchema, location="query")
     @applications_ns.response(200, SuccessResponseSchema)
     @applications_ns.response(404, ErrorResponseSchema)
+    @query_budget(3)
     def get(self, request):
         """
         지원 내역 조회
         """
         identity = get_jwt_identity()
-        user = User.query.filter_by(email=identity).first()
+        user = current_user()
 
         if not user:
-            current_app.logger.error(f"User not found for email: {identity} at {datetime.now()}")
+            current_app.logger.error(f"User not found for email: {identity}")
             raise AuthenticationError("사용자 인증 실패")
 
         status = request.get("status", None)
         page = request.get('page', 1)
         sort_order = request.get('sort', 'desc')
         
-        query = Application.query.filter_by(user_id=user.user_id)
+        # 공고와 회사 정보를 한 번에 조회 (항목별 지연 로딩 방지)
+        query = Application.query.filter_by(user_id=user.user_id).options(
+            joinedload(Application.job_posting).joinedload(JobPosting.company)
+        )
         
         if status:
             query = query.filter_by(status=status)
@@ -105,6 +102,44 @@ class ApplicationStatus(MethodView):
         
         return success_response({"applications": applications_data}, pagination), 200
 
+@applications_ns.route("/batch")
+class ApplicationBatch(MethodView):
+    @jwt_required()
+    @applications_ns.doc(security=[{"accesskey": []}])
+    @applications_ns.arguments(ApplicationBatchSchema)
+    @applications_ns.response(201, SuccessResponseSchema)
+    @applications_ns.response(400, ErrorResponseSchema)
+    def post(self, request):
+        """
+        여러 공고에 한 번에 지원 (공고 id 목록 또는 북마크한 공고 전체, 하나의 트랜잭션)
+        """
+        identity = get_jwt_identity()
+        user = current_user()
+
+        if not user:
+            current_app.logger.error(f"User not found for email: {identity}")
+            raise AuthenticationError("사용자 인증 실패")
+
+        job_post_ids = list(dict.fromkeys(request.get("job_post_ids") or []))
+        from_bookmarks = request.get("from_bookmarks")
+        if not job_post_ids and not from_bookmarks:
+            raise ValidationError("job_post_ids 또는 from_bookmarks가 필요합니다.")
+
+        applied = apply_to_jobs(user.user_id, job_post_ids, from_bookmarks=from_bookmarks, resume_url=request.get("resume_url"))
+        db.session.commit()
+        applied_ids = {application['job_posting']['job_post_id'] for application in applied}
+        invalidate_dashboard(user.user_id)
+        record_engagement(list(applied_ids), 'applications', 1)
+
+        # 이미 지원했거나 존재하지 않아 제외된 공고 (북마크 전체 지원이면 북마크한 공고 기준)
+        if from_bookmarks:
+            job_post_ids = sorted(bookmarked_job_ids(user.user_id))
+        skipped = [job_post_id for job_post_id in job_post_ids if job_post_id not in applied_ids]
+
+        current_app.logger.info(f"User {user.name} applied for {len(applied)} job postings")
+
+        return success_response({"applications": applied, "skipped": skipped}), 201
+
 @applications_ns.route("/<int:apply_id>")
 class ApplicationCancel(MethodView):
     @jwt_required()
@@ -116,10 +151,10 @@ class ApplicationCancel(MethodView):
         지원 취소
         """
         identity = get_jwt_identity()
-        user = User.query.filter_by(email=identity).first()  # 이메일로 User 찾기
+        user = current_user()
         
         if not user:
-            current_app.logger.error(f"User not found for email: {identity} at {datetime.now()}")
+            current_app.logger.error(f"User not found for email: {identity}")
             raise AuthenticationError("사용자 인증 실패")
         
         application = Application.query.get(apply_id)
@@ -132,11 +167,20 @@ class ApplicationCancel(MethodView):
             current_app.logger.error("You can cancelled only in 'submitted' status")
             raise ValidationError("지원 취소는 'submitted' 상태에서만 가능합니다.")
         
-        # 상태 업데이트 (취소 상태로 변경)
-        application.status = "cancelled"
+        # 상태 업데이트 (취소 상태로 변경, 'submitted'인 경우에만 바뀌므로 동시에 들어온 취소 요청은 한 번만 반영)
+        result = db.session.execute(
+            update(Application)
+            .where(Application.apply_id == apply_id, Application.status == "submitted")
+            .values(status="cancelled")
+        )
         db.session.commit()
+        if result.rowcount != 1:
+            current_app.logger.error("You can cancelled only in 'submitted' status")
+            raise ValidationError("지원 취소는 'submitted' 상태에서만 가능합니다.")
+        invalidate_dashboard(application.user_id)
+        record_engagement([application.job_post_id], 'applications', -1)
 
-        current_app.logger.info(f"Application {apply_id} cancelled by user {application.user_id} at {datetime.now()}")
+        current_app.logger.info(f"Application {apply_id} cancelled by user {application.user_id}")
 
         return success_response({"message": "지원이 취소되었습니다."}), 200
 
@@ -1,13 +1,13 @@
 from flask import current_app
 from flask_smorest import Blueprint as SmorestBlueprint
 from flask.views import MethodView
-from ..models import db, User, Token
+from ..models import db, User, Review
 from ..schemas import RegisterSchema, LoginSchema, ProfileSchema, SuccessResponseSchema, ErrorResponseSchema
-from ..extensions import bcrypt, KST
-from ..error_log import success_response, AuthenticationError, ValidationError
-from ..services import is_valid_email, is_strong_password
+from ..extensions import KST
+from ..error_log import success_response, AuthenticationError, ValidationError, query_budget
+from ..services import is_valid_email, is_strong_password, current_user, current_user_model, identity_claims, cache_user, invalidate_user_cache, password_hasher, token_store, rate_limit, apply_review_rating, invalidate_company_rating, invalidate_bookmark_set, get_dashboard, invalidate_dashboard, user_engagement, record_engagement
 from datetime import datetime, timedelta
-from flask_jwt_extended import create_access_token, create_refresh_token, jwt_required, get_jwt_identity
+from flask_jwt_extended import create_access_token, create_refresh_token, jwt_required, get_jwt_identity, get_jwt
 
 auth_ns = SmorestBlueprint("Auth", "Auth", url_prefix="/auth", description="인증 관련 API")
 
@@ -19,6 +19,7 @@ class Register(MethodView):
     @auth_ns.response(400, ErrorResponseSchema)
     @auth_ns.response(400, ErrorResponseSchema)
     @auth_ns.response(400, ErrorResponseSchema)
+    @rate_limit('register')
     def post(self, request):
         """
         회원가입 엔드포인트
@@ -30,26 +31,26 @@ class Register(MethodView):
 
         # 이메일 형식 검증
         if not is_valid_email(email):
-            current_app.logger.error(f"Invalid email format: {email} at {datetime.now()}")
+            current_app.logger.error(f"Invalid email format: {email}")
             raise ValidationError("올바른 이메일 형식이 아닙니다.")
 
          # 비밀번호 검증
         if not is_strong_password(password):
-            current_app.logger.error(f"Weak password for email: {email} at {datetime.now()}")
+            current_app.logger.error(f"Weak password for email: {email}")
             raise ValidationError("비밀번호는 8자리 이상이어야 하며, 최소 한개의 대/소문자를 포함해야하고, 숫자 및 특수기호가 포함되어야 합니다.")
 
         # 이메일 중복 확인
         if User.query.filter_by(email=email).first():
-            current_app.logger.error(f"Email already exists: {email} at {datetime.now()}")
+            current_app.logger.error(f"Email already exists: {email}")
             raise ValidationError("이미 존재하는 이메일입니다.")
 
         # 비밀번호 해싱 후 사용자 저장
-        hashed_password = bcrypt.generate_password_hash(password).decode("utf-8")
+        hashed_password = password_hasher.hash(password)
         new_user = User(name=username, email=email, password=hashed_password)
         db.session.add(new_user)
         db.session.commit()
 
-        current_app.logger.info(f"User registered successfully: {username} ({email}) at {datetime.now()}")
+        current_app.logger.info(f"User registered successfully: {username} ({email})")
         return success_response({
             "user_id": new_user.user_id,
             "name": new_user.name,
@@ -62,6 +63,7 @@ class Login(MethodView):
     @auth_ns.arguments(LoginSchema)
     @auth_ns.response(200, SuccessResponseSchema)
     @auth_ns.response(401, ErrorResponseSchema)
+    @rate_limit('login', scopes=('ip', 'identity'))
     def post(self, request):
         """
         로그인 엔드포인트
@@ -71,32 +73,24 @@ class Login(MethodView):
         password = data.get("password")
 
         user = User.query.filter_by(email=email).first()
-        if not user or not bcrypt.check_password_hash(user.password, password):
-            current_app.logger.error(f"Failed login attempt for email: {email} at {datetime.now()}")
+        if not user or not password_hasher.check(user.password, password):
+            current_app.logger.error(f"Failed login attempt for email: {email}")
             raise AuthenticationError("아이디(이메일) 및 비밀번호가 일치하지 않습니다.")
 
-        access_token = create_access_token(identity=str(user.email))
-        refresh_token = create_refresh_token(identity=str(user.email))
-
-        # 토큰 만료 시간 설정
-        access_expires_at = datetime.now(KST) + timedelta(minutes=60)
-        refresh_expires_at = datetime.now(KST) + timedelta(days=7)
-
-        # DB에서 기존 토큰 갱신 또는 새로 생성
-        token = Token.query.filter_by(user_id=user.user_id).first()
-        if token:
-            token.access_token = access_token
-            token.refresh_token = refresh_token
-            token.access_expires_at = access_expires_at
-            token.refresh_expires_at = refresh_expires_at
-        else:
-            new_token = Token(user_id=user.user_id, access_token=access_token, refresh_token=refresh_token,
-                            access_expires_at=access_expires_at, refresh_expires_at=refresh_expires_at)
-            db.session.add(new_token)
+        # 해싱 비용(BCRYPT_LOG_ROUNDS)이 바뀌었으면 새 비용으로 재해싱
+        if password_hasher.needs_rehash(user.password):
+            user.password = password_hasher.hash(password)
+            db.session.commit()
 
-        db.session.commit()
+        # user_id를 클레임에 포함 (인증된 요청에서 users 테이블 조회 생략)
+        access_token = create_access_token(identity=str(user.email), additional_claims=identity_claims(user))
+        refresh_token = create_refresh_token(identity=str(user.email), additional_claims=identity_claims(user))
+
+        # 토큰 세션 저장 (Redis, 만료 시간은 토큰 만료와 동일)
+        token_store.save_session(user.user_id, access_token, refresh_token)
+        cache_user(user)
 
-        current_app.logger.info(f"User {user.name} signed in successfully at {datetime.now()}")
+        current_app.logger.info(f"User {user.name} signed in successfully")
         return success_response({"user_id": user.user_id, "access_token": access_token, "refresh_token": refresh_token}), 200
 
 
@@ -108,29 +102,51 @@ class RefreshToken(MethodView):
     @auth_ns.doc(security=[{"refreshkey": []}])
     @auth_ns.response(200, SuccessResponseSchema)
     @auth_ns.response(401, ErrorResponseSchema)
+    @rate_limit('refresh', scopes=('ip', 'identity'))
     def post(self):
         """
         엑세스토큰 재발급 엔드포인트
         """
         identity = get_jwt_identity()
-        user = User.query.filter_by(email=identity).first()  # 이메일로 User 찾기
+        user = current_user()
         
         if not user:
-            current_app.logger.error(f"User not found for email: {identity} at {datetime.now()}")
+            current_app.logger.error(f"User not found for email: {identity}")
             raise AuthenticationError("사용자 인증 실패")
         
-        new_access_token = create_access_token(identity=identity, expires_delta=timedelta(minutes=60))
+        new_access_token = create_access_token(identity=identity, additional_claims=identity_claims(user), expires_delta=timedelta(minutes=60))
 
-        # DB에서 기존 토큰 갱신
-        token = Token.query.filter_by(user_id=user.user_id).first()
-        if token:
-            token.access_token = new_access_token
-            token.access_expires_at = datetime.now(KST) + timedelta(minutes=60)
-            db.session.commit()
+        # 토큰 세션 갱신
+        token_store.save_session(user.user_id, new_access_token)
 
-        current_app.logger.info(f"Access token refreshed for user {identity} at {datetime.now()}")
+        current_app.logger.info(f"Access token refreshed for user {identity}")
         return success_response({"user_id": user.user_id, "access_token": new_access_token}), 200
 
+# 로그아웃
+@auth_ns.route("/logout")
+class Logout(MethodView):
+    @jwt_required()
+    @auth_ns.doc(security=[{"accesskey": []}])
+    @auth_ns.response(200, SuccessResponseSchema)
+    @auth_ns.response(401, ErrorResponseSchema)
+    def post(self):
+        """
+        로그아웃 엔드포인트 (현재 access 토큰과 마지막 refresh 토큰 폐기)
+        """
+        identity = get_jwt_identity()
+        user = current_user()
+
+        if not user:
+            current_app.logger.error(f"User not found for email: {identity}")
+            raise AuthenticationError("사용자 인증 실패")
+
+        claims = get_jwt()
+        token_store.revoke(claims['jti'], claims['exp'])
+        token_store.revoke_session(user.user_id)
+
+        current_app.logger.info(f"User {identity} signed out")
+        return success_response({"message": "로그아웃 되었습니다."}), 200
+
 # 회원 정보 조회 및 삭제
 @auth_ns.route("/user")
 class UserInfo(MethodView):
@@ -143,13 +159,13 @@ class UserInfo(MethodView):
         유저 정보 조회 엔드포인트
         """
         identity = get_jwt_identity()
-        user = User.query.filter_by(email=identity).first()
+        user = current_user()
 
         if not user:
-            current_app.logger.error(f"User not found for id: {identity} at {datetime.now()}")
+            current_app.logger.error(f"User not found for id: {identity}")
             raise AuthenticationError("사용자 인증 실패")
 
-        current_app.logger.info(f"User {user.name} information retrieved successfully at {datetime.now()}")
+        current_app.logger.info(f"User {user.name} information retrieved successfully")
         return success_response({"user_id": user.user_id, "username": user.name, "email": user.email, "created_at": user.created_at.strftime("%Y-%m-%d %H:%M:%S")}), 200
     
     @jwt_required()
@@ -161,20 +177,59 @@ class UserInfo(MethodView):
         유저 삭제 엔드포인트
         """
         identity = get_jwt_identity()
-        user = User.query.filter_by(email=identity).first()
+        user = current_user_model()
 
         if not user:
-            current_app.logger.error(f"User not found for id: {identity} at {datetime.now()}")
+            current_app.logger.error(f"User not found for id: {identity}")
             raise AuthenticationError("사용자 인증 실패")
 
         # 사용자 삭제 (Token은 cascade 옵션으로 자동 삭제됨)
         email = user.email
+        user_id = user.user_id
+
+        # 탈퇴 회원의 리뷰를 회사 평점 집계에서 제외 (리뷰는 cascade 옵션으로 함께 삭제됨)
+        company_ids = set()
+        for review in Review.query.filter_by(user_id=user_id):
+            apply_review_rating(review.company_id, review.rating, -1)
+            company_ids.add(review.company_id)
+        # 탈퇴 회원의 지원/북마크/문의를 공고별 카운터에서 제외
+        engagement = user_engagement(user_id)
+
         db.session.delete(user)
         db.session.commit()
+        invalidate_user_cache(user_id)
+        invalidate_bookmark_set(user_id)
+        invalidate_dashboard(user_id)
+        for company_id in company_ids:
+            invalidate_company_rating(company_id)
+        for field, job_post_ids in engagement.items():
+            record_engagement(job_post_ids, field, -1)
+        token_store.revoke_session(user_id)
 
-        current_app.logger.info(f"User {identity} deleted successfully at {datetime.now()}")
+        current_app.logger.info(f"User {identity} deleted successfully")
         return success_response({"message": f"User({email}) deleted successfully"}), 200
     
+# 마이페이지 (프로필, 지원 상태별 개수, 최근 북마크/지원/문의)
+@auth_ns.route("/dashboard")
+class Dashboard(MethodView):
+    @jwt_required()
+    @auth_ns.doc(security=[{"accesskey": []}])
+    @auth_ns.response(200, SuccessResponseSchema)
+    @auth_ns.response(401, ErrorResponseSchema)
+    @query_budget(7)
+    def get(self):
+        """
+        마이페이지 조회 엔드포인트 (사용자별 Redis 캐시)
+        """
+        identity = get_jwt_identity()
+        user = current_user()
+
+        if not user:
+            current_app.logger.error(f"User not found for id: {identity}")
+            raise AuthenticationError("사용자 인증 실패")
+
+        return success_response(get_dashboard(user)), 200
+
     # 회원 정보 수정
 @auth_ns.route("/profile")
 class UpdateProfile(MethodView):
@@ -189,23 +244,25 @@ class UpdateProfile(MethodView):
         유저 정보 수정 엔드포인트
         """
         identity = get_jwt_identity()
-        user = User.query.filter_by(email=identity).first()
+        user = current_user_model()
 
         if not user:
-            current_app.logger.error(f"User not found for id: {identity} at {datetime.now()}")
+            current_app.logger.error(f"User not found for id: {identity}")
             raise AuthenticationError("사용자 인증 실패")
 
         data = request
         if "password" in data:
             if not is_strong_password(data["password"]):
-                current_app.logger.error(f"Weak password for email: {user.email} at {datetime.now()}")
+                current_app.logger.error(f"Weak password for email: {user.email}")
                 raise ValidationError("비밀번호는 8자리 이상이어야 하며, 최소 한개의 대/소문자를 포함해야하고, 숫자 및 특수기호가 포함되어야 합니다.")
-            user.password = bcrypt.generate_password_hash(data["password"]).decode("utf-8")
+            user.password = password_hasher.hash(data["password"])
         if "name" in data:
             user.name = data["name"]
         db.session.commit()
+        invalidate_user_cache(user.user_id)
+        invalidate_dashboard(user.user_id)
 
-        current_app.logger.info(f"User {identity} profile updated successfully at {datetime.now()}")
+        current_app.logger.info(f"User {identity} profile updated successfully")
         return success_response({
             "user_id": user.user_id,
             "name": user.name,
@@ -2,11 +2,12 @@ from flask import current_app
 from flask_jwt_extended import jwt_required, get_jwt_identity
 from flask_smorest import Blueprint as SmorestBlueprint
 from flask_restx import Resource
-from ..models import db, User, Bookmark
+from ..models import db, Bookmark, JobPosting
 from ..schemas import BookmarkSchema, BookmarkListSchema, SuccessResponseSchema, ErrorResponseSchema
-from ..error_log import success_response, AuthenticationError, ValidationError
+from ..error_log import success_response, AuthenticationError, ValidationError, query_budget
+from ..services import current_user, toggle_bookmark, mirror_bookmark, invalidate_dashboard, record_engagement
 from sqlalchemy.exc import IntegrityError
-from datetime import datetime
+from sqlalchemy.orm import joinedload
 
 bookmark_ns = SmorestBlueprint('Bookmarks', 'Bookmarks', url_prefix='/bookmarks', description="북마크 관련 API")
 
@@ -22,10 +23,10 @@ class BookmarkToggleAPI(Resource):
         북마크 추가/제거
         """
         identity = get_jwt_identity()
-        user = User.query.filter_by(email=identity).first()
+        user = current_user()
 
         if not user:
-            current_app.logger.error(f"User not found for email: {identity} at {datetime.now()}")
+            current_app.logger.error(f"User not found for email: {identity}")
             raise AuthenticationError("사용자 인증 실패")
 
         data = request
@@ -35,26 +36,24 @@ class BookmarkToggleAPI(Resource):
             current_app.logger.error("Job posting ID is required.")
             raise ValidationError("채용 공고 ID가 필요합니다.")
 
-        bookmark = Bookmark.query.filter_by(user_id=user.user_id, job_post_id=job_post_id).first()
-
-        if bookmark:
-            bookmark_data = bookmark.to_dict()
-            # 북마크 제거
-            db.session.delete(bookmark)
+        # 북마크 제거 또는 추가 (user_id, job_post_id 유니크 제약 기반 원자적 토글)
+        try:
+            added, bookmark_data = toggle_bookmark(user.user_id, job_post_id)
             db.session.commit()
+        except IntegrityError:
+            db.session.rollback()
+            current_app.logger.error(f"Bookmark toggle failed - job_post_id: {job_post_id}")
+            raise ValidationError("존재하지 않는 채용 공고입니다.")
+
+        # 동시 요청이 먼저 추가해 바뀐 것이 없으면(None) 카운터를 다시 올리지 않음 (그 사이 다시 제거된 경우 bookmark_data도 None)
+        if added is not None:
+            mirror_bookmark(user.user_id, job_post_id, added)
+            record_engagement([job_post_id], 'bookmarks', 1 if added else -1)
+            invalidate_dashboard(user.user_id)
+
+        if added is False:
             return success_response({"message": "북마크가 제거되었습니다.", "bookmarks": bookmark_data}), 200
-        else:
-            # 북마크 추가
-            new_bookmark = Bookmark(user_id=user.user_id, job_post_id=job_post_id)
-            try:
-                db.session.add(new_bookmark)
-                db.session.commit()
-                
-                # Bookmark를 직렬화하여 반환
-                return success_response({"message": "북마크가 추가되었습니다.", "bookmarks": new_bookmark.to_dict()}), 201
-            except IntegrityError:
-                db.session.rollback()
-                raise ValidationError("중복된 북마크 요청입니다.")
+        return success_response({"message": "북마크가 추가되었습니다.", "bookmarks": bookmark_data}), 201
             
 @bookmark_ns.route('')
 class BookmarkListAPI(Resource):
@@ -63,12 +62,13 @@ class BookmarkListAPI(Resource):
     @bookmark_ns.arguments(BookmarkListSchema, location="query")
     @bookmark_ns.response(200, SuccessResponseSchema)
     @bookmark_ns.response(404, ErrorResponseSchema)
+    @query_budget(3)
     def get(self, args):
         """
         북마크 목록 조회
         """
         identity = get_jwt_identity()
-        user = User.query.filter_by(email=identity).first()
+        user = current_user()
 
         if not user:
             raise AuthenticationError("사용자 인증 실패")
@@ -77,7 +77,10 @@ class BookmarkListAPI(Resource):
         per_page = 20
         sort_order = args.get('sort', 'desc')  # 'asc' 또는 'desc'
 
-        query = Bookmark.query.filter_by(user_id=user.user_id)
+        # 공고와 회사 정보를 한 번에 조회 (항목별 지연 로딩 방지)
+        query = Bookmark.query.filter_by(user_id=user.user_id).options(
+            joinedload(Bookmark.job_posting).joinedload(JobPosting.company)
+        )
 
         # 최신순 또는 오래된 순으로 정렬
         if sort_order.lower() == 'asc':
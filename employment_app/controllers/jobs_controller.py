@@ -2,14 +2,23 @@ from flask import current_app, json
 from flask_jwt_extended import jwt_required
 from flask_smorest import Blueprint as SmorestBlueprint
 from flask.views import MethodView
-from ..models import db, JobPosting, Company, Skill, JobPostingSkill
-from ..schemas import JobPostSchema, JobPostUpdateSchema, JobPostDelSchema, JobSearchfilterSchema, JobSearchSchema, JobFilterSchema, JobSortSchema, SuccessResponseSchema, ErrorResponseSchema
+from ..models import db, JobPosting, Company, Skill, JobPostingSkill, JobEngagement
+from ..schemas import JobPostSchema, JobPostUpdateSchema, JobPostDelSchema, JobSearchfilterSchema, JobSearchSchema, JobFilterSchema, JobSortSchema, JobFacetSchema, JobDetailSchema, SuccessResponseSchema, ErrorResponseSchema
 from ..error_log import ValidationError, success_response
-from ..services import update_skills_table, save_job_posting_skills, add_skills_to_jobs, apply_filters, apply_sorting
+from ..services import update_skills_table, save_job_posting_skills, add_skills_to_jobs, apply_filters, apply_sorting, normalize_skills, job_cache_key, get_job_cache, set_job_cache, invalidate_job_cache, compute_job_facets, load_materialized_facets, refresh_job_facets, get_company_ratings, mark_bookmarked, attach_engagement, forget_engagement
 from datetime import datetime
 
 job_ns = SmorestBlueprint("Jobs", "Jobs", url_prefix="/jobs", description="채용 공고 관련 API")
 
+def annotate_jobs(jobs, args):
+    """
+    공유 캐시에서 꺼낸 공고 목록에 요청별 정보 추가 (북마크 여부, 선택 시 지원자/북마크/문의 수)
+    """
+    mark_bookmarked(jobs)
+    if args.get('include_engagement'):
+        attach_engagement(jobs)
+    return jobs
+
 # Job 리소스 엔드포인트
 @job_ns.route("")
 class JobList(MethodView):
@@ -26,13 +35,12 @@ class JobList(MethodView):
         limit = args.get('limit', 20)
 
         # Redis 캐시에서 데이터 조회
-        redis_client = current_app.redis_client
-        cache_key = f"job_list_{str(filters)}_{sort}_{page}_{limit}"
-        cached_data = redis_client.get(cache_key)
+        cache_key = job_cache_key("job_list", filters, sort, page, limit)
+        cached_data = get_job_cache(cache_key)
 
         if cached_data:
             cached_data = json.loads(cached_data)  # JSON 파싱
-            return success_response({"jobs": cached_data["jobs"]}, cached_data["pagination"]), 200
+            return success_response({"jobs": annotate_jobs(cached_data["jobs"], args)}, cached_data["pagination"]), 200
 
         query = apply_filters(JobPosting.query, filters)
         query = apply_sorting(query, sort)
@@ -50,9 +58,9 @@ class JobList(MethodView):
             "jobs": jobs_with_skills,
             "pagination": pagination
         }
-        redis_client.set(cache_key, json.dumps(cache_value))  # 캐시 만료 시간 1시간 설정
+        set_job_cache(cache_key, cache_value)  # 캐시 만료 시간 JOB_CACHE_TTL (기본 1시간)
 
-        return success_response({"jobs": jobs_with_skills}, pagination), 200
+        return success_response({"jobs": annotate_jobs(jobs_with_skills, args)}, pagination), 200
 
     @jwt_required()
     @job_ns.doc(security=[{"accesskey": []}])
@@ -117,10 +125,14 @@ class JobList(MethodView):
 
          # 스킬 추가
         if 'skills' in data:
-            skills = [skill.strip() for skill in data['skills'].split(',')]
+            skills = normalize_skills(data['skills'].split(','), split_unmatched=False)
             update_skills_table([skills])
             save_job_posting_skills(new_job.job_post_id, [skills])
 
+        # 전체 공고 집계 재계산 및 공고 목록 캐시 무효화
+        refresh_job_facets()
+        invalidate_job_cache()
+
         job_data = new_job.to_dict()
         job_data['skills'] = skills
 
@@ -190,7 +202,7 @@ class JobList(MethodView):
 
         # 스킬 업데이트
         if 'skills' in data:
-            skills = [skill.strip() for skill in data['skills'].split(',')]
+            skills = normalize_skills(data['skills'].split(','), split_unmatched=False)
             # 기존 JobPostingSkill 삭제
             JobPostingSkill.query.filter_by(job_post_id=job.job_post_id).delete()
             db.session.commit()
@@ -201,6 +213,10 @@ class JobList(MethodView):
 
         db.session.commit()
 
+        # 전체 공고 집계 재계산 및 공고 목록 캐시 무효화
+        refresh_job_facets()
+        invalidate_job_cache()
+
         # 업데이트된 공고 정보 반환
         updated_job = JobPosting.query.get(job.job_post_id)
         updated_job_data = updated_job.to_dict()
@@ -231,12 +247,18 @@ class JobList(MethodView):
             current_app.logger.warning(f"Cannot find job post with title '{data['select_post']}'")
             raise ValidationError("해당 채용 공고를 찾을 수 없습니다.")
 
-        # 관련된 JobPostingSkill 먼저 삭제
+        # 관련된 JobPostingSkill, 참여 카운터 먼저 삭제
         JobPostingSkill.query.filter_by(job_post_id=job.job_post_id).delete()
+        JobEngagement.query.filter_by(job_post_id=job.job_post_id).delete()
 
         # 공고 삭제
         db.session.delete(job)
         db.session.commit()
+        forget_engagement(job.job_post_id)
+
+        # 전체 공고 집계 재계산 및 공고 목록 캐시 무효화
+        refresh_job_facets()
+        invalidate_job_cache()
 
         return success_response({"message": f"Job({job.title}) deleted successfully"}), 200
 
@@ -260,13 +282,12 @@ class JobSearch(MethodView):
         limit = args.get('limit', 20)
 
         # Redis 캐시에서 데이터 조회
-        redis_client = current_app.redis_client
-        cache_key = f"job_search_{str(filters)}_{page}_{limit}"
-        cached_data = redis_client.get(cache_key)
+        cache_key = job_cache_key("job_search", filters, page, limit)
+        cached_data = get_job_cache(cache_key)
 
         if cached_data:
             cached_data = json.loads(cached_data)  # JSON 파싱
-            return success_response({"jobs": cached_data["jobs"]}, cached_data["pagination"]), 200
+            return success_response({"jobs": annotate_jobs(cached_data["jobs"], args)}, cached_data["pagination"]), 200
 
         query = apply_filters(JobPosting.query, filters)
         paginated_result = query.paginate(page=page, per_page=limit, error_out=False)
@@ -283,9 +304,9 @@ class JobSearch(MethodView):
             "jobs": jobs_with_skills,
             "pagination": pagination
         }
-        redis_client.set(cache_key, json.dumps(cache_value))  # 캐시 만료 시간 1시간 설정
+        set_job_cache(cache_key, cache_value)  # 캐시 만료 시간 JOB_CACHE_TTL (기본 1시간)
 
-        return success_response({"jobs": jobs_with_skills}, pagination), 200
+        return success_response({"jobs": annotate_jobs(jobs_with_skills, args)}, pagination), 200
 
 @job_ns.route("/filter")
 class JobFilter(MethodView):
@@ -302,13 +323,12 @@ class JobFilter(MethodView):
         limit = args.get('limit', 20)
 
         # Redis 캐시에서 데이터 조회
-        redis_client = current_app.redis_client
-        cache_key = f"job_filter_{str(filters)}_{sort}_{page}_{limit}"
-        cached_data = redis_client.get(cache_key)
+        cache_key = job_cache_key("job_filter", filters, sort, page, limit)
+        cached_data = get_job_cache(cache_key)
 
         if cached_data:
             cached_data = json.loads(cached_data)  # JSON 파싱
-            return success_response({"jobs": cached_data["jobs"]}, cached_data["pagination"]), 200
+            return success_response({"jobs": annotate_jobs(cached_data["jobs"], args)}, cached_data["pagination"]), 200
 
         query = apply_filters(JobPosting.query, filters)
         query = apply_sorting(query, sort)
@@ -326,9 +346,9 @@ class JobFilter(MethodView):
             "jobs": jobs_with_skills,
             "pagination": pagination
         }
-        redis_client.set(cache_key, json.dumps(cache_value))  # 캐시 만료 시간 1시간 설정
+        set_job_cache(cache_key, cache_value)  # 캐시 만료 시간 JOB_CACHE_TTL (기본 1시간)
 
-        return success_response({"jobs": jobs_with_skills}, pagination), 200
+        return success_response({"jobs": annotate_jobs(jobs_with_skills, args)}, pagination), 200
         
 @job_ns.route("/sort")
 class JobSort(MethodView):
@@ -353,13 +373,12 @@ class JobSort(MethodView):
         limit = args.get('limit', 20)
 
         # Redis 캐시에서 데이터 조회
-        redis_client = current_app.redis_client
-        cache_key = f"job_sort_{sort}_{page}_{limit}"
-        cached_data = redis_client.get(cache_key)
+        cache_key = job_cache_key("job_sort", sort, page, limit)
+        cached_data = get_job_cache(cache_key)
 
         if cached_data:
             cached_data = json.loads(cached_data)  # JSON 파싱
-            return success_response({"jobs": cached_data["jobs"]}, cached_data["pagination"]), 200
+            return success_response({"jobs": annotate_jobs(cached_data["jobs"], args)}, cached_data["pagination"]), 200
 
         query = apply_sorting(JobPosting.query, sort)
         paginated_result = query.paginate(page=page, per_page=limit, error_out=False)
@@ -376,15 +395,46 @@ class JobSort(MethodView):
             "jobs": jobs_with_skills,
             "pagination": pagination
         }
-        redis_client.set(cache_key, json.dumps(cache_value))  # 캐시 만료 시간 1시간 설정
+        set_job_cache(cache_key, cache_value)  # 캐시 만료 시간 JOB_CACHE_TTL (기본 1시간)
 
-        return success_response({"jobs": jobs_with_skills}, pagination), 200
+        return success_response({"jobs": annotate_jobs(jobs_with_skills, args)}, pagination), 200
+
+@job_ns.route("/facets")
+class JobFacets(MethodView):
+    @job_ns.arguments(JobFacetSchema, location='query')
+    @job_ns.response(200, SuccessResponseSchema)
+    @job_ns.response(400, ErrorResponseSchema)
+    def get(self, args):
+        """
+        기술/지역/트렌드 키워드별 공고 수 집계 (현재 필터 조건 기준)
+        """
+        filters = {key: args.get(key) for key in ['keyword', 'location', 'career_level', 'salary', 'status', 'trend_keywords', 'skills']}
+        limit = args.get('limit', 20)
+
+        # Redis 캐시에서 데이터 조회 (공고 목록과 같은 버전으로 무효화)
+        cache_key = job_cache_key("job_facets", filters, limit)
+        cached_data = get_job_cache(cache_key)
+
+        if cached_data:
+            return success_response({"facets": json.loads(cached_data)}), 200
+
+        # 필터가 없으면 크롤링 후 미리 집계해 둔 테이블 사용
+        facets = None
+        if not any(filters.values()):
+            facets = load_materialized_facets(limit)
+        if facets is None:
+            facets = compute_job_facets(filters, limit)
+
+        set_job_cache(cache_key, facets)
+
+        return success_response({"facets": facets}), 200
 
 @job_ns.route("/<int:id>")
 class JobDetail(MethodView):
+    @job_ns.arguments(JobDetailSchema, location='query')
     @job_ns.response(200, SuccessResponseSchema)
     @job_ns.response(404, ErrorResponseSchema)
-    def get(self, id):
+    def get(self, args, id):
         """
         단일 채용 공고 상세 조회
         """
@@ -410,4 +460,16 @@ class JobDetail(MethodView):
 
         recommended_jobs = add_skills_to_jobs(similar_jobs)
 
+        # 회사 평점 요약 포함 (선택)
+        if args.get('include_rating') and job_data['company']:
+            ratings = get_company_ratings([job.company_id])
+            job_data['company']['rating'] = ratings[job.company_id]
+            for recommended in recommended_jobs:
+                if recommended['company']:
+                    recommended['company']['rating'] = ratings[job.company_id]
+
+        # 지원자/북마크/문의 수 포함 (선택, 추천 공고까지 Redis 파이프라인 1회)
+        if args.get('include_engagement'):
+            attach_engagement([job_data] + recommended_jobs)
+
         return success_response({"job": job_data, "recommended_jobs": recommended_jobs}), 200
\ No newline at end of file
@@ -1,11 +1,10 @@
 from flask import current_app
 from flask_smorest import Blueprint as SmorestBlueprint
 from flask.views import MethodView
-from ..models import db, Company, JobPosting, Skill
+from ..models import db
 from ..schemas import JobCrawlSchema, CompanySchema, SkillSchema, SuccessResponseSchema, ErrorResponseSchema
-from ..services import crawl_job_posts, crawl_company_info, update_skills_table, save_job_posting_skills
+from ..services import crawl_job_posts, crawl_company_info, save_company_info, save_job_posts, run_crawl_pipeline, CrawlCheckpoint, skill_registry, invalidate_job_cache, refresh_job_facets, rate_limit
 from ..error_log import success_response, CustomError, ValidationError
-from datetime import datetime
 
 crawl_ns = SmorestBlueprint("Crawl", "Crawl", url_prefix="/crawl", description="크롤링 관련 API")
 
@@ -15,6 +14,7 @@ class update_skills_table(MethodView):
     @crawl_ns.response(200, SuccessResponseSchema)
     @crawl_ns.response(400, ErrorResponseSchema)
     @crawl_ns.response(500, ErrorResponseSchema)
+    @rate_limit('crawl')
     def post(self, request):
         """
         기술명을 추가하는 엔드포인트
@@ -23,24 +23,19 @@ class update_skills_table(MethodView):
         skill_name = data.get('skill')
 
         if not skill_name:
-            current_app.logger.warning(f"Skill name not provided at {datetime.now()}")
+            current_app.logger.warning("Skill name not provided")
             raise ValidationError("스킬 이름을 제공해주세요.")
 
         try:
-            skill = Skill.query.filter_by(name=skill_name).first()
-
-            if not skill:
-                skill = Skill(name=skill_name)
-                db.session.add(skill)
-            else:
-                skill.name = skill_name
+            # 없는 기술만 추가 (기술 캐시 갱신 포함)
+            skill_registry.get_ids([skill_name], create=True)
             db.session.commit()
 
-            return success_response({"message": "스킬 정보 업데이트 성공", "skill_name": skill.name}), 200
+            return success_response({"message": "스킬 정보 업데이트 성공", "skill_name": skill_name.strip()}), 200
 
         except Exception as e:
             db.session.rollback()
-            current_app.logger.error(f"Error updating skills at {datetime.now()}: {str(e)}")
+            current_app.logger.error(f"Error updating skills: {str(e)}")
             raise CustomError("기술 업데이트 실패", 500)
 
 @crawl_ns.route("/company_info")
@@ -48,6 +43,7 @@ class crawl_and_store_company_info(MethodView):
     @crawl_ns.arguments(CompanySchema)
     @crawl_ns.response(200, SuccessResponseSchema)
     @crawl_ns.response(400, ErrorResponseSchema)
+    @rate_limit('crawl')
     def post(self, request):
         """
         사람인 회사 정보를 크롤링하여 데이터베이스에 저장하는 엔드포인트
@@ -58,29 +54,14 @@ class crawl_and_store_company_info(MethodView):
         link = data.get('link')
 
         if not company_name or not link:
-            current_app.logger.warning(f"Company name or link missing in request at {datetime.now()}")
+            current_app.logger.warning("Company name or link missing in request")
             raise ValidationError("회사명과 링크는 필수입니다.")
 
         try:
-            company_data = crawl_company_info(company_name, link)
+            company_data = crawl_company_info(company_name, link, parser=current_app.config['CRAWL_PARSER'])
 
             # 데이터베이스에 저장
-            saved_companies = []
-            for company in company_data:
-                existing_company = Company.query.filter_by(name=company['회사명']).first()
-
-                if not existing_company:
-                    new_company = Company(
-                        name=company['회사명'],
-                        company_type=company.get('기업 형태', '정보 없음'),
-                        industry=company.get('업종', '정보 없음'),
-                        website=company.get('홈페이지', '정보 없음'),
-                        address=company.get('주소', '정보 없음'),
-                        introduce=company.get('기업 설명', '정보 없음')
-                    )
-                    db.session.add(new_company)
-                    saved_companies.append(new_company)
-                    db.session.commit()
+            saved_companies = save_company_info(company_data)
 
             return success_response({
                 "message": "회사 정보 크롤링 및 저장 완료",
@@ -89,7 +70,7 @@ class crawl_and_store_company_info(MethodView):
 
         except Exception as e:
             db.session.rollback()
-            current_app.logger.error(f"Error storing company info at {datetime.now()}: {str(e)}")
+            current_app.logger.error(f"Error storing company info: {str(e)}")
             raise CustomError("회사 정보 저장 실패", 500)
 
 @crawl_ns.route("/job_posts")
@@ -98,6 +79,7 @@ class get_job_posts(MethodView):
     @crawl_ns.response(200, SuccessResponseSchema)
     @crawl_ns.response(400, ErrorResponseSchema)
     @crawl_ns.response(500, ErrorResponseSchema)
+    @rate_limit('crawl')
     def post(self, request):
         """
         사람인 키워드별 채용 정보를 크롤링하여 데이터베이스에 저장하는 엔드포인트
@@ -106,70 +88,48 @@ class get_job_posts(MethodView):
         keyword = data.get('keyword', 'IT개발·데이터')
         pages = data.get('pages', 1)
 
-        try:
-            job_data = crawl_job_posts(keyword, pages)
+        # 증분 모드: 키워드별 체크포인트 이후의 새 공고만 크롤링
+        checkpoint = None
+        if data.get('incremental'):
+            checkpoint = CrawlCheckpoint(current_app.redis_client, keyword, ttl=current_app.config['CRAWL_CHECKPOINT_TTL'])
+        max_pages = data.get('max_pages') or current_app.config['CRAWL_MAX_PAGES']
 
-            # 데이터베이스에 저장
-            saved_jobs = []
-            for job in job_data:
-                # 1. Company 테이블에 회사 이름 확인
-                company = Company.query.filter_by(name=job['회사명']).first()
-                if not company:
-                    # 회사가 없으면 크롤링 API 호출하여 회사 정보 가져오기
-                    company_name = job['회사명']
-                    company_link = job['회사 정보']  # 회사 링크도 job 데이터에 있어야 합니다.
-
-                    company_data = crawl_company_info(company_name, company_link)
-
-                    if company_data:
-                        company_info = company_data[0]
-
-                        # 회사 정보 저장
-                        company = Company(
-                            name=company_info['회사명'],
-                            company_type=company_info.get('기업 형태', '정보 없음'),
-                            industry=company_info.get('업종', '정보 없음'),
-                            website=company_info.get('홈페이지', '정보 없음'),
-                            address=company_info.get('주소', '정보 없음'),
-                            introduce=company_info.get('기업 설명', '정보 없음')
-                        )
-                        db.session.add(company)
-                        db.session.commit()
-
-                # 2. JobPosting 중복 확인
-                existing_posting = JobPosting.query.filter_by(
-                    company_id=company.company_id,
-                    title=job['제목']
-                ).first()
-
-                if existing_posting:
-                    continue
-
-                # 3. JobPosting 테이블에 데이터 저장
-                posting = JobPosting(
-                    company_id=company.company_id,
-                    trend_keywords=job['트렌드_키워드'],
-                    title=job['제목'],
-                    link=job['공고 링크'],
-                    location=job['지역'],
-                    career_level=job['경력'],
-                    education=job['학력'],
-                    employment_type=job['고용형태'],
-                    deadline=job['마감일'],
-                    salary_range=job['연봉정보'],
-                    posted_date=job['작성날짜'],
-                    status=job['상태']
+        config = current_app.config
+
+        # 저장되지 않은 회사는 회사 정보 크롤링 후 저장
+        def fetch_company(company_name, company_link):
+            return crawl_company_info(company_name, company_link, parser=config['CRAWL_PARSER'])
+
+        try:
+            # 증분 모드는 새 공고가 있는 앞쪽 페이지만 받도록 항상 순차 크롤링 (파이프라인은 중단 페이지 뒤까지 미리 다운로드함)
+            if not checkpoint and pages >= config['CRAWL_PIPELINE_MIN_PAGES']:
+                # 대규모 크롤링: fetch(스레드) -> parse(프로세스 풀) -> persist 파이프라인
+                saved_jobs = []
+                run_crawl_pipeline(
+                    keyword, pages,
+                    lambda records: saved_jobs.extend(save_job_posts(records, fetch_company)),
+                    parser=config['CRAWL_PARSER'],
+                    fetch_workers=config['CRAWL_FETCH_WORKERS'],
+                    parse_workers=config['CRAWL_PARSE_WORKERS'] or None,
+                    queue_size=config['CRAWL_QUEUE_SIZE'],
+                    delay=1
                 )
-                db.session.add(posting)
+            else:
+                job_data = crawl_job_posts(keyword, pages, parser=config['CRAWL_PARSER'],
+                                           checkpoint=checkpoint, max_pages=max_pages)
 
-                # skills 테이블 업데이트
-                update_skills_table([job['직무분야']])
-                save_job_posting_skills(posting.job_post_id, [job['직무분야']])
+                # 데이터베이스에 저장
+                saved_jobs = save_job_posts(job_data, fetch_company)
 
-                posting.company_name = company.name
-                saved_jobs.append(posting)
+                # 저장이 끝난 공고를 체크포인트에 기록
+                if checkpoint:
+                    checkpoint.mark_seen(job_data)
+
+            # 공고 목록 캐시 무효화 및 전체 공고 집계 재계산
+            if saved_jobs:
+                invalidate_job_cache()
+                refresh_job_facets()
 
-            db.session.commit()
             return success_response({
                 "message": "크롤링 및 데이터 저장 완료",
                 "jobs": [{
@@ -177,10 +137,12 @@ class get_job_posts(MethodView):
                     "company_name": job.company_name,
                     "location": job.location
                 } for job in saved_jobs],
-                "count": len(saved_jobs)
+                "count": len(saved_jobs),
+                "incremental": checkpoint is not None,
+                "latest_posted_date": checkpoint.high_water_mark() if checkpoint else None
             }), 200
 
         except Exception as e:
             db.session.rollback()
-            current_app.logger.error(f"Error processing job posts at {datetime.now()}: {str(e)}")
+            current_app.logger.error(f"Error processing job posts: {str(e)}")
             raise CustomError("채용 공고 크롤링 실패", 500)
\ No newline at end of file
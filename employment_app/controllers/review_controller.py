@@ -1,15 +1,29 @@
-from flask import current_app
+import json
+from flask import current_app, Response, stream_with_context
 from flask_jwt_extended import jwt_required, get_jwt_identity
 from flask_smorest import Blueprint as SmorestBlueprint
 from flask_restx import Resource
-from ..models import db, User, Review
+from ..models import db, Review
 from ..schemas import ReviewSchema, ReviewCompanyIdSchema, SuccessResponseSchema, ErrorResponseSchema
-from ..error_log import success_response, AuthenticationError, ValidationError
+from ..error_log import success_response, AuthenticationError, ValidationError, query_budget
+from ..services import current_user, apply_review_rating, invalidate_company_rating, get_company_rating, cursor_paginate, cursor_pagination
 from sqlalchemy.exc import IntegrityError
-from datetime import datetime
+from sqlalchemy.orm import joinedload
 
 review_ns = SmorestBlueprint('Reviews', 'Reviews', url_prefix='/reviews', description="리뷰 관련 API")
 
+# 스트리밍 시 DB 커서에서 한 번에 가져올 행 수
+REVIEW_STREAM_BATCH = 500
+
+def stream_reviews(query, cursor=None):
+    """
+    리뷰를 서버 측 커서(yield_per)로 조금씩 읽어 한 줄에 하나씩 JSON으로 전송 (메모리 사용량 일정)
+    """
+    if cursor:
+        query = query.filter(Review.review_id < cursor)
+    for review in query.order_by(Review.review_id.desc()).yield_per(REVIEW_STREAM_BATCH):
+        yield json.dumps(review.to_dict(), ensure_ascii=False) + "\n"
+
 @review_ns.route('')
 class ReviewAPI(Resource):
     @jwt_required()
@@ -23,11 +37,11 @@ class ReviewAPI(Resource):
         회사 리뷰 작성
         """
         identity = get_jwt_identity()
-        user = User.query.filter_by(email=identity).first()
+        user = current_user()
 
         if not user:
             # 로그에 날짜와 시간 포함
-            current_app.logger.error(f"[{datetime.now()}] 사용자 인증 실패 - 이메일: {identity}")
+            current_app.logger.error(f"사용자 인증 실패 - 이메일: {identity}")
             raise AuthenticationError("사용자 인증 실패")
 
         try:
@@ -38,29 +52,45 @@ class ReviewAPI(Resource):
                 review_text=data.get('review_text', '')
             )
             db.session.add(new_review)
+
+            # 회사 평점 집계를 같은 트랜잭션에서 갱신
+            apply_review_rating(data['company_id'], data['rating'], 1)
             db.session.commit()
+            invalidate_company_rating(data['company_id'])
             return success_response({"Review": new_review.to_dict()}), 201
         
         except IntegrityError:
             db.session.rollback()
-            current_app.logger.error(f"[{datetime.now()}] 데이터 무결성 오류 - 사용자 ID: {user.user_id} - 리뷰 작성 실패")
+            current_app.logger.error(f"데이터 무결성 오류 - 사용자 ID: {user.user_id} - 리뷰 작성 실패")
             raise ValidationError("리뷰 작성 중 데이터 무결성 오류가 발생했습니다.")
 
     @review_ns.arguments(ReviewCompanyIdSchema, location='query')
     @review_ns.response(200, SuccessResponseSchema)
     @review_ns.response(404, ErrorResponseSchema)
+    @query_budget(1)
     def get(self, args):
         """
-        회사 리뷰 목록 조회
+        회사 리뷰 목록 조회 (커서 페이지네이션, format=ndjson이면 전체 리뷰 스트리밍)
         """
         company_id = args.get('company_id')
-        reviews = Review.query.filter_by(company_id=company_id).all() if company_id else Review.query.all()
+        cursor = args.get('cursor')
+        limit = args.get('limit', 20)
+
+        # 회사 정보를 한 번에 조회 (리뷰별 지연 로딩 방지)
+        query = Review.query.options(joinedload(Review.company))
+
+        if args.get('format') == 'ndjson' and not company_id:
+            return Response(stream_with_context(stream_reviews(query, cursor)), mimetype='application/x-ndjson')
+
+        if company_id:
+            query = query.filter_by(company_id=company_id)
+        reviews, next_cursor = cursor_paginate(query, Review.review_id, cursor, limit)
 
-        if not reviews:
-            current_app.logger.error(f"[{datetime.now()}] 해당 조건에 맞는 리뷰 없음 - company_id: {company_id}")
+        if not reviews and not cursor:
+            current_app.logger.error(f"해당 조건에 맞는 리뷰 없음 - company_id: {company_id}")
             raise ValidationError("해당 조건에 맞는 리뷰가 없습니다.")
 
-        return success_response({"Reviews": [review.to_dict() for review in reviews]}), 200
+        return success_response({"Reviews": [review.to_dict() for review in reviews]}, cursor_pagination(next_cursor, limit)), 200
 
 @review_ns.route('/<int:id>')
 class ReviewDetailAPI(Resource):
@@ -74,18 +104,32 @@ class ReviewDetailAPI(Resource):
         리뷰 삭제
         """
         identity = get_jwt_identity()
-        user = User.query.filter_by(email=identity).first()
+        user = current_user()
 
         if not user:
-            current_app.logger.error(f"[{datetime.now()}] 사용자 인증 실패 - 이메일: {identity}")
+            current_app.logger.error(f"사용자 인증 실패 - 이메일: {identity}")
             raise AuthenticationError("사용자 인증 실패")
 
         review = Review.query.filter_by(review_id=id, user_id=user.user_id).first()
         if not review:
-            current_app.logger.error(f"[{datetime.now()}] 리뷰 삭제 실패 - 리뷰 ID: {id} - 권한 없음 또는 리뷰 없음")
+            current_app.logger.error(f"리뷰 삭제 실패 - 리뷰 ID: {id} - 권한 없음 또는 리뷰 없음")
             raise ValidationError(f"ID {id}에 해당하는 리뷰가 없거나 권한이 없습니다.")
 
         db.session.delete(review)
+
+        # 회사 평점 집계를 같은 트랜잭션에서 갱신
+        company_id = review.company_id
+        apply_review_rating(company_id, review.rating, -1)
         db.session.commit()
-        current_app.logger.info(f"[{datetime.now()}] 리뷰 삭제 성공 - 리뷰 ID: {id}")
+        invalidate_company_rating(company_id)
+        current_app.logger.info(f"리뷰 삭제 성공 - 리뷰 ID: {id}")
         return success_response({"message": f"ID {id} 리뷰가 성공적으로 삭제되었습니다."}), 200
+
+@review_ns.route('/summary/<int:company_id>')
+class ReviewSummaryAPI(Resource):
+    @review_ns.response(200, SuccessResponseSchema)
+    def get(self, company_id):
+        """
+        회사 평점 요약 조회 (리뷰 수, 평균, 1~5점 분포)
+        """
+        return success_response({"rating": get_company_rating(company_id)}), 200
@@ -5,4 +5,7 @@ from .error_handler import *
 from .logger import *
 
 # 모니터링 처리
-from .monitoring import *
\ No newline at end of file
+from .monitoring import *
+
+# 지표 수집
+from .metrics import *
\ No newline at end of file
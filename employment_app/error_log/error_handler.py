@@ -1,5 +1,5 @@
 from flask import jsonify, request
-from flask_jwt_extended.exceptions import NoAuthorizationError, WrongTokenError
+from flask_jwt_extended.exceptions import NoAuthorizationError, WrongTokenError, RevokedTokenError
 from werkzeug.exceptions import HTTPException
 
 # HTTP 상태 코드에 대한 문자열 코드 매핑
@@ -8,6 +8,7 @@ error_codes = {
     401: "UNAUTHORIZED",
     403: "FORBIDDEN",
     404: "NOT_FOUND",
+    429: "TOO_MANY_REQUESTS",
     500: "INTERNAL_SERVER_ERROR",
     502: "BAD_GATEWAY",
     503: "SERVICE_UNAVAILABLE",
@@ -58,6 +59,22 @@ class ValidationError(CustomError):
     def __init__(self, message="데이터 형식이 올바르지 않습니다."):
         super().__init__(message, status_code=400,)
 
+# 과부하 오류 클래스 (503 Service Unavailable)
+class ServiceUnavailableError(CustomError):
+    def __init__(self, message="서비스를 일시적으로 사용할 수 없습니다."):
+        super().__init__(message, status_code=503)
+
+# 요청 제한 오류 클래스 (429 Too Many Requests)
+class RateLimitError(CustomError):
+    def __init__(self, message="요청이 너무 많습니다. 잠시 후 다시 시도해주세요.", retry_after=1):
+        super().__init__(message, status_code=429)
+        self.retry_after = max(1, int(retry_after))
+
+    def get_json_response(self):
+        response, status_code = error_response(self.message, self.code)
+        response.headers['Retry-After'] = str(self.retry_after)
+        return response, status_code
+
 # 서버 오류 클래스 (500 Internal Server Error)
 class ServerError(CustomError):
     def __init__(self, message="서버 내부 오류"):
@@ -87,6 +104,10 @@ def configure_error_handlers(app):
     def handle_wrong_token_error(e):
         return error_response("잘못된 토큰이 제공되었습니다.", 401)
     
+    @app.errorhandler(RevokedTokenError)
+    def handle_revoked_token_error(e):
+        return error_response("로그아웃되었거나 폐기된 토큰입니다.", 401)
+
     @app.errorhandler(Exception)
     def handle_general_exception(e):
         app.logger.error(f"예외 발생: {str(e)}", exc_info=True)
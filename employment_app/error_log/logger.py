@@ -1,35 +1,185 @@
+import atexit
+import json
 import logging
-from logging.handlers import RotatingFileHandler
-from flask import request, jsonify
-from datetime import datetime
+import os
+import queue
+import random
+import threading
+import time
+from datetime import datetime, timezone
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
+from flask import request, g, jsonify, has_request_context
+from flask.logging import default_handler
+
+# 요청 로그 전용 로거 (앱 로그 레벨과 별도로 INFO 기록, 샘플링)
+access_logger = logging.getLogger('employment_app.access')
+
+# 로그 레코드의 기본 속성 (나머지 속성은 extra로 전달된 값으로 보고 JSON에 포함)
+RESERVED_ATTRS = frozenset(vars(logging.makeLogRecord({}))) | {'message', 'asctime'}
+
+
+class JsonFormatter(logging.Formatter):
+    """
+    로그 레코드를 한 줄 JSON으로 변환 (요청 정보 및 extra 값 포함)
+    """
+
+    def format(self, record):
+        entry = {
+            'time': datetime.fromtimestamp(record.created, timezone.utc).isoformat(timespec='milliseconds'),
+            'level': record.levelname,
+            'logger': record.name,
+            'message': record.getMessage(),
+            'pid': record.process,
+        }
+        for key, value in record.__dict__.items():
+            if key not in RESERVED_ATTRS and not key.startswith('_'):
+                entry[key] = value
+        if record.exc_info:
+            entry['exc_info'] = self.formatException(record.exc_info)
+        return json.dumps(entry, ensure_ascii=False, default=str)
+
+
+class RequestContextFilter(logging.Filter):
+    """
+    요청 처리 중 남긴 로그에 라우트, 메서드, 사용자 ID 추가
+    """
+
+    def filter(self, record):
+        if has_request_context() and not hasattr(record, 'route'):
+            rule = request.url_rule
+            record.route = rule.rule if rule else None
+            record.method = request.method
+            # 인증된 요청이면 flask_jwt_extended가 g에 저장한 토큰의 user_id 클레임 사용 (다시 디코딩하지 않음, sub는 이메일)
+            record.user_id = (g.get('_jwt_extended_jwt') or {}).get('user_id')
+        return True
+
+
+class BatchQueueListener(QueueListener):
+    """
+    일정 간격마다 큐에 쌓인 레코드를 한꺼번에 기록
+    (레코드마다 리스너 스레드를 깨우면 요청 스레드와 GIL을 주고받느라 오히려 느려짐)
+    """
+
+    def __init__(self, queue, *handlers, interval=0.2):
+        super().__init__(queue, *handlers, respect_handler_level=True)
+        self.interval = interval
+
+    def _monitor(self):
+        while True:
+            time.sleep(self.interval)
+            while True:
+                try:
+                    record = self.queue.get_nowait()
+                except queue.Empty:
+                    break
+                if record is self._sentinel:  # stop() 호출
+                    return
+                self.handle(record)
+
+
+class BackgroundQueueHandler(QueueHandler):
+    """
+    로그 레코드를 큐에 넣고 별도 스레드(BatchQueueListener)에서 포맷/파일 기록
+    - 요청 스레드에서는 메시지 문자열만 만들고 JSON 변환 및 파일 I/O, 로테이션은 하지 않음
+    - fork된 프로세스(gunicorn 워커)에서는 처음 로그를 남길 때 큐와 리스너 스레드를 새로 만듦
+    """
+
+    def __init__(self, *handlers, interval=0.2):
+        super().__init__(queue.SimpleQueue())
+        self.handlers = handlers
+        self.interval = interval
+        self.listener = None
+        self._pid = None
+        self._start_lock = threading.Lock()
+
+    def start(self):
+        self.queue = queue.SimpleQueue()
+        self.listener = BatchQueueListener(self.queue, *self.handlers, interval=self.interval)
+        self.listener.start()
+        self._pid = os.getpid()
+
+    def stop(self):
+        # 남은 레코드를 모두 기록한 뒤 리스너 종료
+        if self.listener and self._pid == os.getpid():
+            self.listener.stop()
+        self.listener = None
+
+    def enqueue(self, record):
+        if self._pid != os.getpid():
+            # 여러 스레드가 fork 직후 동시에 로그를 남겨도 리스너는 하나만 시작
+            with self._start_lock:
+                if self._pid != os.getpid():
+                    self.start()
+        super().enqueue(record)
+
+    def prepare(self, record):
+        # 기본 구현과 달리 여기서 포맷하지 않고 메시지만 확정 (인자 객체가 이후 바뀌어도 안전)
+        record.msg = record.getMessage()
+        record.args = None
+        return record
+
 
 def configure_logger(app):
     """로깅 설정 함수"""
     log_level = logging.DEBUG if app.config["ENV"] != "prod" else logging.ERROR
     logging.basicConfig(level=log_level)
-    
-    # 파일 핸들러 설정 (로그를 파일에 저장)
-    file_handler = RotatingFileHandler('app.log', maxBytes=10000, backupCount=3)
-    file_handler.setLevel(log_level)
-    formatter = logging.Formatter('%(asctime)s - %(levelname)s - %(message)s')
-    file_handler.setFormatter(formatter)
-    
-    # 로거에 파일 핸들러 추가
-    app.logger.addHandler(file_handler)
-
-    # 요청 로깅
+
+    # 파일 핸들러 설정 (JSON 한 줄씩 저장, 리스너 스레드에서만 기록)
+    file_handler = RotatingFileHandler(
+        app.config['LOG_FILE'], maxBytes=app.config['LOG_MAX_BYTES'],
+        backupCount=app.config['LOG_BACKUP_COUNT'], encoding='utf-8'
+    )
+    file_handler.setFormatter(JsonFormatter())
+
+    # 콘솔 출력 (개발 환경에서 읽기 쉬운 형식)
+    console_handler = logging.StreamHandler()
+    console_handler.setFormatter(logging.Formatter('%(asctime)s - %(levelname)s - %(message)s'))
+
+    queue_handler = BackgroundQueueHandler(file_handler, console_handler, interval=app.config['LOG_FLUSH_INTERVAL'])
+    queue_handler.addFilter(RequestContextFilter())
+    queue_handler.start()
+    atexit.register(queue_handler.stop)  # 종료 시 큐에 남은 로그 기록
+    app.extensions['log_queue_handler'] = queue_handler
+
+    # 앱 로거는 큐 핸들러로만 기록 (Flask 기본 콘솔 핸들러 및 루트 로거로 전파하지 않음)
+    app.logger.removeHandler(default_handler)
+    for handler in list(app.logger.handlers):
+        if isinstance(handler, BackgroundQueueHandler):  # 같은 프로세스에서 앱을 다시 만든 경우
+            app.logger.removeHandler(handler)
+            handler.stop()
+    app.logger.addHandler(queue_handler)
+    app.logger.setLevel(log_level)
+    app.logger.propagate = False
+
+    access_logger.handlers = [queue_handler]
+    access_logger.setLevel(logging.INFO)
+    access_logger.propagate = False
+
+    sample_rate = app.config['LOG_REQUEST_SAMPLE_RATE']
+    slow_ms = app.config['LOG_SLOW_REQUEST_MS']
+
+    # 요청 시작 시각 기록
     @app.before_request
-    def log_request():
-        app.logger.info(f"Request started: {request.method} {request.url} at {datetime.now()}")
+    def start_request_log():
+        g.log_started_at = time.perf_counter()
 
-    # 응답 로깅
+    # 응답 로깅 (샘플링, 서버 오류와 느린 요청은 항상 기록)
     @app.after_request
     def log_response(response):
-        app.logger.info(f"Response: {response.status_code} at {datetime.now()}")
+        started_at = g.get('log_started_at')
+        if started_at is None:
+            return response
+        duration_ms = (time.perf_counter() - started_at) * 1000
+        status = response.status_code
+        if status >= 500 or duration_ms >= slow_ms or random.random() < sample_rate:
+            access_logger.info(
+                "%s %s %s %.1fms", request.method, request.path, status, duration_ms,
+                extra={'status': status, 'duration_ms': round(duration_ms, 2), 'path': request.path}
+            )
         return response
 
     # 에러 로깅
     @app.errorhandler(Exception)
     def log_error(e):
-        app.logger.error(f"Error occurred: {str(e)} at {datetime.now()}")
+        app.logger.error("Error occurred: %s", e)
         return jsonify({"message": "An error occurred"}), 500
@@ -0,0 +1,328 @@
+import json
+import os
+import threading
+import time
+import weakref
+from flask import Response
+from sqlalchemy import event
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+from sqlalchemy.pool import Pool, QueuePool
+
+# 요청 처리 시간 히스토그램 구간 (초)
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+# 커넥션 획득 대기 시간 히스토그램 구간 (초)
+POOL_WAIT_BUCKETS = (0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1.0, 5.0, 10.0)
+
+# 종료된 워커의 카운터/히스토그램을 합쳐 두는 파일 (METRICS_MULTIPROC_DIR 안)
+ARCHIVE_FILE = 'archive.json'
+
+
+def _key(name, labels):
+    return name, tuple(sorted((key, str(value)) for key, value in labels.items()))
+
+
+class MetricsRegistry:
+    """
+    프로세스 단위 지표 저장소 (라벨별 카운터, 히스토그램, 증감 게이지, 조회 시 계산하는 게이지)
+    - directory를 지정하면 요청을 처리하는 프로세스가 주기적으로 자기 파일(metrics_{pid}.json)에 기록하고, 조회 시 모든 워커 파일을 합산
+    - fork된 프로세스에서는 부모에게서 물려받은 잠금/값을 버리고 새로 집계 (gunicorn preload 마스터의 값은 합산하지 않음)
+    """
+
+    def __init__(self):
+        self._reset()
+        self._gauges = {}
+        self.directory = None
+        self.flush_interval = 1.0
+        os.register_at_fork(after_in_child=self._reset)
+
+    def _reset(self):
+        # fork 시점에 다른 스레드가 잡고 있던 잠금을 물려받지 않도록 새로 생성
+        self._lock = threading.Lock()
+        self._counters, self._histograms, self._values = {}, {}, {}
+        self._flusher = None
+
+    def configure(self, directory=None, flush_interval=1.0):
+        """
+        워커 간 합산용 디렉터리 설정 (None이면 현재 프로세스 지표만 사용)
+        """
+        self.directory = directory or None
+        self.flush_interval = flush_interval
+        if self.directory:
+            os.makedirs(self.directory, exist_ok=True)
+
+    def start_flusher(self):
+        """
+        파일 기록 스레드 시작 (요청을 처리하는 프로세스에서만 호출, 이미 실행 중이면 무시)
+        """
+        if not self.directory or self._flusher is not None:
+            return
+        with self._lock:
+            if self._flusher is None:
+                self._flusher = threading.Thread(target=self._flush_loop, name='metrics-flusher', daemon=True)
+                self._flusher.start()
+
+    def inc(self, name, value=1, **labels):
+        key = _key(name, labels)
+        with self._lock:
+            self._counters[key] = self._counters.get(key, 0) + value
+
+    def add(self, name, value, **labels):
+        """
+        증감 게이지 (처리 중인 요청 수 등)
+        """
+        key = _key(name, labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0) + value
+
+    def observe(self, name, value, buckets=LATENCY_BUCKETS, **labels):
+        key = _key(name, labels)
+        with self._lock:
+            histogram = self._histograms.get(key)
+            if histogram is None:
+                histogram = self._histograms[key] = {'le': list(buckets), 'counts': [0] * (len(buckets) + 1), 'sum': 0.0}
+            index = 0
+            for bound in histogram['le']:
+                if value <= bound:
+                    break
+                index += 1
+            histogram['counts'][index] += 1
+            histogram['sum'] += value
+
+    def gauge(self, name, func):
+        self._gauges[name] = func
+
+    def snapshot(self):
+        """
+        현재 프로세스 지표 (JSON으로 저장할 수 있는 형태)
+        """
+        with self._lock:
+            counters = [[name, dict(labels), value] for (name, labels), value in self._counters.items()]
+            histograms = [[name, dict(labels), dict(histogram, counts=list(histogram['counts']))]
+                          for (name, labels), histogram in self._histograms.items()]
+            gauges = [[name, dict(labels), value] for (name, labels), value in self._values.items()]
+        gauges += [[name, {}, func()] for name, func in self._gauges.items()]
+        return {'counters': counters, 'histograms': histograms, 'gauges': gauges}
+
+    def flush(self):
+        """
+        현재 프로세스 지표를 파일에 기록 (임시 파일 작성 후 교체하므로 읽는 쪽에서 중간 상태를 보지 않음)
+        """
+        if not self.directory:
+            return
+        path = os.path.join(self.directory, f'metrics_{os.getpid()}.json')
+        _write_json(path, self.snapshot())
+
+    def _flush_loop(self):
+        while True:
+            time.sleep(self.flush_interval)
+            try:
+                self.flush()
+            except OSError:
+                pass  # 디렉터리가 정리된 경우 등 (다음 주기에 다시 시도)
+
+    def collect(self):
+        """
+        조회용 지표 (디렉터리 설정 시 모든 워커 + 종료된 워커 합산)
+        """
+        if not self.directory:
+            return self.snapshot()
+        self.flush()
+        snapshots = []
+        for name in os.listdir(self.directory):
+            if name.endswith('.json'):
+                snapshot = _read_json(os.path.join(self.directory, name))
+                if snapshot:
+                    snapshots.append(snapshot)
+        return merge_snapshots(snapshots)
+
+
+metrics = MetricsRegistry()
+
+
+## 워커 간 합산
+
+def _write_json(path, data):
+    tmp_path = f'{path}.tmp'
+    with open(tmp_path, 'w') as f:
+        json.dump(data, f)
+    os.replace(tmp_path, path)
+
+
+def _read_json(path):
+    try:
+        with open(path) as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
+def merge_snapshots(snapshots):
+    """
+    프로세스별 지표 합산 (카운터/히스토그램/게이지 모두 라벨별 합계)
+    """
+    counters, histograms, gauges = {}, {}, {}
+    for snapshot in snapshots:
+        for name, labels, value in snapshot.get('counters', []):
+            key = _key(name, labels)
+            counters[key] = counters.get(key, 0) + value
+        for name, labels, value in snapshot.get('gauges', []):
+            key = _key(name, labels)
+            gauges[key] = gauges.get(key, 0) + value
+        for name, labels, histogram in snapshot.get('histograms', []):
+            key = _key(name, labels)
+            merged = histograms.get(key)
+            if merged is None or merged['le'] != histogram['le']:
+                histograms[key] = dict(histogram, counts=list(histogram['counts']))
+                continue
+            merged['counts'] = [a + b for a, b in zip(merged['counts'], histogram['counts'])]
+            merged['sum'] += histogram['sum']
+    return {
+        'counters': [[name, dict(labels), value] for (name, labels), value in counters.items()],
+        'histograms': [[name, dict(labels), histogram] for (name, labels), histogram in histograms.items()],
+        'gauges': [[name, dict(labels), value] for (name, labels), value in gauges.items()],
+    }
+
+
+def clear_metrics_dir(directory):
+    """
+    이전 실행에서 남은 지표 파일 삭제 (gunicorn on_starting)
+    """
+    os.makedirs(directory, exist_ok=True)
+    for name in os.listdir(directory):
+        os.remove(os.path.join(directory, name))
+
+
+def archive_process_metrics(directory, pid):
+    """
+    종료된 워커의 카운터/히스토그램을 보관 파일에 합치고 워커 파일 삭제 (gunicorn child_exit)
+    - 게이지는 현재 상태이므로 버리고, 누적 값은 남겨 워커가 재시작되어도 합계가 줄어들지 않게 함
+    """
+    path = os.path.join(directory, f'metrics_{pid}.json')
+    snapshot = _read_json(path)
+    if snapshot is None:
+        return
+    archive_path = os.path.join(directory, ARCHIVE_FILE)
+    merged = merge_snapshots([_read_json(archive_path) or {}, dict(snapshot, gauges=[])])
+    _write_json(archive_path, merged)
+    os.remove(path)
+
+
+## Prometheus 텍스트 형식
+
+def _format_labels(labels, extra=None):
+    items = list(labels.items()) + (list(extra.items()) if extra else [])
+    if not items:
+        return ''
+    escaped = (
+        f'{key}="' + str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n') + '"'
+        for key, value in items
+    )
+    return '{' + ','.join(escaped) + '}'
+
+
+def render_prometheus(snapshot):
+    """
+    지표를 Prometheus 텍스트 형식(0.0.4)으로 변환
+    """
+    lines = []
+
+    def by_name(entries):
+        grouped = {}
+        for name, labels, value in entries:
+            grouped.setdefault(name, []).append((labels, value))
+        return sorted(grouped.items())
+
+    for name, entries in by_name(snapshot['counters']):
+        metric = name if name.endswith('_total') else f'{name}_total'
+        lines.append(f'# TYPE {metric} counter')
+        lines += [f'{metric}{_format_labels(labels)} {value}' for labels, value in entries]
+
+    for name, entries in by_name(snapshot['gauges']):
+        lines.append(f'# TYPE {name} gauge')
+        lines += [f'{name}{_format_labels(labels)} {value}' for labels, value in entries]
+
+    for name, entries in by_name(snapshot['histograms']):
+        lines.append(f'# TYPE {name} histogram')
+        for labels, histogram in entries:
+            cumulative = 0
+            for bound, count in zip(histogram['le'] + ['+Inf'], histogram['counts']):
+                cumulative += count
+                lines.append(f'{name}_bucket{_format_labels(labels, {"le": bound})} {cumulative}')
+            lines.append(f'{name}_sum{_format_labels(labels)} {histogram["sum"]}')
+            lines.append(f'{name}_count{_format_labels(labels)} {cumulative}')
+
+    return '\n'.join(lines) + '\n'
+
+
+def record_cache(cache, hit, count=1):
+    """
+    캐시 조회 결과 집계 (cache_requests_total{cache, result})
+    """
+    if count:
+        metrics.inc('cache_requests', count, cache=cache, result='hit' if hit else 'miss')
+
+
+## DB 커넥션 풀 지표
+
+# 지표를 수집하는 풀 목록 (dispose/recreate로 버려진 풀은 자동 제외)
+_pools = weakref.WeakSet()
+
+
+class InstrumentedQueuePool(QueuePool):
+    """
+    커넥션 획득 대기 시간과 타임아웃을 기록하는 QueuePool (SQLALCHEMY_ENGINE_OPTIONS의 poolclass)
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        _pools.add(self)
+
+    def connect(self):
+        start = time.perf_counter()
+        try:
+            return super().connect()
+        except PoolTimeoutError:
+            metrics.inc('db_pool_timeouts')
+            raise
+        finally:
+            metrics.observe('db_pool_checkout_wait_seconds', time.perf_counter() - start, buckets=POOL_WAIT_BUCKETS)
+
+
+def _on_connect(dbapi_connection, connection_record):
+    metrics.inc('db_pool_connections_created')
+
+
+def _on_checkout(dbapi_connection, connection_record, connection_proxy):
+    metrics.inc('db_pool_checkouts')
+
+
+def _on_invalidate(dbapi_connection, connection_record, exception):
+    # pre-ping 실패, DB 장애 조치(failover) 후 끊어진 연결 등
+    metrics.inc('db_pool_invalidated')
+
+
+def monitor_pool():
+    """
+    커넥션 풀 이벤트 리스너 및 풀 상태 게이지 등록 (모든 엔진에 적용)
+    """
+    for name, listener in [('connect', _on_connect), ('checkout', _on_checkout), ('invalidate', _on_invalidate)]:
+        if not event.contains(Pool, name, listener):
+            event.listen(Pool, name, listener)
+
+    metrics.gauge('db_pool_size', lambda: sum(pool.size() for pool in _pools))
+    metrics.gauge('db_pool_checked_out', lambda: sum(pool.checkedout() for pool in _pools))
+    metrics.gauge('db_pool_overflow', lambda: sum(max(pool.overflow(), 0) for pool in _pools))
+
+
+def register_metrics_endpoint(app):
+    """
+    GET /metrics: Prometheus 텍스트 형식 지표 (METRICS_ENABLED일 때만, METRICS_MULTIPROC_DIR 설정 시 모든 워커 합산)
+    """
+    metrics.configure(app.config['METRICS_MULTIPROC_DIR'], app.config['METRICS_FLUSH_INTERVAL'])
+    if not app.config['METRICS_ENABLED']:
+        return
+
+    def metrics_view():
+        return Response(render_prometheus(metrics.collect()), mimetype='text/plain; version=0.0.4; charset=utf-8')
+
+    app.add_url_rule('/metrics', 'metrics', metrics_view)
@@ -1,14 +1,76 @@
-from flask import request
+from functools import wraps
+from flask import request, g, has_request_context
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
 import time
+from .metrics import metrics, monitor_pool, register_metrics_endpoint
+
+
+def count_sql_query(conn, cursor, statement, parameters, context, executemany):
+    """요청마다 실행된 SQL 수 집계"""
+    if has_request_context():
+        g.sql_query_count = g.get('sql_query_count', 0) + 1
+
+
+def query_budget(limit):
+    """
+    엔드포인트의 요청당 SQL 허용 개수 지정 (초과 시 경고 로그, benchmarks/query_budget.py로 확인)
+    """
+    def decorator(func):
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            g.sql_query_budget = limit
+            return func(*args, **kwargs)
+        return wrapper
+    return decorator
+
 
 def monitor_performance(app):
     """성능 모니터링 설정 함수"""
+    if not event.contains(Engine, 'before_cursor_execute', count_sql_query):
+        event.listen(Engine, 'before_cursor_execute', count_sql_query)
+    monitor_pool()
+    register_metrics_endpoint(app)
+
     @app.before_request
     def start_timer():
-        request.start_time = time.time()
+        metrics.start_flusher()
+        g.request_started_at = time.perf_counter()
+        g.request_in_flight = True
+        metrics.add('http_requests_in_flight', 1)
 
     @app.after_request
     def log_request_duration(response):
-        duration = time.time() - request.start_time
-        app.logger.info(f"Request took {duration:.2f} seconds.")
+        started_at = g.get('request_started_at')
+        if started_at is None:
+            return response
+        duration = time.perf_counter() - started_at
+        query_count = g.get('sql_query_count', 0)
+        app.logger.debug("Request took %.2f seconds. (%d SQL queries)", duration, query_count)
+
+        # 라우트별 지표 (실제 URL이 아닌 URL 규칙 기준, 매칭되지 않은 요청은 하나로 묶음)
+        route = request.url_rule.rule if request.url_rule else 'unmatched'
+        status = response.status_code
+        metrics.inc('http_requests', method=request.method, route=route, status=status)
+        metrics.observe('http_request_duration_seconds', duration, method=request.method, route=route)
+        if status >= 500:
+            metrics.inc('http_request_errors', method=request.method, route=route)
+        if query_count:
+            metrics.inc('db_queries', query_count, route=route)
+
+        budget = g.get('sql_query_budget')
+        if budget is not None and query_count > budget:
+            app.logger.warning("SQL query budget exceeded: %s %s %d > %d", request.method, request.path, query_count, budget)
+
+        # 개발/점검용 응답 헤더
+        if app.config['SQL_QUERY_COUNT_HEADER']:
+            response.headers['X-SQL-Query-Count'] = str(query_count)
+            if budget is not None:
+                response.headers['X-SQL-Query-Budget'] = str(budget)
         return response
+
+    @app.teardown_request
+    def finish_request(exc):
+        # 예외로 after_request가 실행되지 않은 경우에도 처리 중 요청 수 감소
+        if g.pop('request_in_flight', False):
+            metrics.add('http_requests_in_flight', -1)
@@ -1,5 +1,7 @@
 from flask_sqlalchemy import SQLAlchemy
+from .routing import RoutingSession, mark_sticky
 
-db = SQLAlchemy()
+# 읽기 전용 요청은 복제본(SQLALCHEMY_REPLICA_URIS)으로 보내는 세션 사용
+db = SQLAlchemy(session_options={'class_': RoutingSession})
 
 from .model import *
\ No newline at end of file
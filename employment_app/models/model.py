@@ -108,6 +108,27 @@ class JobPostingSkill(db.Model):
     skill_id = db.Column(db.Integer, db.ForeignKey('skills.skill_id'), primary_key=True)
 
 
+class JobFacetCount(db.Model):
+    """
+    전체 공고 기준 기술/지역/트렌드 키워드별 공고 수 (크롤링 후 재계산되는 집계 테이블)
+    """
+    __tablename__ = 'job_facet_counts'
+    dimension = db.Column(db.String(16), primary_key=True)  # skill / location / trend
+    value = db.Column(db.String(256), primary_key=True)
+    count = db.Column(db.Integer, nullable=False, default=0)
+
+
+class JobEngagement(db.Model):
+    """
+    공고별 지원자/북마크/문의 수 (Redis 카운터를 `flask jobs flush-engagement`로 주기적으로 저장)
+    """
+    __tablename__ = 'job_engagement_counts'
+    job_post_id = db.Column(db.Integer, db.ForeignKey('job_postings.job_post_id'), primary_key=True)
+    applications = db.Column(db.Integer, nullable=False, default=0)  # 취소하지 않은 지원 수
+    bookmarks = db.Column(db.Integer, nullable=False, default=0)
+    inquiries = db.Column(db.Integer, nullable=False, default=0)
+
+
 class Token(db.Model):
     __tablename__ = 'tokens'
     token_id = db.Column(db.Integer, primary_key=True)
@@ -131,6 +152,7 @@ class Token(db.Model):
 
 class Bookmark(db.Model):
     __tablename__ = 'bookmarks'
+    __table_args__ = (db.UniqueConstraint('user_id', 'job_post_id', name='uq_bookmarks_user_job'),)
     bookmark_id = db.Column(db.Integer, primary_key=True)
     user_id = db.Column(db.Integer, db.ForeignKey('users.user_id'), nullable=False)
     job_post_id = db.Column(db.Integer, db.ForeignKey('job_postings.job_post_id'), nullable=False)
@@ -149,6 +171,7 @@ class Bookmark(db.Model):
 
 class Application(db.Model):
     __tablename__ = 'applications'
+    __table_args__ = (db.UniqueConstraint('user_id', 'job_post_id', name='uq_applications_user_job'),)
     apply_id = db.Column(db.Integer, primary_key=True)
     user_id = db.Column(db.Integer, db.ForeignKey('users.user_id'), nullable=False)
     job_post_id = db.Column(db.Integer, db.ForeignKey('job_postings.job_post_id'), nullable=False)
@@ -210,4 +233,28 @@ class Review(db.Model):
             "rating": self.rating,
             "review_text": self.review_text,
             "created_at": self.created_at.isoformat()
-        }
\ No newline at end of file
+        }
+
+
+class CompanyRating(db.Model):
+    """
+    회사별 리뷰 평점 집계 (리뷰 작성/삭제 시 증감, `flask reviews rebuild-ratings`로 재계산)
+    """
+    __tablename__ = 'company_ratings'
+    company_id = db.Column(db.Integer, db.ForeignKey('companies.company_id'), primary_key=True)
+    review_count = db.Column(db.Integer, nullable=False, default=0)
+    rating_sum = db.Column(db.Integer, nullable=False, default=0)
+    rating_1 = db.Column(db.Integer, nullable=False, default=0)
+    rating_2 = db.Column(db.Integer, nullable=False, default=0)
+    rating_3 = db.Column(db.Integer, nullable=False, default=0)
+    rating_4 = db.Column(db.Integer, nullable=False, default=0)
+    rating_5 = db.Column(db.Integer, nullable=False, default=0)
+
+    def to_dict(self):
+        return {
+            'company_id': self.company_id,
+            'review_count': self.review_count,
+            'rating_sum': self.rating_sum,
+            'average': round(self.rating_sum / self.review_count, 2) if self.review_count else None,
+            'histogram': {str(score): getattr(self, f'rating_{score}') for score in range(1, 6)}
+        }
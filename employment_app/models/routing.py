@@ -0,0 +1,73 @@
+import itertools
+from flask import current_app, g, has_request_context, request
+from flask_sqlalchemy.session import Session
+
+# 복제본으로 보낼 수 있는 요청 메서드
+READ_ONLY_METHODS = ('GET', 'HEAD', 'OPTIONS')
+# 복제본 bind 이름 (SQLALCHEMY_BINDS의 replica_0, replica_1, ...)
+REPLICA_BIND_PREFIX = 'replica_'
+# 사용자가 쓰기 요청을 한 직후 일정 시간 동안 읽기도 주 DB에서 처리 (복제 지연 동안 자신의 변경이 보이도록)
+REPLICA_STICKY_KEY = 'db_sticky_{identity}'
+
+_round_robin = itertools.count()
+
+
+class RoutingSession(Session):
+    """
+    읽기 전용 요청(GET 등)은 복제본에 라운드 로빈으로, 쓰기(flush, INSERT/UPDATE/DELETE)는 주 DB로 보내는 세션
+    - 복제본이 설정되지 않았거나 요청 밖(CLI, 크롤링 등)에서는 항상 주 DB 사용
+    """
+
+    def get_bind(self, mapper=None, clause=None, bind=None, **kwargs):
+        if bind is None and not self._flushing and not getattr(clause, 'is_dml', False):
+            replica = _request_replica(self._db.engines)
+            if replica is not None:
+                return replica
+        if has_request_context() and (self._flushing or getattr(clause, 'is_dml', False)):
+            g.db_wrote = True
+        return super().get_bind(mapper=mapper, clause=clause, bind=bind, **kwargs)
+
+
+def _request_replica(engines):
+    """
+    현재 요청에서 사용할 복제본 엔진 (요청당 한 번 선택, 주 DB를 써야 하면 None)
+    """
+    if not has_request_context() or request.method not in READ_ONLY_METHODS or g.get('db_wrote'):
+        return None
+    if 'db_replica' not in g:
+        replicas = [engine for key, engine in engines.items() if key and key.startswith(REPLICA_BIND_PREFIX)]
+        g.db_replica = None
+        if replicas and not _is_sticky():
+            g.db_replica = replicas[next(_round_robin) % len(replicas)]
+    return g.db_replica
+
+
+def _jwt_identity():
+    """
+    요청 토큰의 사용자 식별자 (user_id 클레임, 없으면 이메일 / 토큰이 없거나 유효하지 않으면 None)
+    - 토큰을 요구하지 않는 엔드포인트(공고/리뷰 목록 등)에서도 쓰기 직후 고정이 적용되도록 토큰이 있으면 확인
+    """
+    from flask_jwt_extended import get_jwt, get_jwt_identity, verify_jwt_in_request
+    try:
+        verify_jwt_in_request(optional=True)
+        return get_jwt().get('user_id') or get_jwt_identity()
+    except Exception:
+        return None
+
+
+def _is_sticky():
+    identity = _jwt_identity()
+    return bool(identity and current_app.redis_client.get(REPLICA_STICKY_KEY.format(identity=identity)))
+
+
+def mark_sticky(response):
+    """
+    쓰기가 있었던 요청 후 해당 사용자의 읽기를 REPLICA_STICKY_SECONDS 동안 주 DB로 고정 (after_request)
+    """
+    if g.get('db_wrote') and response.status_code < 400 and current_app.config['SQLALCHEMY_REPLICA_URIS']:
+        identity = _jwt_identity()
+        if identity:
+            current_app.redis_client.set(
+                REPLICA_STICKY_KEY.format(identity=identity), 1, ex=current_app.config['REPLICA_STICKY_SECONDS']
+            )
+    return response
@@ -32,4 +32,15 @@ class ApplicationListSchema(Schema):
         description='지원 상태'
     )
     resume_url = fields.Str(missing=None, description='이력서 url', example='http://loacalhost:5000')  # 이력서 첨부 (선택 사항)
-    page = fields.Int(missing=1, description='페이지 번호', example=1)
\ No newline at end of file
+    page = fields.Int(missing=1, description='페이지 번호', example=1)
+
+class ApplicationBatchSchema(Schema):
+    job_post_ids = fields.List(
+        fields.Int(),
+        missing=list,
+        validate=validate.Length(max=100),
+        description='지원할 채용 공고 id 목록 (최대 100개)',
+        example=[100, 101]
+    )
+    from_bookmarks = fields.Bool(missing=False, description='북마크한 공고 전체에 지원', example=False)
+    resume_url = fields.Str(missing=None, description='이력서 url', example='http://loacalhost:5000')  # 이력서 첨부 (선택 사항)
\ No newline at end of file
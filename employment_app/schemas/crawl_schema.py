@@ -5,7 +5,9 @@ from marshmallow import Schema, fields
 # crawl ns
 class JobCrawlSchema(Schema):
     keyword = fields.String(required=True, description='크롤링 검색 키워드', example='IT개발·데이터')
-    pages = fields.Integer(required=True, description='크롤링 할 페이지 수', example=1)
+    pages = fields.Integer(missing=1, description='크롤링 할 페이지 수 (증분 모드가 아닐 때)', example=1)
+    incremental = fields.Boolean(missing=False, description='증분 모드 (이미 저장한 공고만 있는 페이지에서 중단)', example=False)
+    max_pages = fields.Integer(missing=None, description='증분 모드 최대 페이지 수 (미입력 시 CRAWL_MAX_PAGES)', example=10)
 
 class CompanySchema(Schema):
     company_name = fields.String(required=True, description='크롤링 할 회사명', example='케이티텔레캅(주)')
@@ -1,6 +1,10 @@
-from marshmallow import Schema, fields
+from marshmallow import Schema, fields, validate
 
 class InquirySchema(Schema):
     job_post_id = fields.Int(required=True, description='문의 공고 id', example=100)
     title = fields.String(required=True, description='문의 제목', example='공고 지원 서류 관련 문의입니다.')
-    message = fields.Str(required=True, description='문의 내용', example='가족관계증명서는 초본과 등본 중 어떤걸로 제출해야 할까요?')
\ No newline at end of file
+    message = fields.Str(required=True, description='문의 내용', example='가족관계증명서는 초본과 등본 중 어떤걸로 제출해야 할까요?')
+
+class InquiryListSchema(Schema):
+    cursor = fields.Int(missing=None, description="이전 페이지의 nextCursor (첫 페이지는 생략)")
+    limit = fields.Int(missing=20, validate=validate.Range(min=1, max=100), description="한 페이지당 개수")
@@ -50,11 +50,13 @@ class JobSearchfilterSchema(Schema):
     )
     page = fields.Int(default=1, missing=1, description='페이지 번호')
     limit = fields.Int(default=20, missing=20, description='한 페이지당 개수')
+    include_engagement = fields.Bool(missing=False, description='공고별 지원자/북마크/문의 수 포함 여부')
 
 class JobSearchSchema(Schema):
     keyword = fields.Str(default='채용', missing='채용', description='키워드 검색 (title, company, position(skill) ...)')
     page = fields.Int(default=1, missing=1, description='페이지 번호')
     limit = fields.Int(default=20, missing=20, description='한 페이지당 개수')
+    include_engagement = fields.Bool(missing=False, description='공고별 지원자/북마크/문의 수 포함 여부')
 
 class JobFilterSchema(Schema):
     keyword = fields.Str(default='채용', missing='채용', description='키워드 검색 (title, company, position(skill) ...)')
@@ -79,6 +81,7 @@ class JobFilterSchema(Schema):
     )
     page = fields.Int(default=1, missing=1, description='페이지 번호')
     limit = fields.Int(default=20, missing=20, description='한 페이지당 개수')
+    include_engagement = fields.Bool(missing=False, description='공고별 지원자/북마크/문의 수 포함 여부')
 
 
 class JobSortSchema(Schema):
@@ -90,4 +93,25 @@ class JobSortSchema(Schema):
         description='정렬 기준 선택'
     )
     page = fields.Int(default=1, missing=1, description='페이지 번호')
-    limit = fields.Int(default=20, missing=20, description='한 페이지당 개수')
\ No newline at end of file
+    limit = fields.Int(default=20, missing=20, description='한 페이지당 개수')
+    include_engagement = fields.Bool(missing=False, description='공고별 지원자/북마크/문의 수 포함 여부')
+
+class JobFacetSchema(Schema):
+    keyword = fields.Str(missing=None, description='키워드 검색 (title, company, position(skill) ...)')
+    location = fields.Str(missing=None, description='지역 필터링')
+    career_level = fields.Str(missing=None, description='최소 경력 필터링')
+    salary = fields.Str(missing=None, description='최소 급여 필터링')
+    status = fields.Str(
+        missing=None,
+        validate=validate.OneOf(
+            [status.value for status in JobStatus]
+        ),
+        description='상태 필터링'
+    )
+    trend_keywords = fields.Str(missing=None, description='트렌드 키워드 필터링')
+    skills = fields.Str(missing=None, description='필요한 스킬 리스트 (쉼표로 구분)')
+    limit = fields.Int(default=20, missing=20, description='집계 항목별 최대 개수')
+
+class JobDetailSchema(Schema):
+    include_rating = fields.Bool(missing=False, description='회사 평점 요약 포함 여부')
+    include_engagement = fields.Bool(missing=False, description='지원자/북마크/문의 수 포함 여부')
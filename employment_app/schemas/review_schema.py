@@ -11,4 +11,11 @@ class ReviewSchema(Schema):
     review_text = fields.Str(description='리뷰 내용', example="좋은 회사입니다!")
 
 class ReviewCompanyIdSchema(Schema):
-    company_id = fields.Int(description="회사 ID", example=100)
\ No newline at end of file
+    company_id = fields.Int(description="회사 ID", example=100)
+    cursor = fields.Int(missing=None, description="이전 페이지의 nextCursor (첫 페이지는 생략)")
+    limit = fields.Int(missing=20, validate=validate.Range(min=1, max=100), description="한 페이지당 개수")
+    format = fields.Str(
+        missing='json',
+        validate=validate.OneOf(['json', 'ndjson']),
+        description="ndjson: 전체 리뷰를 한 줄에 하나씩 스트리밍 (company_id 없이 조회 시)"
+    )
\ No newline at end of file
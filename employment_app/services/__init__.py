@@ -1,6 +1,26 @@
+from .saramin_parser import *
+from .crawl_checkpoint import *
 from .crawl_company import *
 from .crawl_job_post import *
 
+from .cache_service import *
+from .skill_normalizer import *
+from .db_service import *
+from .pagination import *
+from .skill_registry import *
 from .service import *
 from .auth_service import *
-from .job_service import *
\ No newline at end of file
+from .password_service import *
+from .identity_service import *
+from .token_store import *
+from .rate_limit import *
+from .bookmark_service import *
+from .application_service import *
+from .dashboard_service import *
+from .engagement_service import *
+from .job_service import *
+from .job_cache import *
+from .facet_service import *
+from .rating_service import *
+from .crawl_store import *
+from .crawl_pipeline import *
\ No newline at end of file
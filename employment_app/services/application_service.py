@@ -0,0 +1,61 @@
+from datetime import datetime
+from sqlalchemy import select, literal, cast
+from sqlalchemy.orm import joinedload
+from ..extensions import KST, ApplicationStatus
+from ..models import db, Application, Bookmark, JobPosting
+from .db_service import dialect_insert
+
+def apply_to_jobs(user_id, job_post_ids=None, from_bookmarks=False, resume_url=None):
+    """
+    공고 여러 개에 한 번에 지원 (INSERT ... SELECT ... ON CONFLICT DO NOTHING, 호출한 쪽에서 commit)
+    - 회사 ID는 같은 구문에서 job_postings로 채움 (존재하지 않는 공고는 자동으로 제외)
+    - from_bookmarks=True이면 사용자가 북마크한 공고 전체에 지원
+    -> 새로 지원된 내역 목록 (Application.to_dict()와 같은 형식, 이미 지원한 공고는 제외)
+    """
+    table = Application.__table__
+    source = select(
+        literal(user_id),
+        JobPosting.job_post_id,
+        JobPosting.company_id,
+        cast(literal(ApplicationStatus.SUBMIT.value), table.c.status.type),
+        literal(datetime.now(KST), table.c.applied_at.type),
+        literal(resume_url, table.c.resume_url.type),
+    )
+    if from_bookmarks:
+        source = source.join(Bookmark, Bookmark.job_post_id == JobPosting.job_post_id).where(Bookmark.user_id == user_id)
+    else:
+        source = source.where(JobPosting.job_post_id.in_(job_post_ids or []))
+
+    stmt = dialect_insert(Application).from_select(
+        ['user_id', 'job_post_id', 'company_id', 'status', 'applied_at', 'resume_url'], source
+    ).on_conflict_do_nothing(index_elements=['user_id', 'job_post_id']).returning(
+        table.c.apply_id, table.c.user_id, table.c.job_post_id, table.c.company_id,
+        table.c.status, table.c.applied_at, table.c.resume_url
+    )
+    return _application_dicts(db.session.execute(stmt).mappings().all())
+
+
+def apply_to_job(user_id, job_post_id, resume_url=None):
+    """
+    공고 하나에 지원 -> 지원 내역 (이미 지원했거나 없는 공고면 None)
+    """
+    applied = apply_to_jobs(user_id, [job_post_id], resume_url=resume_url)
+    return applied[0] if applied else None
+
+
+def _application_dicts(rows):
+    # 지원한 공고와 회사 정보를 한 번에 조회해 포함
+    job_post_ids = {row['job_post_id'] for row in rows}
+    job_postings = {
+        job_posting.job_post_id: job_posting
+        for job_posting in JobPosting.query.options(joinedload(JobPosting.company))
+        .filter(JobPosting.job_post_id.in_(job_post_ids))
+    } if job_post_ids else {}
+    return [{
+        'apply_id': row['apply_id'],
+        'user_id': row['user_id'],
+        'job_posting': job_postings[row['job_post_id']].to_dict() if row['job_post_id'] in job_postings else None,
+        'status': row['status'],
+        'applied_at': row['applied_at'].isoformat() if row['applied_at'] else None,
+        'resume_url': row['resume_url'],
+    } for row in rows]
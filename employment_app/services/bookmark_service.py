@@ -0,0 +1,120 @@
+from datetime import datetime
+from flask import current_app
+from flask_jwt_extended import get_jwt_identity, verify_jwt_in_request
+from flask_jwt_extended.exceptions import JWTExtendedException
+from jwt import PyJWTError
+from sqlalchemy import delete
+from sqlalchemy.orm import joinedload
+from ..error_log import record_cache, ServiceUnavailableError
+from ..extensions import KST
+from ..models import db, Bookmark, JobPosting
+from .db_service import dialect_insert
+from .identity_service import current_user_id
+
+# 사용자별 북마크한 공고 ID 집합 (BOOKMARK_SET_TTL 초 후 만료, 북마크 추가/제거 시 함께 갱신)
+BOOKMARK_SET_KEY = 'user_bookmarks_{user_id}'
+# DB에서 전체를 적재한 집합임을 표시하는 원소 (공고 ID는 1부터 시작)
+BOOKMARK_SET_LOADED = '0'
+
+
+def toggle_bookmark(user_id, job_post_id):
+    """
+    북마크가 있으면 제거, 없으면 추가 (DELETE ... RETURNING -> INSERT ... ON CONFLICT, 호출한 쪽에서 commit)
+    -> (추가 여부, 북마크 정보), 동시에 들어온 같은 요청이 먼저 추가해 바뀐 것이 없으면 추가 여부는 None
+       (그 사이 다시 제거되어 북마크가 없으면 북마크 정보도 None)
+    """
+    table = Bookmark.__table__
+    columns = [table.c.bookmark_id, table.c.user_id, table.c.job_post_id, table.c.created_at]
+
+    removed = db.session.execute(
+        delete(table)
+        .where(table.c.user_id == user_id, table.c.job_post_id == job_post_id)
+        .returning(*columns)
+    ).mappings().first()
+    if removed:
+        return False, _bookmark_dict(removed)
+
+    added = db.session.execute(
+        dialect_insert(Bookmark)
+        .values(user_id=user_id, job_post_id=job_post_id, created_at=datetime.now(KST))
+        .on_conflict_do_nothing(index_elements=['user_id', 'job_post_id'])
+        .returning(*columns)
+    ).mappings().first()
+    if added is None:
+        # 동시에 들어온 같은 요청이 먼저 추가한 경우 (카운터 등은 그 요청에서 반영)
+        existing = db.session.execute(
+            table.select().where(table.c.user_id == user_id, table.c.job_post_id == job_post_id)
+        ).mappings().first()
+        return None, _bookmark_dict(existing) if existing else None
+    return True, _bookmark_dict(added)
+
+
+def _bookmark_dict(row):
+    # Bookmark.to_dict()와 같은 형식 (공고 및 회사 정보 포함)
+    job_posting = db.session.get(JobPosting, row['job_post_id'], options=[joinedload(JobPosting.company)])
+    return {
+        'bookmark_id': row['bookmark_id'],
+        'user_id': row['user_id'],
+        'job_posting': job_posting.to_dict() if job_posting else None,
+        'created_at': row['created_at'].isoformat(),
+    }
+
+
+def mirror_bookmark(user_id, job_post_id, added):
+    """
+    commit된 북마크 추가/제거를 사용자별 Redis 집합에 반영
+    """
+    key = BOOKMARK_SET_KEY.format(user_id=user_id)
+    pipe = current_app.redis_client.pipeline()
+    if added:
+        pipe.sadd(key, job_post_id)
+    else:
+        pipe.srem(key, job_post_id)
+    pipe.expire(key, current_app.config['BOOKMARK_SET_TTL'])
+    pipe.execute()
+
+
+def bookmarked_job_ids(user_id):
+    """
+    사용자가 북마크한 공고 ID 집합 (Redis 집합 -> 없거나 일부만 있으면 DB에서 다시 적재)
+    """
+    redis_client = current_app.redis_client
+    key = BOOKMARK_SET_KEY.format(user_id=user_id)
+    members = redis_client.smembers(key)
+    record_cache('bookmarks', BOOKMARK_SET_LOADED in members)
+
+    if BOOKMARK_SET_LOADED not in members:
+        members = {str(job_post_id) for (job_post_id,) in
+                   db.session.query(Bookmark.job_post_id).filter_by(user_id=user_id)}
+        pipe = redis_client.pipeline()
+        pipe.delete(key)
+        pipe.sadd(key, BOOKMARK_SET_LOADED, *members)
+        pipe.expire(key, current_app.config['BOOKMARK_SET_TTL'])
+        pipe.execute()
+
+    return {int(member) for member in members if member != BOOKMARK_SET_LOADED}
+
+
+def invalidate_bookmark_set(user_id):
+    """
+    회원 탈퇴 시 북마크 집합 삭제
+    """
+    current_app.redis_client.delete(BOOKMARK_SET_KEY.format(user_id=user_id))
+
+
+def mark_bookmarked(jobs):
+    """
+    공고 목록(dict)에 현재 사용자의 북마크 여부(is_bookmarked) 추가 (비로그인 시 모두 False)
+    - 공유 캐시에 저장된 목록에도 요청마다 적용할 수 있도록 Redis 집합 1회 조회로 처리
+    - 공고 목록은 토큰 없이도 조회할 수 있으므로 토큰이 만료되었거나 유효하지 않으면 비로그인으로 처리
+      (Redis 장애로 폐기 여부를 확인할 수 없는 경우도 비로그인으로 처리하고 DB 조회는 그대로 진행)
+    """
+    try:
+        verify_jwt_in_request(optional=True)
+        user_id = current_user_id() if get_jwt_identity() else None
+    except (JWTExtendedException, PyJWTError, ServiceUnavailableError):
+        user_id = None
+    bookmarked = bookmarked_job_ids(user_id) if user_id is not None else set()
+    for job in jobs:
+        job['is_bookmarked'] = job['job_post_id'] in bookmarked
+    return jobs
@@ -0,0 +1,168 @@
+import threading
+import time
+from redis import Redis, ConnectionPool
+from redis.client import Pipeline
+from redis.exceptions import RedisError, ConnectionError as RedisConnectionError, TimeoutError as RedisTimeoutError
+from ..error_log import metrics
+
+# 연결 실패로 간주하는 예외 (그 외 명령 오류는 그대로 전달)
+REDIS_UNAVAILABLE_ERRORS = (RedisConnectionError, RedisTimeoutError)
+
+# 실패/차단 시 None 대신 돌려줄 빈 결과 (호출한 쪽이 캐시 미스와 같은 경로로 처리하도록)
+REDIS_EMPTY_RESULTS = {
+    'smembers': lambda *args, **kwargs: set(),
+    'hgetall': lambda *args, **kwargs: {},
+    'smismember': lambda name, values, *args, **kwargs: [0] * len(values),
+    'mget': lambda keys, *args, **kwargs: [None] * len(keys),
+    'exists': lambda *args, **kwargs: 0,
+}
+
+
+class CircuitBreaker:
+    """
+    연속 실패가 failure_threshold번 쌓이면 reset_timeout초 동안 요청을 차단 (closed -> open -> half_open)
+    """
+
+    def __init__(self, failure_threshold=5, reset_timeout=30):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.state = 'closed'
+        self.failures = 0
+        self.opened_at = 0.0
+        self._lock = threading.Lock()
+
+    def allow(self):
+        """
+        요청을 보내도 되는지 확인 (open 상태에서 reset_timeout이 지나면 시험 요청 1개 허용)
+        - 시험 요청 결과가 기록되지 않은 채 reset_timeout이 지나면 다시 시험 요청 허용 (half_open에 멈추지 않도록)
+        """
+        with self._lock:
+            if self.state in ('open', 'half_open') and time.monotonic() - self.opened_at >= self.reset_timeout:
+                self.state = 'half_open'
+                self.opened_at = time.monotonic()
+                return True
+            return self.state == 'closed'
+
+    def record_success(self):
+        with self._lock:
+            self.state = 'closed'
+            self.failures = 0
+
+    def record_failure(self):
+        with self._lock:
+            self.failures += 1
+            if self.state == 'half_open' or self.failures >= self.failure_threshold:
+                if self.state != 'open':
+                    metrics.inc('redis_circuit_opened')
+                self.state = 'open'
+                self.opened_at = time.monotonic()
+
+    def stats(self):
+        return {'state': self.state, 'failures': self.failures}
+
+
+class ResilientRedis:
+    """
+    redis.Redis 래퍼: 연결 실패나 회로 차단 중에는 예외 대신 None(또는 빈 결과)을 반환
+    - 캐시 조회는 미스로 처리되어 DB로 바로 넘어가고, 캐시 저장/삭제는 건너뜀
+    """
+
+    def __init__(self, client, breaker=None, logger=None):
+        self.client = client
+        self.breaker = breaker or CircuitBreaker()
+        self.logger = logger
+
+    def call(self, name, func, *args, **kwargs):
+        try:
+            return self._call(name, func, *args, **kwargs)
+        except REDIS_UNAVAILABLE_ERRORS:
+            return self._empty(name, *args, **kwargs)
+
+    def call_strict(self, name, *args, **kwargs):
+        """
+        빈 결과 대신 연결 오류를 그대로 올리는 호출 (토큰 폐기 확인처럼 실패를 허용하면 안 되는 조회용)
+        """
+        return self._call(name, getattr(self.client, name), *args, **kwargs)
+
+    def _call(self, name, func, *args, **kwargs):
+        if not self.breaker.allow():
+            metrics.inc('redis_short_circuited')
+            raise RedisConnectionError(f"Redis circuit open ({name})")
+        try:
+            result = func(*args, **kwargs)
+        except REDIS_UNAVAILABLE_ERRORS as e:
+            self.breaker.record_failure()
+            metrics.inc('redis_errors')
+            if self.logger:
+                self.logger.warning(f"Redis unavailable, bypassing cache ({name}): {str(e)}")
+            raise
+        except RedisError:
+            # 서버가 응답한 명령 오류 (NoScriptError, ReadOnlyError 등): 연결은 정상이므로 회로는 닫고 예외 전달
+            self.breaker.record_success()
+            raise
+        self.breaker.record_success()
+        return result
+
+    @staticmethod
+    def _empty(name, *args, **kwargs):
+        empty = REDIS_EMPTY_RESULTS.get(name)
+        return empty(*args, **kwargs) if empty else None
+
+    def __getattr__(self, name):
+        attr = getattr(self.client, name)
+        if not callable(attr):
+            return attr
+
+        def guarded(*args, **kwargs):
+            return self.call(name, attr, *args, **kwargs)
+        return guarded
+
+    def pipeline(self, transaction=True, shard_hint=None):
+        return ResilientPipeline(self, transaction, shard_hint)
+
+    def register_script(self, script):
+        return self.client.register_script(script)
+
+    def scan_iter(self, *args, **kwargs):
+        keys = self.call('scan_iter', lambda: list(self.client.scan_iter(*args, **kwargs)))
+        return iter(keys or [])
+
+
+class ResilientPipeline(Pipeline):
+    """
+    실행 실패/회로 차단 시 명령 수만큼 None을 돌려주는 파이프라인 (Lua 스크립트 등록 등은 기존 Pipeline과 동일)
+    """
+
+    def __init__(self, resilient, transaction, shard_hint):
+        client = resilient.client
+        super().__init__(client.connection_pool, client.response_callbacks, transaction, shard_hint)
+        self.resilient = resilient
+
+    def execute(self, raise_on_error=True):
+        size = len(self.command_stack)
+        result = self.resilient.call('pipeline', super().execute, raise_on_error)
+        if result is None:
+            self.reset()
+            return [None] * size
+        return result
+
+
+def create_redis_client(config, logger=None):
+    """
+    설정값으로 커넥션 풀/타임아웃/회로 차단기를 갖춘 Redis 클라이언트 생성
+    """
+    pool = ConnectionPool(
+        host=config['REDIS_HOST'],
+        port=config['REDIS_PORT'],
+        db=config['REDIS_DB'],
+        password=config['REDIS_PASSWORD'],
+        decode_responses=True,
+        max_connections=config['REDIS_MAX_CONNECTIONS'],
+        socket_timeout=config['REDIS_SOCKET_TIMEOUT'],
+        socket_connect_timeout=config['REDIS_CONNECT_TIMEOUT'],
+        health_check_interval=30,
+    )
+    breaker = CircuitBreaker(config['REDIS_BREAKER_THRESHOLD'], config['REDIS_BREAKER_RESET'])
+    metrics.gauge('redis_circuit_open', lambda: int(breaker.state != 'closed'))
+    metrics.gauge('redis_circuit_failures', lambda: breaker.failures)
+    return ResilientRedis(Redis(connection_pool=pool), breaker, logger)
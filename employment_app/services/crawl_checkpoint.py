@@ -0,0 +1,70 @@
+from urllib.parse import urlparse, parse_qs
+from datetime import datetime
+
+
+def extract_posting_id(record):
+    """
+    채용공고 레코드의 공고 링크에서 사람인 공고 번호(rec_idx)를 추출
+    """
+    link = record.get('공고 링크') or ''
+    rec_idx = parse_qs(urlparse(link).query).get('rec_idx')
+    return rec_idx[0] if rec_idx else link
+
+
+class CrawlCheckpoint:
+    """
+    키워드별 증분 크롤링 체크포인트 (Redis)
+    - crawl_seen_{keyword}: 이미 저장한 공고 번호 집합
+    - crawl_checkpoint_{keyword}: 최신 작성날짜(high-water mark) 및 마지막 실행 시각
+    """
+
+    def __init__(self, redis_client, keyword, ttl=None):
+        self.redis = redis_client
+        self.keyword = keyword
+        self.ttl = ttl
+        self.seen_key = f"crawl_seen_{keyword}"
+        self.meta_key = f"crawl_checkpoint_{keyword}"
+
+    def filter_new(self, records):
+        """
+        이미 저장된 공고를 제외한 레코드만 반환
+        """
+        if not records:
+            return []
+        ids = [extract_posting_id(record) for record in records]
+        seen_flags = self.redis.smismember(self.seen_key, ids)
+        return [record for record, seen in zip(records, seen_flags) if not seen]
+
+    def mark_seen(self, records):
+        """
+        저장이 끝난 공고를 체크포인트에 기록 (high-water mark 갱신 포함)
+        """
+        if not records:
+            return
+        ids = [extract_posting_id(record) for record in records]
+        posted_dates = [record['작성날짜'] for record in records if record.get('작성날짜')]
+
+        pipe = self.redis.pipeline()
+        pipe.sadd(self.seen_key, *ids)
+        if self.ttl:
+            pipe.expire(self.seen_key, self.ttl)
+        pipe.hset(self.meta_key, 'last_run', datetime.now().isoformat())
+        pipe.hget(self.meta_key, 'latest_posted_date')
+        results = pipe.execute()
+
+        latest = max(posted_dates).isoformat() if posted_dates else None
+        current = results[-1]
+        if latest and (not current or latest > current):
+            self.redis.hset(self.meta_key, 'latest_posted_date', latest)
+
+    def high_water_mark(self):
+        """
+        지금까지 저장한 공고 중 가장 최신 작성날짜
+        """
+        return self.redis.hget(self.meta_key, 'latest_posted_date')
+
+    def reset(self):
+        """
+        체크포인트 초기화 (다음 실행 시 전체 재크롤링)
+        """
+        self.redis.delete(self.seen_key, self.meta_key)
@@ -1,14 +1,19 @@
-import requests
-from bs4 import BeautifulSoup
-import pandas as pd
 import time
+from .saramin_parser import CompanyInfoParser
+from .crawl_stats import CrawlStats
 
-def crawl_company_info(company_name, link):
+def crawl_company_info(company_name, link, parser='auto', delay=1, stats=None):
     """
     사람인 회사 정보를 크롤링하는 함수
+    (parser: 'auto', 'selectolax', 'lxml', 'html.parser' 중 HTML 파서 백엔드)
+    (delay: 요청 후 대기 시간, stats: 단계별 소요 시간 집계용 CrawlStats)
     """
 
+    import requests  # 크롤링할 때만 로드 (앱 시작 시간 단축)
+
     company_info = []
+    parser = CompanyInfoParser(parser)
+    stats = stats or CrawlStats()
     headers = {
         'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
     }
@@ -16,8 +21,10 @@ def crawl_company_info(company_name, link):
     url = f"{link}"
 
     try:
-        response = requests.get(url, headers=headers)
-        
+        with stats.measure('fetch'):
+            response = requests.get(url, headers=headers)
+        stats.pages += 1
+
         # 404 에러 처리
         if response.status_code == 404:
             print(f"{company_name} 페이지가 존재하지 않습니다. 모든 정보는 None으로 저장됩니다.")
@@ -32,52 +39,13 @@ def crawl_company_info(company_name, link):
             return company_info
         
         response.raise_for_status()
-        soup = BeautifulSoup(response.text, 'html.parser')
-
-        # 회사 정보 가져오기
-        company_infos = soup.select('.area_company_infos')
-
-        for company in company_infos:
-            try:
-                # 기업 형태
-                company_summary_tit = company.select('.company_summary_tit')
-                if len(company_summary_tit) > 1:  # [1]이 있는지 확인
-                    company_type = company_summary_tit[1].text.strip()
-                    if company_type.endswith("명"):
-                        company_type = None
-                else:
-                    company_type = None
-
-                # 업종
-                industry = soup.find('dt', string='업종')
-                industry = industry.find_next('dd').get_text(strip=True) if industry else '정보 없음'
-
-                # 홈페이지
-                website = soup.find('dt', string='홈페이지')
-                website = website.find_next('dd').find('a')['href'] if website else '정보 없음'
-
-                # 주소
-                address = soup.find('dt', string='주소')
-                address = address.find_next('dd').find('p', class_='ellipsis').get_text(strip=True) if address else '정보 없음'
-
-                # 기업 설명
-                introduce = company.select_one('.company_introduce').text.strip() if company.select_one('.company_introduce') else '정보 없음'
-
-                company_info.append({
-                    '회사명': company_name,
-                    '기업 형태': company_type,
-                    '업종': industry,
-                    '홈페이지': website,
-                    '주소': address,
-                    '기업 설명': introduce,
-                })
-
-            except AttributeError as e:
-                print(f"항목 파싱 중 에러 발생: {e}")
-                continue
+        with stats.measure('parse'):
+            company_info.extend(parser.parse(response.text, company_name))
+        stats.records += len(company_info)
 
         print(f"{company_name} 정보 크롤링 완료")
-        time.sleep(1)  # 서버 부하 방지를 위한 딜레이
+        if delay:
+            time.sleep(delay)  # 서버 부하 방지를 위한 딜레이
 
     except requests.RequestException as e:
         print(f"페이지 요청 중 에러 발생: {e}")
@@ -1,144 +1,66 @@
-import requests
-from bs4 import BeautifulSoup
-import pandas as pd
 import time
-from datetime import datetime
+from .saramin_parser import SARAMIN_BASE_URL, JobPostParser
+from .crawl_checkpoint import extract_posting_id
+from .crawl_stats import CrawlStats
 
 
-def crawl_job_posts(keyword, pages=1):
+def crawl_job_posts(keyword, pages=1, parser='auto', checkpoint=None, max_pages=None,
+                    base_url=SARAMIN_BASE_URL, delay=1, stats=None):
     """
     사람인 채용공고를 크롤링하는 함수
+    (parser: 'auto', 'selectolax', 'lxml', 'html.parser' 중 HTML 파서 백엔드)
+    (base_url / delay: 요청 대상 주소 및 페이지 간 대기 시간, stats: 단계별 소요 시간 집계용 CrawlStats)
+
+    checkpoint(CrawlCheckpoint)가 주어지면 증분 모드로 동작하여,
+    이미 저장한 공고만 있는 페이지를 만나면 페이징을 중단하고 새 공고만 반환합니다.
+    (증분 모드에서는 pages 대신 max_pages를 최대 페이지 수로 사용)
     """
 
+    import requests  # 크롤링할 때만 로드 (앱 시작 시간 단축)
+
     jobs = []
+    incremental = checkpoint is not None
+    if incremental:
+        pages = max_pages or pages
+    parser = JobPostParser(parser, base_url=base_url)
+    stats = stats or CrawlStats()
     headers = {
         'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
     }
 
     for page in range(1, pages + 1):
-        url = f"https://www.saramin.co.kr/zf_user/search/recruit?searchType=search&searchword={keyword}&recruitPage={page}"
+        url = f"{base_url}/zf_user/search/recruit?searchType=search&searchword={keyword}&recruitPage={page}"
 
         try:
-            response = requests.get(url, headers=headers)
-            response.raise_for_status()
-            soup = BeautifulSoup(response.text, 'html.parser')
-
-            # 채용공고 목록 가져오기
-            job_listings = soup.select('.item_recruit')
-
-            for job in job_listings:
-                try:
-                    # 회사명 - 수정된 부분
-                    company = job.select_one('.corp_name a').text.strip()
-
-                    # 회사 정보 링크
-                    company_info = 'https://www.saramin.co.kr' + job.select_one('.corp_name a')['href']
-
-                    # 채용 제목
-                    title = job.select_one('.job_tit a').text.strip()
-
-                    # 채용 링크
-                    post_link = 'https://www.saramin.co.kr' + job.select_one('.job_tit a')['href']
-
-                    # 지역, 경력, 학력, 고용형태, 연봉정보
-                    conditions = job.select('.job_condition span')
-                    location = conditions[0].text.strip() if len(conditions) > 0 else ''
-                    career_level = conditions[1].text.strip() if len(conditions) > 1 else ''
-                    education = conditions[2].text.strip() if len(conditions) > 2 else ''
-                    employment_type = conditions[3].text.strip() if len(conditions) > 3 else ''
-                    salary_range = conditions[4].text.strip() if len(conditions) > 4 else ''
-
-                    # 마감일
-                    deadline = job.select_one('.job_date .date').text.strip()
-
-                    # 직무 분야
-                    job_sectors = job.select_one('.job_sector')
-                    sector_text = job_sectors.text.strip() if job_sectors else ''
-
-                    if '수정일' in sector_text:
-                        job_sector = sector_text.split('수정일')[0].strip()
-                        posted_date = sector_text.split('수정일')[1].strip()
-                    elif '등록일' in sector_text:
-                        job_sector = sector_text.split('등록일')[0].strip()
-                        posted_date = sector_text.split('등록일')[1].strip()
-                    else:
-                        job_sector = sector_text
-                        posted_date = ''
-
-                    # 기술 리스트로 분리
-                    if job_sector:
-                        job_sector = [skill.strip(',').strip() for skill in job_sector.split()]
-                    else:
-                        job_sector = []
-
-
-                    # posted_date에서 날짜 부분만 추출 (예: "24/11/25")
-                    if posted_date and len(posted_date) >= 8:
-                        try:
-                            posted_date = datetime.strptime(posted_date[-8:], "%y/%m/%d").date()
-                        except ValueError:
-                            posted_date = None
-                    else:
-                        posted_date = None
-
-                    # 트렌드 키워드 정보 (있는 경우)
-                    trend_badge = job.select_one('.area_badge .badge')
-                    trend_keywords = trend_badge.text.strip() if trend_badge else ''
-
-                    # 마감일 & 상태 처리
-                    today = datetime.today().date()
-
-                    if deadline:
-                        # '~ 12/27(금)' -> '12/27'
-                        deadline = deadline.split(' ')[-1].split('(')[0].strip()
-                        try:
-                            # '12/27' -> datetime 객체로 변환
-                            deadline_date = datetime.strptime(deadline, "%m/%d").date()
-                            
-                            # 연도 보정
-                            if posted_date and deadline_date.month < posted_date.month:
-                                # 마감일이 게시일보다 이전이라면 다음 해로 설정
-                                deadline_date = deadline_date.replace(year=today.year + 1)
-                            else:
-                                deadline_date = deadline_date.replace(year=today.year)
-
-                            deadline = deadline_date
-                        except ValueError:
-                            deadline = None
-                    else:
-                        deadline = None
-
-                    # 상태 처리: 마감일이 지나지 않았으면 open, 지났으면 closed
-                    status = 'closed' if deadline and deadline < today else 'open'
-
-                    jobs.append({
-                        '회사명': company,
-                        '트렌드_키워드': trend_keywords,
-                        '제목': title,
-                        '공고 링크': post_link,
-                        '지역': location,
-                        '경력': career_level,
-                        '학력': education,
-                        '고용형태': employment_type,
-                        '마감일': deadline,
-                        '연봉정보': salary_range,
-                        '작성날짜': posted_date,
-                        '상태': status,
-                        '직무분야': job_sector,
-                        '회사 정보': company_info
-                    })
-
-                except AttributeError as e:
-                    print(f"항목 파싱 중 에러 발생: {e}")
-                    continue
+            with stats.measure('fetch'):
+                response = requests.get(url, headers=headers)
+                response.raise_for_status()
+            with stats.measure('parse'):
+                page_jobs = parser.parse(response.text)
+            stats.pages += 1
+
+            if incremental:
+                # 이번 실행에서 이미 수집했거나 이전에 저장한 공고 제외
+                collected = {extract_posting_id(job) for job in jobs}
+                new_jobs = [job for job in checkpoint.filter_new(page_jobs) if extract_posting_id(job) not in collected]
+                jobs.extend(new_jobs)
+
+                if not new_jobs:
+                    print(f"{page}페이지에 새 공고가 없어 증분 크롤링을 종료합니다.")
+                    break
+            else:
+                jobs.extend(page_jobs)
 
             print(f"{page}페이지 크롤링 완료")
-            time.sleep(1)  # 서버 부하 방지를 위한 딜레이
+            if delay:
+                time.sleep(delay)  # 서버 부하 방지를 위한 딜레이
 
         except requests.RequestException as e:
             print(f"페이지 요청 중 에러 발생: {e}")
             continue
 
+    stats.records += len(jobs)
+
     # return pd.DataFrame(jobs)
     return jobs
 
@@ -0,0 +1,150 @@
+import multiprocessing
+import queue
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor
+from .saramin_parser import SARAMIN_BASE_URL, JobPostParser
+from .crawl_stats import CrawlStats
+
+# 단계 종료 표시
+_DONE = object()
+
+# 파싱 프로세스별 파서 캐시 (백엔드, 기본 주소) -> JobPostParser
+_parsers = {}
+
+
+def parse_job_page(content, backend, base_url):
+    """
+    파싱 프로세스에서 실행: 원본 HTML 바이트 -> (채용공고 레코드 목록, 파싱 소요 시간)
+    """
+    start = time.perf_counter()
+    parser = _parsers.get((backend, base_url))
+    if parser is None:
+        parser = _parsers[(backend, base_url)] = JobPostParser(backend, base_url=base_url)
+    records = parser.parse(content.decode('utf-8', errors='replace'))
+    return records, time.perf_counter() - start
+
+
+def run_crawl_pipeline(keyword, pages, persist, parser='auto', checkpoint=None, base_url=SARAMIN_BASE_URL,
+                       fetch_workers=4, parse_workers=None, queue_size=8, delay=0, stats=None):
+    """
+    fetch -> parse -> persist 3단계 크롤링 파이프라인
+
+    - fetch: fetch_workers개의 스레드가 검색 결과 페이지를 받아 원본 HTML 바이트를 fetch 큐에 적재
+    - parse: ProcessPoolExecutor(parse_workers)에서 HTML을 레코드(dict)로 변환 (GIL 우회, 멀티 코어 사용)
+    - persist: 호출한 스레드에서 페이지 단위로 persist(records) 호출 (앱 컨텍스트/DB 세션 사용)
+
+    두 큐 모두 queue_size로 제한되어 있어 저장이 밀리면 파싱과 다운로드도 함께 대기(backpressure)하므로,
+    페이지 수와 관계없이 메모리에 올라가는 HTML/레코드는 약 2 * queue_size 페이지로 제한됩니다.
+    checkpoint가 주어지면 새 공고가 없는 페이지에서 이후 페이지 다운로드를 중단합니다.
+    (페이지는 여러 스레드에서 동시에 받으므로 중단은 그 페이지보다 뒤 번호에만 적용하고, 앞 번호 페이지는 끝까지 처리)
+    """
+    import requests  # 크롤링할 때만 로드 (앱 시작 시간 단축)
+
+    stats = stats or CrawlStats()
+    fetch_queue = queue.Queue(maxsize=queue_size)
+    parsed_queue = queue.Queue(maxsize=queue_size)
+    abort = threading.Event()  # 저장 단계 오류 시 전체 중단
+    page_numbers = iter(range(1, pages + 1))
+    page_lock = threading.Lock()
+    stop_page = [None]  # 마지막 페이지 또는 새 공고가 없는 페이지 중 가장 앞 번호
+
+    def set_stop_page(page):
+        with page_lock:
+            if stop_page[0] is None or page < stop_page[0]:
+                stop_page[0] = page
+
+    def after_stop_page(page):
+        current = stop_page[0]
+        return current is not None and page > current
+    headers = {
+        'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
+    }
+
+    def fetch_worker():
+        session = requests.Session()
+        try:
+            while not abort.is_set():
+                with page_lock:
+                    page = next(page_numbers, None)
+                if page is None or after_stop_page(page):
+                    break  # 이후 번호는 모두 중단 페이지 뒤
+
+                url = f"{base_url}/zf_user/search/recruit?searchType=search&searchword={keyword}&recruitPage={page}"
+                try:
+                    with stats.measure('fetch'):
+                        response = session.get(url, headers=headers, timeout=30)
+                        response.raise_for_status()
+                    fetch_queue.put((page, response.content))
+                except requests.RequestException as e:
+                    print(f"{page}페이지 요청 중 에러 발생: {e}")
+
+                if delay:
+                    time.sleep(delay)  # 서버 부하 방지를 위한 딜레이
+        finally:
+            session.close()
+            fetch_queue.put(_DONE)
+
+    def dispatch_worker(executor):
+        finished = 0
+        while finished < fetch_workers:
+            item = fetch_queue.get()
+            if item is _DONE:
+                finished += 1
+                continue
+            page, content = item
+            if abort.is_set() or after_stop_page(page):
+                continue  # 중단 페이지보다 뒤 번호는 폐기
+            parsed_queue.put((page, executor.submit(parse_job_page, content, parser, base_url)))
+        parsed_queue.put(_DONE)
+
+    # 스레드가 있는 프로세스에서 fork하지 않도록 spawn 방식으로 파싱 프로세스 생성
+    executor = ProcessPoolExecutor(max_workers=parse_workers, mp_context=multiprocessing.get_context('spawn'))
+    threads = [threading.Thread(target=fetch_worker, daemon=True) for _ in range(fetch_workers)]
+    threads.append(threading.Thread(target=dispatch_worker, args=(executor,), daemon=True))
+    for thread in threads:
+        thread.start()
+
+    done = False
+    try:
+        while True:
+            item = parsed_queue.get()
+            if item is _DONE:
+                done = True
+                break
+
+            page, future = item
+            if after_stop_page(page):
+                future.cancel()
+                continue
+
+            records, parse_seconds = future.result()
+            stats.add('parse', parse_seconds, pages=1)
+
+            if not records:
+                set_stop_page(page)  # 검색 결과의 마지막 페이지
+                continue
+
+            if checkpoint is not None:
+                records = checkpoint.filter_new(records)
+                if not records:
+                    print(f"{page}페이지에 새 공고가 없어 증분 크롤링을 종료합니다.")
+                    set_stop_page(page)
+                    continue
+
+            persist(records)
+            stats.records += len(records)
+            if checkpoint is not None:
+                checkpoint.mark_seen(records)
+            print(f"{page}페이지 크롤링 완료")
+    finally:
+        if not done:
+            # 저장 단계 오류 시 남은 단계를 정리 (대기 중인 스레드가 빠져나올 수 있도록 큐 비우기)
+            abort.set()
+            while parsed_queue.get() is not _DONE:
+                pass
+        for thread in threads:
+            thread.join()
+        executor.shutdown(cancel_futures=True)
+
+    return stats
@@ -0,0 +1,38 @@
+import threading
+import time
+from contextlib import contextmanager
+
+
+class CrawlStats:
+    """
+    크롤링 단계별(fetch / parse / db) 소요 시간 및 처리량 집계
+    """
+
+    def __init__(self):
+        self.pages = 0
+        self.records = 0
+        self.seconds = {'fetch': 0.0, 'parse': 0.0, 'db': 0.0}
+        self._lock = threading.Lock()  # 파이프라인의 여러 스레드에서 동시에 집계
+
+    @contextmanager
+    def measure(self, stage):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.add(stage, time.perf_counter() - start)
+
+    def add(self, stage, seconds, pages=0, records=0):
+        with self._lock:
+            self.seconds[stage] += seconds
+            self.pages += pages
+            self.records += records
+
+    def to_dict(self):
+        return {
+            'pages': self.pages,
+            'records': self.records,
+            'fetch_seconds': round(self.seconds['fetch'], 4),
+            'parse_seconds': round(self.seconds['parse'], 4),
+            'db_seconds': round(self.seconds['db'], 4),
+        }
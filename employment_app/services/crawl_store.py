@@ -0,0 +1,101 @@
+from ..models import db, Company, JobPosting
+from .service import update_skills_table, save_job_posting_skills
+from .crawl_stats import CrawlStats
+
+
+def build_company(company_info):
+    """
+    크롤링한 회사 정보 레코드로 Company 객체 생성
+    """
+    return Company(
+        name=company_info['회사명'],
+        company_type=company_info.get('기업 형태', '정보 없음'),
+        industry=company_info.get('업종', '정보 없음'),
+        website=company_info.get('홈페이지', '정보 없음'),
+        address=company_info.get('주소', '정보 없음'),
+        introduce=company_info.get('기업 설명', '정보 없음')
+    )
+
+# 크롤링한 회사 정보 저장
+def save_company_info(company_data, stats=None):
+    stats = stats or CrawlStats()
+    saved_companies = []
+
+    with stats.measure('db'):
+        for company in company_data:
+            existing_company = Company.query.filter_by(name=company['회사명']).first()
+
+            if not existing_company:
+                new_company = build_company(company)
+                db.session.add(new_company)
+                saved_companies.append(new_company)
+                db.session.commit()
+
+    return saved_companies
+
+# 크롤링한 채용 공고 저장
+def save_job_posts(job_data, fetch_company, stats=None):
+    """
+    채용 공고 레코드를 저장 (중복 공고는 건너뜀)
+    fetch_company(company_name, company_link): 저장되지 않은 회사의 정보를 크롤링하는 함수
+    """
+    stats = stats or CrawlStats()
+    saved_jobs = []
+
+    for job in job_data:
+        # 1. Company 테이블에 회사 이름 확인
+        with stats.measure('db'):
+            company = Company.query.filter_by(name=job['회사명']).first()
+
+        if not company:
+            # 회사가 없으면 회사 정보 크롤링
+            company_data = fetch_company(job['회사명'], job['회사 정보'])
+
+            if company_data:
+                with stats.measure('db'):
+                    company = build_company(company_data[0])
+                    db.session.add(company)
+                    db.session.commit()
+
+        if not company:
+            continue
+
+        with stats.measure('db'):
+            # 2. JobPosting 중복 확인
+            existing_posting = JobPosting.query.filter_by(
+                company_id=company.company_id,
+                title=job['제목']
+            ).first()
+
+            if existing_posting:
+                continue
+
+            # 3. JobPosting 테이블에 데이터 저장
+            posting = JobPosting(
+                company_id=company.company_id,
+                trend_keywords=job['트렌드_키워드'],
+                title=job['제목'],
+                link=job['공고 링크'],
+                location=job['지역'],
+                career_level=job['경력'],
+                education=job['학력'],
+                employment_type=job['고용형태'],
+                deadline=job['마감일'],
+                salary_range=job['연봉정보'],
+                posted_date=job['작성날짜'],
+                status=job['상태']
+            )
+            db.session.add(posting)
+            db.session.flush()
+
+            # skills 테이블 업데이트
+            update_skills_table([job['직무분야']])
+            save_job_posting_skills(posting.job_post_id, [job['직무분야']])
+
+        posting.company_name = company.name
+        saved_jobs.append(posting)
+
+    with stats.measure('db'):
+        db.session.commit()
+
+    return saved_jobs
@@ -0,0 +1,108 @@
+from flask import current_app, json
+from sqlalchemy import select, func
+from sqlalchemy.orm import joinedload
+from ..error_log import record_cache
+from ..extensions import ApplicationStatus
+from ..models import db, Application, Bookmark, Inquiry, JobPosting
+
+# 사용자별 마이페이지 캐시 키 (DASHBOARD_CACHE_TTL 초 후 만료, 해당 사용자의 북마크/지원/문의/회원 정보 변경 시 삭제)
+DASHBOARD_CACHE_KEY = 'user_dashboard_{user_id}'
+# 항목별 최근 내역 개수
+DASHBOARD_RECENT_LIMIT = 5
+
+
+def get_dashboard(user):
+    """
+    마이페이지 데이터 (Redis 캐시 -> 없으면 집계 후 캐시)
+    """
+    redis_client = current_app.redis_client
+    key = DASHBOARD_CACHE_KEY.format(user_id=user.user_id)
+    cached = redis_client.get(key)
+    record_cache('dashboard', bool(cached))
+    if cached:
+        return json.loads(cached)
+
+    dashboard = build_dashboard(user)
+    redis_client.set(key, json.dumps(dashboard), ex=current_app.config['DASHBOARD_CACHE_TTL'])
+    return dashboard
+
+
+def build_dashboard(user):
+    """
+    프로필, 지원 상태별 개수, 최근 북마크/지원/문의 집계 (항목 수와 무관하게 SQL 6회)
+    - 최근 내역은 job_post_id만 가져온 뒤 공고/회사 정보를 한 번에 조회해 공유 (같은 공고는 한 번만 포함)
+    """
+    user_id = user.user_id
+
+    # 지원 상태별 개수
+    status_counts = {status.value: 0 for status in ApplicationStatus}
+    status_counts.update(db.session.execute(
+        select(Application.status, func.count()).where(Application.user_id == user_id).group_by(Application.status)
+    ).all())
+
+    # 북마크/문의 개수
+    totals = db.session.execute(select(
+        select(func.count()).select_from(Bookmark).where(Bookmark.user_id == user_id).scalar_subquery(),
+        select(func.count()).select_from(Inquiry).where(Inquiry.user_id == user_id).scalar_subquery(),
+    )).one()
+
+    # 최근 내역 (공고 정보 제외)
+    bookmarks = _recent(
+        select(Bookmark.bookmark_id, Bookmark.job_post_id, Bookmark.created_at)
+        .where(Bookmark.user_id == user_id).order_by(Bookmark.created_at.desc())
+    )
+    applications = _recent(
+        select(Application.apply_id, Application.job_post_id, Application.status, Application.applied_at, Application.resume_url)
+        .where(Application.user_id == user_id).order_by(Application.applied_at.desc())
+    )
+    inquiries = _recent(
+        select(Inquiry.inquiry_id, Inquiry.job_post_id, Inquiry.title, Inquiry.message, Inquiry.created_at)
+        .where(Inquiry.user_id == user_id).order_by(Inquiry.created_at.desc())
+    )
+
+    # 최근 내역에 등장한 공고를 회사 정보와 함께 한 번에 조회
+    job_post_ids = {item['job_post_id'] for item in bookmarks + applications + inquiries}
+    job_postings = []
+    if job_post_ids:
+        job_postings = [
+            job.to_dict() for job in JobPosting.query.options(joinedload(JobPosting.company))
+            .filter(JobPosting.job_post_id.in_(job_post_ids)).order_by(JobPosting.job_post_id)
+        ]
+
+    return {
+        "user": {
+            "user_id": user.user_id,
+            "username": user.name,
+            "email": user.email,
+            "created_at": user.created_at.strftime("%Y-%m-%d %H:%M:%S"),
+        },
+        "counts": {
+            "applications": status_counts,
+            "bookmarks": totals[0],
+            "inquiries": totals[1],
+        },
+        "recent": {
+            "bookmarks": bookmarks,
+            "applications": applications,
+            "inquiries": inquiries,
+        },
+        "job_postings": job_postings,
+    }
+
+
+def _recent(stmt):
+    """
+    최근 DASHBOARD_RECENT_LIMIT개 행 -> dict 목록 (날짜는 ISO 문자열)
+    """
+    rows = db.session.execute(stmt.limit(DASHBOARD_RECENT_LIMIT)).mappings()
+    return [
+        {key: value.isoformat() if hasattr(value, 'isoformat') else value for key, value in row.items()}
+        for row in rows
+    ]
+
+
+def invalidate_dashboard(user_id):
+    """
+    사용자의 북마크/지원/문의/회원 정보가 바뀐 뒤 마이페이지 캐시 삭제
+    """
+    current_app.redis_client.delete(DASHBOARD_CACHE_KEY.format(user_id=user_id))
@@ -0,0 +1,52 @@
+from sqlalchemy import delete, func, select
+from ..models import db
+from ..error_log import InstrumentedQueuePool
+
+
+def engine_options(config):
+    """
+    DB_* 설정으로 SQLAlchemy 엔진 옵션 생성 (SQLALCHEMY_ENGINE_OPTIONS를 직접 지정하지 않은 경우)
+    - 메모리 SQLite는 풀 설정 없이 사용, application_name/statement_timeout은 PostgreSQL에서만 적용
+    """
+    uri = config['SQLALCHEMY_DATABASE_URI']
+    options = {'pool_pre_ping': config['DB_POOL_PRE_PING']}
+    if uri.startswith('sqlite') and (uri in ('sqlite://', 'sqlite:///') or ':memory:' in uri):
+        return options
+
+    options.update({
+        'poolclass': InstrumentedQueuePool,
+        'pool_size': config['DB_POOL_SIZE'],
+        'max_overflow': config['DB_MAX_OVERFLOW'],
+        'pool_timeout': config['DB_POOL_TIMEOUT'],
+        'pool_recycle': config['DB_POOL_RECYCLE'],
+    })
+    if uri.startswith('postgresql'):
+        connect_args = {'application_name': config['DB_APPLICATION_NAME']}
+        if config['DB_STATEMENT_TIMEOUT']:
+            connect_args['options'] = f"-c statement_timeout={config['DB_STATEMENT_TIMEOUT']}"
+        options['connect_args'] = connect_args
+    return options
+
+
+def dialect_insert(model):
+    """
+    현재 DB 방언의 INSERT 구문 생성 (ON CONFLICT DO NOTHING / RETURNING 사용 가능)
+    - PostgreSQL(운영), SQLite(벤치마크/테스트) 지원
+    """
+    dialect = db.session.get_bind().dialect.name
+    if dialect == 'postgresql':
+        from sqlalchemy.dialects.postgresql import insert
+    elif dialect == 'sqlite':
+        from sqlalchemy.dialects.sqlite import insert
+    else:
+        raise NotImplementedError(f"ON CONFLICT를 지원하지 않는 DB입니다: {dialect}")
+    return insert(model)
+
+
+def delete_duplicates(model, key_column, columns):
+    """
+    columns 값이 같은 행 중 key_column이 가장 작은 행만 남기고 삭제 (유니크 제약 추가 전 정리용, 호출한 쪽에서 commit)
+    -> 삭제된 행 수
+    """
+    keep = select(func.min(key_column)).group_by(*columns)
+    return db.session.execute(delete(model).where(key_column.not_in(keep))).rowcount
@@ -0,0 +1,194 @@
+from flask import current_app
+from sqlalchemy import delete, insert, func
+from ..error_log import record_cache
+from ..models import db, Application, Bookmark, Inquiry, JobEngagement
+from .db_service import dialect_insert
+
+# 공고별 지원자/북마크/문의 수 Redis 해시 (쓰기 경로에서 증감, `flask jobs flush-engagement`로 테이블에 저장)
+ENGAGEMENT_KEY = 'job_engagement_{job_post_id}'
+# 마지막 저장 이후 값이 바뀐 공고 ID 집합
+ENGAGEMENT_DIRTY_KEY = 'job_engagement_dirty'
+ENGAGEMENT_FIELDS = ['applications', 'bookmarks', 'inquiries']
+
+# 카운터 증감 (KEYS: 공고 해시, 변경 집합 / ARGV: 공고 ID, 항목, 증감값)
+# 해시가 없으면 0을 반환 (테이블 값으로 적재 후 다시 호출, 0부터 세면 이전 값이 사라지므로)
+ENGAGEMENT_INCR_LUA = """
+if redis.call('EXISTS', KEYS[1]) == 0 then
+    return 0
+end
+redis.call('HINCRBY', KEYS[1], ARGV[2], ARGV[3])
+redis.call('SADD', KEYS[2], ARGV[1])
+return 1
+"""
+
+_scripts = {}
+
+
+def _incr_script(redis_client):
+    script = _scripts.get('engagement_incr')
+    if script is None:
+        script = _scripts['engagement_incr'] = redis_client.register_script(ENGAGEMENT_INCR_LUA)
+    return script
+
+
+def record_engagement(job_post_ids, field, delta):
+    """
+    commit된 지원/북마크/문의 변경을 공고별 카운터에 반영 (파이프라인 1회, 처음 보는 공고만 테이블에서 적재)
+    """
+    if not job_post_ids:
+        return
+    redis_client = current_app.redis_client
+    script = _incr_script(redis_client)
+
+    def incr(ids):
+        pipe = redis_client.pipeline(transaction=False)
+        for job_post_id in ids:
+            script(keys=[ENGAGEMENT_KEY.format(job_post_id=job_post_id), ENGAGEMENT_DIRTY_KEY],
+                   args=[job_post_id, field, delta], client=pipe)
+        # 0: 해시가 없어 적재 필요 / None: Redis를 사용할 수 없어 건너뜀 (`flask jobs rebuild-engagement`로 보정)
+        return [job_post_id for job_post_id, applied in zip(ids, pipe.execute()) if applied == 0]
+
+    missing = incr(list(job_post_ids))
+    if missing:
+        _load_engagement(set(missing))
+        incr(missing)
+
+
+def get_engagement(job_post_ids):
+    """
+    여러 공고의 지원자/북마크/문의 수 (Redis 파이프라인 1회 + 없는 공고만 DB 1회)
+    """
+    job_post_ids = list(dict.fromkeys(job_post_ids))
+    if not job_post_ids:
+        return {}
+    pipe = current_app.redis_client.pipeline(transaction=False)
+    for job_post_id in job_post_ids:
+        pipe.hgetall(ENGAGEMENT_KEY.format(job_post_id=job_post_id))
+
+    counts = {
+        job_post_id: {field: int(values.get(field, 0)) for field in ENGAGEMENT_FIELDS}
+        for job_post_id, values in zip(job_post_ids, pipe.execute()) if values
+    }
+    missing = {job_post_id for job_post_id in job_post_ids if job_post_id not in counts}
+    record_cache('engagement', True, len(counts))
+    record_cache('engagement', False, len(missing))
+    if missing:
+        counts.update(_load_engagement(missing))
+    return counts
+
+
+def _load_engagement(job_post_ids):
+    """
+    job_engagement_counts 테이블 값을 Redis 해시로 적재 (HSETNX: 그 사이 증감된 값은 덮어쓰지 않음)
+    """
+    rows = {row.job_post_id: row for row in JobEngagement.query.filter(JobEngagement.job_post_id.in_(job_post_ids))}
+    counts = {}
+    pipe = current_app.redis_client.pipeline(transaction=False)
+    for job_post_id in job_post_ids:
+        row = rows.get(job_post_id)
+        counts[job_post_id] = {field: getattr(row, field) if row else 0 for field in ENGAGEMENT_FIELDS}
+        for field, value in counts[job_post_id].items():
+            pipe.hsetnx(ENGAGEMENT_KEY.format(job_post_id=job_post_id), field, value)
+    pipe.execute()
+    return counts
+
+
+def attach_engagement(jobs):
+    """
+    공고 목록(dict)에 지원자/북마크/문의 수(engagement) 추가
+    """
+    counts = get_engagement([job['job_post_id'] for job in jobs])
+    for job in jobs:
+        job['engagement'] = counts[job['job_post_id']]
+    return jobs
+
+
+def user_engagement(user_id):
+    """
+    사용자가 남긴 지원/북마크/문의의 공고 ID (회원 탈퇴 시 카운터 차감용)
+    """
+    return {
+        'applications': [job_post_id for (job_post_id,) in db.session.query(Application.job_post_id)
+                         .filter(Application.user_id == user_id, Application.status != 'cancelled')],
+        'bookmarks': [job_post_id for (job_post_id,) in db.session.query(Bookmark.job_post_id).filter_by(user_id=user_id)],
+        'inquiries': [job_post_id for (job_post_id,) in db.session.query(Inquiry.job_post_id).filter_by(user_id=user_id)],
+    }
+
+
+def forget_engagement(job_post_id):
+    """
+    공고 삭제 시 카운터 삭제 (테이블 행은 호출한 쪽에서 공고와 함께 삭제)
+    """
+    pipe = current_app.redis_client.pipeline()
+    pipe.delete(ENGAGEMENT_KEY.format(job_post_id=job_post_id))
+    pipe.srem(ENGAGEMENT_DIRTY_KEY, job_post_id)
+    pipe.execute()
+
+
+def flush_engagement(batch_size=500):
+    """
+    변경된 공고의 Redis 카운터를 job_engagement_counts 테이블에 저장 -> 저장한 공고 수
+    """
+    redis_client = current_app.redis_client
+    table = JobEngagement.__table__
+    flushed = 0
+
+    while True:
+        job_post_ids = redis_client.spop(ENGAGEMENT_DIRTY_KEY, batch_size)
+        if not job_post_ids:
+            break
+        pipe = redis_client.pipeline(transaction=False)
+        for job_post_id in job_post_ids:
+            pipe.hgetall(ENGAGEMENT_KEY.format(job_post_id=job_post_id))
+        rows = [
+            {'job_post_id': int(job_post_id), **{field: int(values.get(field, 0)) for field in ENGAGEMENT_FIELDS}}
+            for job_post_id, values in zip(job_post_ids, pipe.execute()) if values
+        ]
+        if not rows:
+            continue
+
+        stmt = dialect_insert(JobEngagement).values(rows)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=['job_post_id'],
+            set_={field: stmt.excluded[field] for field in ENGAGEMENT_FIELDS}
+        )
+        try:
+            db.session.execute(stmt)
+            db.session.commit()
+        except Exception:
+            # 저장하지 못한 공고는 다음 실행에서 다시 저장
+            db.session.rollback()
+            redis_client.sadd(ENGAGEMENT_DIRTY_KEY, *job_post_ids)
+            raise
+        flushed += len(rows)
+
+    return flushed
+
+
+def rebuild_engagement():
+    """
+    applications/bookmarks/inquiries 테이블로 job_engagement_counts 전체 재계산 및 Redis 카운터 초기화
+    -> 집계된 공고 수
+    """
+    grouped = {
+        'applications': db.session.query(Application.job_post_id, func.count())
+        .filter(Application.status != 'cancelled').group_by(Application.job_post_id),
+        'bookmarks': db.session.query(Bookmark.job_post_id, func.count()).group_by(Bookmark.job_post_id),
+        'inquiries': db.session.query(Inquiry.job_post_id, func.count()).group_by(Inquiry.job_post_id),
+    }
+    counts = {}
+    for field, query in grouped.items():
+        for job_post_id, count in query:
+            counts.setdefault(job_post_id, dict.fromkeys(ENGAGEMENT_FIELDS, 0))[field] = count
+
+    db.session.execute(delete(JobEngagement))
+    if counts:
+        db.session.execute(insert(JobEngagement), [
+            {'job_post_id': job_post_id, **values} for job_post_id, values in counts.items()
+        ])
+    db.session.commit()
+
+    redis_client = current_app.redis_client
+    keys = list(redis_client.scan_iter(match=ENGAGEMENT_KEY.format(job_post_id='*'), count=1000))
+    redis_client.delete(ENGAGEMENT_DIRTY_KEY, *keys)
+    return len(counts)
@@ -0,0 +1,79 @@
+from sqlalchemy import select, delete, insert, func, literal, union_all, String
+from ..models import db, JobPosting, Skill, JobPostingSkill, JobFacetCount
+from .job_service import apply_filters
+
+# 집계 대상 (기술 / 지역 / 트렌드 키워드)
+FACET_DIMENSIONS = ['skill', 'location', 'trend']
+
+
+def facet_counts_select(job_ids=None):
+    """
+    기술/지역/트렌드 키워드별 공고 수를 한 번에 구하는 UNION ALL 집계 쿼리
+    job_ids: 대상 공고 id SELECT (None이면 전체 공고)
+    """
+    def counts(dimension, value):
+        return select(
+            literal(dimension, String).label('dimension'),
+            value.label('value'),
+            func.count().label('count')
+        )
+
+    skill = counts('skill', Skill.name).select_from(JobPostingSkill) \
+        .join(Skill, JobPostingSkill.skill_id == Skill.skill_id)
+    if job_ids is not None:
+        skill = skill.where(JobPostingSkill.job_post_id.in_(job_ids))
+    grouped = [skill.group_by(Skill.name)]
+
+    for dimension, column in (('location', JobPosting.location), ('trend', JobPosting.trend_keywords)):
+        stmt = counts(dimension, column).where(column.isnot(None), column != '')
+        if job_ids is not None:
+            stmt = stmt.where(JobPosting.job_post_id.in_(job_ids))
+        grouped.append(stmt.group_by(column))
+
+    return union_all(*grouped)
+
+
+def group_facets(rows, limit):
+    """
+    (dimension, value, count) 행 -> {dimension: [{"value", "count"}, ...]} (공고 수 내림차순, 상위 limit개)
+    """
+    facets = {dimension: [] for dimension in FACET_DIMENSIONS}
+    for dimension, value, count in rows:
+        facets[dimension].append({"value": value, "count": count})
+    for dimension in facets:
+        facets[dimension].sort(key=lambda facet: (-facet["count"], facet["value"]))
+        facets[dimension] = facets[dimension][:limit]
+    return facets
+
+
+def compute_job_facets(filters, limit):
+    """
+    현재 필터 조건에 맞는 공고들의 집계 (단일 쿼리)
+    """
+    job_ids = None
+    if any(filters.values()):
+        filtered = apply_filters(db.session.query(JobPosting.job_post_id), filters).distinct().subquery()
+        job_ids = select(filtered.c.job_post_id)
+    rows = db.session.execute(facet_counts_select(job_ids)).all()
+    return group_facets(rows, limit)
+
+
+def load_materialized_facets(limit):
+    """
+    미리 집계해 둔 전체 공고 집계 조회 (아직 집계 전이면 None)
+    """
+    rows = db.session.execute(
+        select(JobFacetCount.dimension, JobFacetCount.value, JobFacetCount.count)
+    ).all()
+    return group_facets(rows, limit) if rows else None
+
+
+def refresh_job_facets():
+    """
+    전체 공고 집계 테이블(job_facet_counts) 재계산 (크롤링 후 호출)
+    """
+    db.session.execute(delete(JobFacetCount))
+    db.session.execute(
+        insert(JobFacetCount).from_select(['dimension', 'value', 'count'], facet_counts_select())
+    )
+    db.session.commit()
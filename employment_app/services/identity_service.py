@@ -0,0 +1,109 @@
+from datetime import datetime
+from flask import current_app, g, json
+from flask_jwt_extended import get_jwt, get_jwt_identity
+from ..error_log import record_cache
+from ..models import User
+
+# 사용자 캐시 키 (USER_CACHE_TTL 초 후 만료, 회원 정보 수정/삭제 시 즉시 삭제)
+USER_CACHE_KEY = 'user_cache_{user_id}'
+
+
+class CachedUser:
+    """
+    인증된 요청에서 사용하는 사용자 정보 (읽기 전용 스냅샷)
+    """
+
+    def __init__(self, user_id, email, name, created_at):
+        self.user_id = user_id
+        self.email = email
+        self.name = name
+        self.created_at = created_at
+
+    @classmethod
+    def from_model(cls, user):
+        return cls(user.user_id, user.email, user.name, user.created_at)
+
+    @classmethod
+    def from_cache(cls, raw):
+        data = json.loads(raw)
+        return cls(data['user_id'], data['email'], data['name'], datetime.fromisoformat(data['created_at']))
+
+    def to_cache(self):
+        return json.dumps({
+            'user_id': self.user_id,
+            'email': self.email,
+            'name': self.name,
+            'created_at': self.created_at.isoformat()
+        })
+
+
+def identity_claims(user):
+    """
+    토큰 발급 시 추가할 클레임 (요청마다 이메일 -> user_id 조회를 생략하기 위함)
+    """
+    return {'user_id': user.user_id}
+
+
+def cache_user(user):
+    """
+    사용자 정보를 Redis에 캐시 (USER_CACHE_TTL이 0이면 캐시하지 않음)
+    """
+    ttl = current_app.config['USER_CACHE_TTL']
+    if ttl:
+        cached = user if isinstance(user, CachedUser) else CachedUser.from_model(user)
+        current_app.redis_client.set(USER_CACHE_KEY.format(user_id=cached.user_id), cached.to_cache(), ex=ttl)
+
+
+def invalidate_user_cache(user_id):
+    """
+    회원 정보 수정/삭제 후 사용자 캐시 삭제
+    """
+    current_app.redis_client.delete(USER_CACHE_KEY.format(user_id=user_id))
+    g.pop('current_user', None)
+
+
+def current_user_id():
+    """
+    현재 토큰의 user_id (user_id 클레임이 없는 이전 토큰은 이메일로 조회)
+    """
+    user_id = get_jwt().get('user_id')
+    if user_id is not None:
+        return user_id
+    user = current_user()
+    return user.user_id if user else None
+
+
+def current_user():
+    """
+    현재 토큰의 사용자 (요청 내 g -> Redis 캐시 -> DB 순으로 조회, 없으면 None)
+    """
+    if 'current_user' in g:
+        return g.current_user
+
+    user = None
+    user_id = get_jwt().get('user_id')
+    if user_id is not None and current_app.config['USER_CACHE_TTL']:
+        raw = current_app.redis_client.get(USER_CACHE_KEY.format(user_id=user_id))
+        record_cache('user', bool(raw))
+        if raw:
+            user = CachedUser.from_cache(raw)
+
+    if user is None:
+        if user_id is not None:
+            row = User.query.get(user_id)
+        else:
+            row = User.query.filter_by(email=get_jwt_identity()).first()
+        if row:
+            user = CachedUser.from_model(row)
+            cache_user(user)
+
+    g.current_user = user
+    return user
+
+
+def current_user_model():
+    """
+    현재 토큰의 사용자 DB 객체 (회원 정보 수정/삭제처럼 행을 변경해야 하는 경우)
+    """
+    user = current_user()
+    return User.query.get(user.user_id) if user else None
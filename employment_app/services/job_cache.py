@@ -0,0 +1,36 @@
+from flask import current_app, json
+from ..error_log import record_cache
+
+# 채용 공고 목록 캐시 버전 (공고가 추가/수정/삭제되면 증가)
+JOB_CACHE_VERSION_KEY = 'job_cache_version'
+
+
+def job_cache_key(prefix, *parts):
+    """
+    채용 공고 목록/집계 캐시 키 (버전이 올라가면 이전 캐시는 더 이상 조회되지 않고 TTL로 만료)
+    """
+    version = current_app.redis_client.get(JOB_CACHE_VERSION_KEY) or 0
+    return f"{prefix}_v{version}_" + "_".join(str(part) for part in parts)
+
+
+def get_job_cache(cache_key):
+    """
+    채용 공고 캐시 조회 (없으면 None, 목록 종류별 적중/미스 집계)
+    """
+    cached = current_app.redis_client.get(cache_key)
+    record_cache(cache_key.split('_v', 1)[0], cached is not None)
+    return cached
+
+
+def set_job_cache(cache_key, value):
+    """
+    채용 공고 캐시 저장 (JOB_CACHE_TTL 후 만료)
+    """
+    current_app.redis_client.set(cache_key, json.dumps(value), ex=current_app.config['JOB_CACHE_TTL'])
+
+
+def invalidate_job_cache():
+    """
+    채용 공고 목록/검색/필터/정렬/집계 캐시 전체 무효화
+    """
+    current_app.redis_client.incr(JOB_CACHE_VERSION_KEY)
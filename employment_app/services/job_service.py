@@ -1,6 +1,7 @@
 from sqlalchemy import select
 from sqlalchemy.orm import aliased
 from ..models import db, JobPosting, Company, Skill, JobPostingSkill
+from .skill_normalizer import normalize_skills
 
 # 공통 함수 정의
 def apply_filters(query, filters):
@@ -32,7 +33,8 @@ def apply_filters(query, filters):
                 skill_alias.name.ilike(f"%{keyword}%")
             )
     if filters.get("skills"):
-        skills = [skill.strip() for skill in filters["skills"].split(",")]
+        # 별칭으로 검색해도 표준 기술명으로 매칭 (예: 파이썬 -> Python)
+        skills = normalize_skills(filters["skills"].split(","), split_unmatched=False)
         skill_alias = aliased(Skill)
         subquery = db.session.query(JobPostingSkill.job_post_id).join(skill_alias).filter(skill_alias.name.in_(skills)).subquery()
         query = query.filter(JobPosting.job_post_id.in_(select(subquery)))
@@ -0,0 +1,18 @@
+def cursor_paginate(query, id_column, cursor=None, limit=20):
+    """
+    키셋(커서) 페이지네이션: id 내림차순으로 cursor보다 작은 id부터 limit개 조회
+    -> (항목 목록, 다음 페이지 cursor 또는 None)
+    OFFSET 없이 인덱스 범위 조회만 하므로 테이블이 커져도 페이지 조회 비용이 일정함
+    """
+    if cursor:
+        query = query.filter(id_column < cursor)
+    items = query.order_by(id_column.desc()).limit(limit + 1).all()
+    next_cursor = getattr(items[limit - 1], id_column.key) if len(items) > limit else None
+    return items[:limit], next_cursor
+
+
+def cursor_pagination(next_cursor, limit):
+    """
+    커서 페이지네이션 응답 정보
+    """
+    return {"nextCursor": next_cursor, "limit": limit}
@@ -0,0 +1,67 @@
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from flask import current_app
+from ..extensions import bcrypt
+from ..error_log import ServiceUnavailableError
+
+
+class PasswordHasher:
+    """
+    bcrypt 해싱/검증 전용 스레드 풀
+    - 동시에 실행되는 해싱 수를 PASSWORD_HASH_WORKERS로 제한 (CPU를 해싱이 독점하지 않도록)
+    - 빈 슬롯을 PASSWORD_HASH_QUEUE_TIMEOUT초 안에 얻지 못하면 503 응답
+    - 워커 프로세스 fork 후 처음 사용할 때 풀을 새로 생성
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._pid = None
+        self._executor = None
+        self._slots = None
+
+    def _pool(self):
+        if self._pid != os.getpid():
+            with self._lock:
+                if self._pid != os.getpid():
+                    workers = current_app.config['PASSWORD_HASH_WORKERS'] or os.cpu_count() or 1
+                    self._executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix='bcrypt')
+                    self._slots = threading.BoundedSemaphore(workers)
+                    self._pid = os.getpid()
+        return self._executor, self._slots
+
+    def _run(self, func, *args):
+        executor, slots = self._pool()
+        if not slots.acquire(timeout=current_app.config['PASSWORD_HASH_QUEUE_TIMEOUT']):
+            current_app.logger.warning("Password hashing pool is saturated")
+            raise ServiceUnavailableError("요청이 많아 잠시 후 다시 시도해주세요.")
+        try:
+            return executor.submit(func, *args).result()
+        finally:
+            slots.release()
+
+    def hash(self, password):
+        """
+        비밀번호 해싱 (BCRYPT_LOG_ROUNDS 비용)
+        """
+        rounds = current_app.config['BCRYPT_LOG_ROUNDS']
+        return self._run(bcrypt.generate_password_hash, password, rounds).decode('utf-8')
+
+    def check(self, hashed, password):
+        """
+        비밀번호 검증
+        """
+        return self._run(bcrypt.check_password_hash, hashed, password)
+
+    def needs_rehash(self, hashed):
+        """
+        저장된 해시의 비용이 현재 설정(BCRYPT_LOG_ROUNDS)과 다른지 확인 ('$2b$12$...')
+        """
+        try:
+            return int(hashed.split('$')[2]) != current_app.config['BCRYPT_LOG_ROUNDS']
+        except (IndexError, ValueError):
+            return True
+
+
+# 프로세스 전역 비밀번호 해셔
+password_hasher = PasswordHasher()
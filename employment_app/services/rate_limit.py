@@ -0,0 +1,115 @@
+import math
+from functools import wraps
+from flask import current_app, request
+from flask_jwt_extended import get_jwt_identity
+from ..error_log import RateLimitError
+
+# 토큰 버킷 (KEYS: 버킷 키 목록, ARGV: 버킷 크기, 초당 충전량)
+# 모든 버킷에 토큰이 있을 때만 하나씩 차감 -> {허용 여부, 재시도까지 남은 초}
+TOKEN_BUCKET_LUA = """
+local capacity = tonumber(ARGV[1])
+local rate = tonumber(ARGV[2])
+local time = redis.call('TIME')
+local now = tonumber(time[1]) + tonumber(time[2]) / 1000000
+local ttl = math.ceil(capacity / rate) + 1
+local tokens = {}
+local retry_after = 0
+
+for i, key in ipairs(KEYS) do
+    local bucket = redis.call('HMGET', key, 'tokens', 'ts')
+    local current = tonumber(bucket[1]) or capacity
+    local ts = tonumber(bucket[2]) or now
+    current = math.min(capacity, current + math.max(0, now - ts) * rate)
+    tokens[i] = current
+    if current < 1 then
+        retry_after = math.max(retry_after, (1 - current) / rate)
+    end
+end
+
+local allowed = retry_after == 0
+for i, key in ipairs(KEYS) do
+    local current = tokens[i]
+    if allowed then
+        current = current - 1
+    end
+    redis.call('HSET', key, 'tokens', tostring(current), 'ts', tostring(now))
+    redis.call('EXPIRE', key, ttl)
+end
+
+if allowed then
+    return {1, '0'}
+end
+return {0, tostring(retry_after)}
+"""
+
+# 제한 단위 (초)
+RATE_LIMIT_PERIODS = {'second': 1, 'minute': 60, 'hour': 3600, 'day': 86400}
+
+_scripts = {}
+
+
+def parse_rate_limit(value):
+    """
+    '10/minute' -> (버킷 크기 10, 초당 충전량 10/60)
+    """
+    count, period = value.split('/')
+    return int(count), int(count) / RATE_LIMIT_PERIODS[period.strip()]
+
+
+def _client_ip():
+    # 프록시 뒤에서는 ProxyFix 등으로 remote_addr가 실제 클라이언트 주소가 되도록 설정
+    return request.remote_addr or 'unknown'
+
+
+def _identity():
+    """
+    인증된 요청은 토큰의 사용자, 로그인/회원가입은 요청한 이메일 기준
+    """
+    try:
+        identity = get_jwt_identity()  # jwt_required로 이미 검증된 요청
+    except RuntimeError:
+        identity = None
+    if identity is None:
+        identity = (request.get_json(silent=True) or {}).get('email')
+    return identity
+
+
+def rate_limit(name, scopes=('ip',)):
+    """
+    라우트별 요청 수 제한 (RATE_LIMIT_{NAME} 설정, 예: '10/minute')
+    scopes: 'ip'(클라이언트 주소별), 'identity'(사용자/이메일별) - 모든 범위의 버킷에 여유가 있어야 허용
+    초과 시 429 + Retry-After, Redis 장애 시에는 제한 없이 통과
+    """
+    config_key = f"RATE_LIMIT_{name.upper()}"
+
+    def decorator(func):
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            config = current_app.config
+            limit = config.get(config_key)
+            if not config['RATE_LIMIT_ENABLED'] or not limit:
+                return func(*args, **kwargs)
+
+            keys = [f"rate_limit_{name}_ip_{_client_ip()}"] if 'ip' in scopes else []
+            if 'identity' in scopes:
+                identity = _identity()
+                if identity:
+                    keys.append(f"rate_limit_{name}_id_{identity}")
+
+            capacity, refill_rate = parse_rate_limit(limit)
+            redis_client = current_app.redis_client
+            try:
+                script = _scripts.get('token_bucket')
+                if script is None:
+                    script = _scripts['token_bucket'] = redis_client.register_script(TOKEN_BUCKET_LUA)
+                allowed, retry_after = script(keys=keys, args=[capacity, refill_rate], client=redis_client)
+            except Exception as e:
+                current_app.logger.warning(f"Rate limiter unavailable, allowing request: {str(e)}")
+                return func(*args, **kwargs)
+
+            if not int(allowed):
+                current_app.logger.warning(f"Rate limit exceeded: {name} {keys}")
+                raise RateLimitError(retry_after=math.ceil(float(retry_after)))
+            return func(*args, **kwargs)
+        return wrapper
+    return decorator
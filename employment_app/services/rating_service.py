@@ -0,0 +1,109 @@
+from flask import current_app
+from sqlalchemy import select, update, delete, insert, func, case
+from ..models import db, Review, CompanyRating
+from .db_service import dialect_insert
+
+# 회사별 평점 요약 Redis 키 (company_ratings 테이블의 사본, 리뷰 작성/삭제 commit 후 삭제, RATING_CACHE_TTL 후 만료)
+RATING_CACHE_KEY = 'company_rating_{company_id}'
+RATING_FIELDS = ['review_count', 'rating_sum', 'rating_1', 'rating_2', 'rating_3', 'rating_4', 'rating_5']
+
+
+def _summary(company_id, values):
+    """
+    집계 값 -> 응답용 요약 (평균, 1~5점 분포)
+    """
+    rating = CompanyRating(company_id=company_id, **{field: int(values.get(field) or 0) for field in RATING_FIELDS})
+    return rating.to_dict()
+
+
+def apply_review_rating(company_id, rating, delta):
+    """
+    리뷰 작성(delta=1) / 삭제(delta=-1)를 회사 평점 집계에 반영 (호출한 쪽에서 commit)
+    -> 갱신된 집계 값 (집계 행이 없으면 None, commit 후 invalidate_company_rating 호출)
+    """
+    table = CompanyRating.__table__
+    bucket = f'rating_{rating}'
+    if delta > 0:
+        values = {field: 0 for field in RATING_FIELDS}
+        values.update({'company_id': company_id, 'review_count': 1, 'rating_sum': rating, bucket: 1})
+        stmt = dialect_insert(CompanyRating).values(values).on_conflict_do_update(
+            index_elements=['company_id'],
+            set_={
+                'review_count': table.c.review_count + 1,
+                'rating_sum': table.c.rating_sum + rating,
+                bucket: table.c[bucket] + 1,
+            }
+        )
+    else:
+        stmt = update(table).where(table.c.company_id == company_id).values({
+            'review_count': table.c.review_count - 1,
+            'rating_sum': table.c.rating_sum - rating,
+            bucket: table.c[bucket] - 1,
+        })
+    row = db.session.execute(stmt.returning(*[table.c[field] for field in RATING_FIELDS])).mappings().first()
+    return {'company_id': company_id, **row} if row else None
+
+
+def invalidate_company_rating(company_id):
+    """
+    commit 후 Redis 사본 삭제 (다음 조회 시 company_ratings 테이블에서 다시 적재)
+    - 동시에 commit된 리뷰들이 서로 다른 순서로 사본을 덮어써 이전 값이 남는 일이 없도록 값을 쓰지 않고 삭제만 함
+    """
+    current_app.redis_client.delete(RATING_CACHE_KEY.format(company_id=company_id))
+
+
+def _cache_company_rating(company_id, values):
+    # 조회 중 다른 요청이 commit 후 삭제한 사본을 이전 값으로 덮어쓸 수 있으므로 만료 시간으로 유지 기간 제한
+    key = RATING_CACHE_KEY.format(company_id=company_id)
+    pipe = current_app.redis_client.pipeline()
+    pipe.hset(key, mapping={field: values[field] for field in RATING_FIELDS})
+    pipe.expire(key, current_app.config['RATING_CACHE_TTL'])
+    pipe.execute()
+
+
+def get_company_rating(company_id):
+    """
+    회사 평점 요약 (Redis -> company_ratings 테이블 순으로 조회)
+    """
+    return get_company_ratings([company_id])[company_id]
+
+
+def get_company_ratings(company_ids):
+    """
+    여러 회사의 평점 요약을 한 번에 조회 (Redis 파이프라인 1회 + 없는 회사만 DB 1회)
+    """
+    company_ids = list(dict.fromkeys(company_ids))
+    pipe = current_app.redis_client.pipeline()
+    for company_id in company_ids:
+        pipe.hgetall(RATING_CACHE_KEY.format(company_id=company_id))
+    cached = dict(zip(company_ids, pipe.execute()))
+
+    summaries = {company_id: _summary(company_id, values) for company_id, values in cached.items() if values}
+    missing = [company_id for company_id in company_ids if company_id not in summaries]
+    if missing:
+        rows = {row.company_id: row for row in CompanyRating.query.filter(CompanyRating.company_id.in_(missing))}
+        for company_id in missing:
+            row = rows.get(company_id)
+            values = {field: getattr(row, field) for field in RATING_FIELDS} if row else {}
+            if row:
+                _cache_company_rating(company_id, values)
+            summaries[company_id] = _summary(company_id, values)
+    return summaries
+
+
+def rebuild_company_ratings():
+    """
+    reviews 테이블로 company_ratings 전체 재계산 및 Redis 사본 삭제 -> 집계된 회사 수
+    """
+    buckets = [func.sum(case((Review.rating == score, 1), else_=0)) for score in range(1, 6)]
+    grouped = select(Review.company_id, func.count(), func.sum(Review.rating), *buckets).group_by(Review.company_id)
+
+    db.session.execute(delete(CompanyRating))
+    db.session.execute(insert(CompanyRating).from_select(['company_id', *RATING_FIELDS], grouped))
+    db.session.commit()
+
+    redis_client = current_app.redis_client
+    keys = list(redis_client.scan_iter(match=RATING_CACHE_KEY.format(company_id='*'), count=1000))
+    if keys:
+        redis_client.delete(*keys)
+    return CompanyRating.query.count()
@@ -0,0 +1,289 @@
+from datetime import datetime
+
+from .skill_normalizer import normalize_skills
+
+# 사람인 기본 주소
+SARAMIN_BASE_URL = 'https://www.saramin.co.kr'
+
+# 빠른 순서대로 정렬된 파서 백엔드 목록 ('auto' 선택 시 사용 가능한 첫 번째 백엔드 사용)
+PARSER_BACKENDS = ['selectolax', 'lxml', 'html.parser']
+
+
+## 파서 백엔드 (HTML 트리 접근 방식만 담당)
+
+class SoupBackend:
+    """
+    BeautifulSoup 기반 백엔드 (html.parser / lxml)
+    """
+
+    def __init__(self, features='html.parser'):
+        from bs4 import BeautifulSoup
+        if features == 'lxml':
+            import lxml  # noqa: F401 (설치 여부 확인)
+        self.name = features
+        self._soup = BeautifulSoup
+
+    def parse(self, html):
+        return self._soup(html, self.name)
+
+    def select(self, node, selector):
+        return node.select(selector)
+
+    def select_one(self, node, selector):
+        return node.select_one(selector)
+
+    def text(self, node, strip=False):
+        return node.get_text(strip=strip)
+
+    def attr(self, node, name):
+        return node[name]
+
+    def find_dd(self, root, label):
+        # <dt>label</dt> 다음에 나오는 첫 번째 <dd>
+        dt = root.find('dt', string=label)
+        return dt.find_next('dd') if dt else None
+
+
+class SelectolaxBackend:
+    """
+    selectolax(lexbor) 기반 고속 백엔드
+    """
+
+    def __init__(self):
+        from selectolax.lexbor import LexborHTMLParser
+        self.name = 'selectolax'
+        self._parser = LexborHTMLParser
+
+    def parse(self, html):
+        return self._parser(html)
+
+    def select(self, node, selector):
+        return node.css(selector)
+
+    def select_one(self, node, selector):
+        return node.css_first(selector)
+
+    def text(self, node, strip=False):
+        return node.text(deep=True, separator='', strip=strip)
+
+    def attr(self, node, name):
+        return node.attributes[name]
+
+    def find_dd(self, root, label):
+        # 문서 순서상 <dt>label</dt> 뒤에 나오는 첫 번째 <dd> (BeautifulSoup의 find_next와 동일)
+        found = False
+        for node in root.css('dt, dd'):
+            if not found:
+                found = node.tag == 'dt' and node.text(deep=True) == label
+            elif node.tag == 'dd':
+                return node
+        return None
+
+
+def get_backend(name='auto'):
+    """
+    이름으로 파서 백엔드를 생성 ('auto'는 설치된 가장 빠른 백엔드 선택)
+    """
+    if name in (None, '', 'auto'):
+        for candidate in PARSER_BACKENDS:
+            try:
+                return get_backend(candidate)
+            except ImportError:
+                continue
+    if name == 'selectolax':
+        return SelectolaxBackend()
+    if name in ('lxml', 'html.parser'):
+        return SoupBackend(name)
+    raise ValueError(f"지원하지 않는 파서 백엔드입니다: {name}")
+
+
+## 공고/회사 정보 파서 (추출 로직, 백엔드와 무관하게 동일한 레코드 생성)
+
+class JobPostParser:
+    """
+    사람인 채용공고 검색 결과 페이지 파서
+    """
+
+    def __init__(self, backend='auto', base_url=SARAMIN_BASE_URL):
+        self.backend = backend if hasattr(backend, 'parse') else get_backend(backend)
+        self.base_url = base_url
+
+    def parse(self, html, today=None):
+        """
+        검색 결과 HTML에서 채용공고 레코드 목록을 추출
+        """
+        be = self.backend
+        root = be.parse(html)
+        jobs = []
+
+        for job in be.select(root, '.item_recruit'):
+            try:
+                # 회사명 / 회사 정보 링크
+                corp = be.select_one(job, '.corp_name a')
+                company = be.text(corp).strip()
+                company_info = self.base_url + be.attr(corp, 'href')
+
+                # 채용 제목 / 채용 링크
+                tit = be.select_one(job, '.job_tit a')
+                title = be.text(tit).strip()
+                post_link = self.base_url + be.attr(tit, 'href')
+
+                # 지역, 경력, 학력, 고용형태, 연봉정보
+                conditions = [be.text(span).strip() for span in be.select(job, '.job_condition span')]
+
+                # 마감일
+                deadline = be.text(be.select_one(job, '.job_date .date')).strip()
+
+                # 직무 분야
+                job_sectors = be.select_one(job, '.job_sector')
+                sector_text = be.text(job_sectors).strip() if job_sectors else ''
+
+                # 트렌드 키워드 정보 (있는 경우)
+                trend_badge = be.select_one(job, '.area_badge .badge')
+                trend_keywords = be.text(trend_badge).strip() if trend_badge else ''
+
+            except AttributeError as e:
+                print(f"항목 파싱 중 에러 발생: {e}")
+                continue
+
+            jobs.append(build_job_record(
+                company, company_info, title, post_link, conditions,
+                deadline, sector_text, trend_keywords, today=today
+            ))
+
+        return jobs
+
+
+class CompanyInfoParser:
+    """
+    사람인 회사 정보 페이지 파서
+    """
+
+    def __init__(self, backend='auto'):
+        self.backend = backend if hasattr(backend, 'parse') else get_backend(backend)
+
+    def parse(self, html, company_name):
+        """
+        회사 정보 HTML에서 회사 레코드 목록을 추출
+        """
+        be = self.backend
+        root = be.parse(html)
+        company_info = []
+
+        for company in be.select(root, '.area_company_infos'):
+            try:
+                # 기업 형태
+                company_summary_tit = be.select(company, '.company_summary_tit')
+                if len(company_summary_tit) > 1:  # [1]이 있는지 확인
+                    company_type = be.text(company_summary_tit[1]).strip()
+                    if company_type.endswith("명"):
+                        company_type = None
+                else:
+                    company_type = None
+
+                # 업종
+                industry = be.find_dd(root, '업종')
+                industry = be.text(industry, strip=True) if industry else '정보 없음'
+
+                # 홈페이지
+                website = be.find_dd(root, '홈페이지')
+                website = be.attr(be.select_one(website, 'a'), 'href') if website else '정보 없음'
+
+                # 주소
+                address = be.find_dd(root, '주소')
+                address = be.text(be.select_one(address, 'p.ellipsis'), strip=True) if address else '정보 없음'
+
+                # 기업 설명
+                introduce = be.select_one(company, '.company_introduce')
+                introduce = be.text(introduce).strip() if introduce else '정보 없음'
+
+                company_info.append({
+                    '회사명': company_name,
+                    '기업 형태': company_type,
+                    '업종': industry,
+                    '홈페이지': website,
+                    '주소': address,
+                    '기업 설명': introduce,
+                })
+
+            except (AttributeError, TypeError) as e:
+                print(f"항목 파싱 중 에러 발생: {e}")
+                continue
+
+        return company_info
+
+
+def build_job_record(company, company_info, title, post_link, conditions, deadline, sector_text, trend_keywords, today=None):
+    """
+    추출한 원본 문자열을 채용공고 레코드(dict)로 변환
+    """
+    location = conditions[0] if len(conditions) > 0 else ''
+    career_level = conditions[1] if len(conditions) > 1 else ''
+    education = conditions[2] if len(conditions) > 2 else ''
+    employment_type = conditions[3] if len(conditions) > 3 else ''
+    salary_range = conditions[4] if len(conditions) > 4 else ''
+
+    if '수정일' in sector_text:
+        job_sector = sector_text.split('수정일')[0].strip()
+        posted_date = sector_text.split('수정일')[1].strip()
+    elif '등록일' in sector_text:
+        job_sector = sector_text.split('등록일')[0].strip()
+        posted_date = sector_text.split('등록일')[1].strip()
+    else:
+        job_sector = sector_text
+        posted_date = ''
+
+    # 기술 리스트로 분리 (별칭은 표준 기술명으로, '외' 등은 제거)
+    job_sector = normalize_skills([job_sector]) if job_sector else []
+
+    # posted_date에서 날짜 부분만 추출 (예: "24/11/25")
+    if posted_date and len(posted_date) >= 8:
+        try:
+            posted_date = datetime.strptime(posted_date[-8:], "%y/%m/%d").date()
+        except ValueError:
+            posted_date = None
+    else:
+        posted_date = None
+
+    # 마감일 & 상태 처리
+    today = today or datetime.today().date()
+
+    if deadline:
+        # '~ 12/27(금)' -> '12/27'
+        deadline = deadline.split(' ')[-1].split('(')[0].strip()
+        try:
+            # '12/27' -> datetime 객체로 변환
+            deadline_date = datetime.strptime(deadline, "%m/%d").date()
+
+            # 연도 보정
+            if posted_date and deadline_date.month < posted_date.month:
+                # 마감일이 게시일보다 이전이라면 다음 해로 설정
+                deadline_date = deadline_date.replace(year=today.year + 1)
+            else:
+                deadline_date = deadline_date.replace(year=today.year)
+
+            deadline = deadline_date
+        except ValueError:
+            deadline = None
+    else:
+        deadline = None
+
+    # 상태 처리: 마감일이 지나지 않았으면 open, 지났으면 closed
+    status = 'closed' if deadline and deadline < today else 'open'
+
+    return {
+        '회사명': company,
+        '트렌드_키워드': trend_keywords,
+        '제목': title,
+        '공고 링크': post_link,
+        '지역': location,
+        '경력': career_level,
+        '학력': education,
+        '고용형태': employment_type,
+        '마감일': deadline,
+        '연봉정보': salary_range,
+        '작성날짜': posted_date,
+        '상태': status,
+        '직무분야': job_sector,
+        '회사 정보': company_info
+    }
@@ -1,35 +1,23 @@
-from ..models import db, Skill, JobPostingSkill
+from ..models import db, JobPostingSkill
+from .db_service import dialect_insert
+from .skill_registry import skill_registry
 
-# skills 테이블 업데이트
+# skills 테이블 업데이트 (없는 기술만 한 번에 추가)
 def update_skills_table(job_sector_list):
-    for sector in job_sector_list:
-        for skill_name in sector:
-            if skill_name.strip() != "외":
-                skill = Skill.query.filter_by(name=skill_name.strip()).first()
-
-                if not skill:
-                    skill = Skill(name=skill_name.strip())
-                    db.session.add(skill)
-                else:
-                    skill.name = skill_name.strip()
+    skill_names = [skill_name for sector in job_sector_list for skill_name in sector if skill_name.strip() != "외"]
+    skill_registry.get_ids(skill_names, create=True)
     db.session.commit()
 
-# job_posting_skills 테이블 저장
+# job_posting_skills 테이블 저장 (한 번의 다중 행 INSERT)
 def save_job_posting_skills(job_post_id, job_sector_list):
-    for sector in job_sector_list:
-        for skill_name in sector:
-            skill = Skill.query.filter_by(name=skill_name).first()
-            if skill:
-                # job_posting_skills 테이블에 해당 job_post_id와 skill_id 조합이 이미 존재하는지 확인
-                existing_record = JobPostingSkill.query.filter_by(
-                    job_post_id=job_post_id, skill_id=skill.skill_id
-                ).first()
-                
-                # 해당 조합이 없으면 새로운 레코드 추가
-                if not existing_record:
-                    job_posting_skill = JobPostingSkill(
-                        job_post_id=job_post_id, 
-                        skill_id=skill.skill_id
-                    )
-                    db.session.add(job_posting_skill)
-    db.session.commit()
\ No newline at end of file
+    skill_names = [skill_name for sector in job_sector_list for skill_name in sector]
+    skill_ids = skill_registry.get_ids(skill_names, create=False)
+
+    if skill_ids:
+        # 이미 존재하는 job_post_id, skill_id 조합은 건너뜀
+        db.session.execute(
+            dialect_insert(JobPostingSkill)
+            .values([{'job_post_id': job_post_id, 'skill_id': skill_id} for skill_id in set(skill_ids.values())])
+            .on_conflict_do_nothing(index_elements=['job_post_id', 'skill_id'])
+        )
+    db.session.commit()
@@ -0,0 +1,167 @@
+import re
+
+# 표준 기술명: 별칭 목록 (대소문자 구분 없음, 띄어쓰기를 뺀 형태도 자동으로 등록)
+SKILL_VOCABULARY = {
+    'Python': ['파이썬', 'Python3', 'py'],
+    'Java': ['자바'],
+    'JavaScript': ['자바스크립트', 'JS', 'ECMAScript'],
+    'TypeScript': ['타입스크립트', 'TS'],
+    'C': ['C언어'],
+    'C++': ['CPP', 'C 플러스플러스'],
+    'C#': ['CSharp', 'C샵'],
+    'Go': ['Golang', '고랭'],
+    'Kotlin': ['코틀린'],
+    'Swift': ['스위프트'],
+    'PHP': [],
+    'Ruby': ['루비'],
+    'Rust': ['러스트'],
+    'SQL': [],
+    'HTML': ['HTML5'],
+    'CSS': ['CSS3'],
+    'React': ['리액트', 'React.js', 'ReactJS'],
+    'Vue.js': ['Vue', 'VueJS', '뷰'],
+    'Node.js': ['Node', 'NodeJS', '노드'],
+    'Django': ['장고'],
+    'Flask': ['플라스크'],
+    'Spring': ['스프링', 'Spring Framework'],
+    'Spring Boot': ['스프링부트', '스프링 부트', 'SpringBoot'],
+    'JPA': [],
+    'AWS': ['Amazon Web Services', '아마존웹서비스'],
+    'Docker': ['도커'],
+    'Kubernetes': ['쿠버네티스', 'k8s'],
+    'Linux': ['리눅스'],
+    'Git': ['깃'],
+    'CI/CD': ['CICD'],
+    'MySQL': ['마이에스큐엘'],
+    'PostgreSQL': ['Postgres', '포스트그레스'],
+    'Oracle': ['오라클'],
+    'MongoDB': ['몽고DB', 'Mongo'],
+    'Redis': ['레디스'],
+    'PyTorch': ['파이토치'],
+    'TensorFlow': ['텐서플로우', '텐서플로'],
+    '웹개발': ['웹 개발', 'Web개발', '웹프로그래밍'],
+    '앱개발': ['앱 개발', 'App개발', '어플리케이션개발', '애플리케이션개발'],
+    '백엔드': ['백엔드개발', 'Backend', 'Back-end', '서버개발', '서버 개발'],
+    '프론트엔드': ['프론트엔드개발', 'Frontend', 'Front-end', '프런트엔드'],
+    '풀스택': ['풀스택개발', 'Fullstack', 'Full-stack'],
+    '안드로이드': ['Android', '안드로이드개발'],
+    'iOS': ['iOS개발', '아이폰'],
+    '데이터분석': ['데이터 분석', 'Data Analysis'],
+    '데이터엔지니어': ['데이터 엔지니어', '데이터엔지니어링', 'Data Engineer'],
+    '빅데이터': ['빅 데이터', 'BigData', 'Big Data'],
+    '머신러닝': ['기계학습', 'ML', 'Machine Learning'],
+    '딥러닝': ['DL', 'Deep Learning'],
+    '인공지능': ['AI', '인공 지능'],
+    '임베디드': ['Embedded', '임베디드SW'],
+    '클라우드': ['Cloud'],
+    'DevOps': ['데브옵스'],
+    '정보보안': ['보안', 'Security'],
+    'QA': ['테스트엔지니어', 'QA엔지니어'],
+}
+
+# 기술명이 아닌 조각 ("Python, Django 외")
+SKILL_STOPWORDS = {'외', '등'}
+
+# 기술명 최대 길이 (Skill.name 컬럼 길이)
+SKILL_NAME_MAX_LENGTH = 64
+
+_SEGMENT_SPLIT = re.compile(r'[,，]')
+_END = object()
+
+
+def _token_key(token):
+    return token.strip(',').casefold()
+
+
+class SkillMatcher:
+    """
+    별칭 사전을 토큰 단위 트라이로 컴파일하여, 직무분야 텍스트를 한 번에 훑으며 가장 긴 별칭부터 매칭
+    """
+
+    def __init__(self, vocabulary=SKILL_VOCABULARY):
+        self._root = {}
+        for canonical, aliases in vocabulary.items():
+            for alias in [canonical, *aliases]:
+                self._insert(alias, canonical)
+                self._insert(alias.replace(' ', ''), canonical)
+
+    def _insert(self, alias, canonical):
+        node = self._root
+        for token in alias.split():
+            node = node.setdefault(_token_key(token), {})
+        node[_END] = canonical
+
+    def _longest_match(self, tokens, start):
+        """
+        tokens[start:]에서 가장 긴 별칭 매칭 -> (끝 위치, 표준 기술명) 또는 None
+        """
+        node, match = self._root, None
+        for index in range(start, len(tokens)):
+            node = node.get(_token_key(tokens[index]))
+            if node is None:
+                break
+            if _END in node:
+                match = (index + 1, node[_END])
+        return match
+
+    def canonical(self, name):
+        """
+        기술명 하나를 표준 기술명으로 변환 (전체가 하나의 별칭과 일치할 때만, 아니면 None)
+        """
+        tokens = name.split()
+        match = self._longest_match(tokens, 0) if tokens else None
+        if match and match[0] == len(tokens):
+            return match[1]
+        compact = self._root.get(_token_key(''.join(tokens)))
+        return compact.get(_END) if compact else None
+
+    def match_segment(self, segment, split_unmatched=True):
+        """
+        쉼표로 구분된 한 조각에서 기술명 추출
+        split_unmatched=True이면 사전에 없는 토큰을 각각 기술명으로, False이면 연속된 토큰을 하나로 묶음
+        """
+        tokens = segment.split()
+        skills, pending = [], []
+
+        def flush():
+            if pending:
+                phrase = ' '.join(pending)
+                skills.append(self.canonical(phrase) or phrase)
+                pending.clear()
+
+        index = 0
+        while index < len(tokens):
+            token = tokens[index].strip(',').strip()
+            if not token or token in SKILL_STOPWORDS:
+                flush()
+                index += 1
+                continue
+
+            match = self._longest_match(tokens, index)
+            if match:
+                flush()
+                index, canonical = match
+                skills.append(canonical)
+            else:
+                pending.append(token)
+                if split_unmatched:
+                    flush()
+                index += 1
+        flush()
+        return skills
+
+
+# 프로세스 전역 기술명 매처
+skill_matcher = SkillMatcher()
+
+
+def normalize_skills(values, split_unmatched=True):
+    """
+    직무분야 텍스트(또는 기술명 목록)를 중복 없는 표준 기술명 목록으로 변환
+    (예: ['파이썬, 웹 개발, Django 외'] -> ['Python', '웹개발', 'Django'])
+    """
+    skills = []
+    for value in values:
+        for segment in _SEGMENT_SPLIT.split(value or ''):
+            skills.extend(skill_matcher.match_segment(segment, split_unmatched=split_unmatched))
+    return [skill for skill in dict.fromkeys(skills) if len(skill) <= SKILL_NAME_MAX_LENGTH]
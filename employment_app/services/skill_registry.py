@@ -0,0 +1,101 @@
+from flask import current_app, has_app_context
+from sqlalchemy import event, select
+from sqlalchemy.orm import Session
+from ..models import db, Skill
+from .db_service import dialect_insert
+
+
+class SkillRegistry:
+    """
+    프로세스별 기술명 -> skill_id 캐시
+    - 처음 사용할 때(또는 warm 호출 시) skills 테이블 전체를 한 번에 적재
+    - 다른 프로세스가 추가한 기술은 Redis 해시(skill_ids)에서 조회
+    - 기술 병합/삭제 시 버전(skill_ids_version)을 올려 모든 프로세스의 캐시를 무효화
+    - DB에서 새로 찾은 기술은 세션(session.info)에 보류했다가 commit 후에만 캐시에 반영 (rollback 시 버림)
+    """
+
+    REDIS_KEY = 'skill_ids'
+    VERSION_KEY = 'skill_ids_version'
+    PENDING_KEY = 'pending_skill_ids'
+
+    def __init__(self):
+        self._ids = {}
+        self._version = None
+        self._warmed = False
+
+    def warm(self):
+        """
+        skills 테이블 전체로 캐시 적재 (Redis 해시도 함께 갱신)
+        """
+        redis_client = current_app.redis_client
+        self._version = redis_client.get(self.VERSION_KEY)
+        self._ids = dict(db.session.execute(select(Skill.name, Skill.skill_id)).all())
+        self._warmed = True
+        if self._ids:
+            redis_client.hset(self.REDIS_KEY, mapping=self._ids)
+
+    def invalidate(self):
+        """
+        모든 프로세스의 캐시 무효화 (기술 병합/삭제 후 호출)
+        """
+        redis_client = current_app.redis_client
+        redis_client.delete(self.REDIS_KEY)
+        redis_client.incr(self.VERSION_KEY)
+        self._warmed = False
+
+    def get_ids(self, names, create=True):
+        """
+        기술명 목록 -> {기술명: skill_id}
+        create=True이면 없는 기술을 한 번의 INSERT ... ON CONFLICT DO NOTHING으로 추가
+        (추가한 경우 호출한 쪽에서 바로 commit 해야 하며, commit 전까지는 같은 세션에서만 조회됨)
+        """
+        names = list(dict.fromkeys(name.strip() for name in names if name and name.strip()))
+        redis_client = current_app.redis_client
+        pending = db.session.info.setdefault(self.PENDING_KEY, {})
+
+        # 다른 프로세스에서 무효화했으면 다시 적재
+        if not self._warmed or redis_client.get(self.VERSION_KEY) != self._version:
+            self.warm()
+
+        missing = [name for name in names if name not in self._ids and name not in pending]
+        if missing:
+            for name, skill_id in zip(missing, redis_client.hmget(self.REDIS_KEY, missing)):
+                if skill_id:
+                    self._ids[name] = int(skill_id)
+            missing = [name for name in missing if name not in self._ids]
+
+        if missing:
+            if create:
+                db.session.execute(
+                    dialect_insert(Skill).values([{'name': name} for name in missing])
+                    .on_conflict_do_nothing(index_elements=['name'])
+                )
+            found = dict(db.session.execute(select(Skill.name, Skill.skill_id).where(Skill.name.in_(missing))).all())
+            # 현재 트랜잭션에서 추가된 행일 수 있으므로 commit 후에 반영
+            pending.update(found)
+
+        ids = {**pending, **self._ids}
+        return {name: ids[name] for name in names if name in ids}
+
+    def publish_pending(self, session):
+        """
+        commit된 세션에서 보류했던 기술을 프로세스 캐시와 Redis 해시에 반영
+        """
+        pending = session.info.pop(self.PENDING_KEY, None)
+        if pending and has_app_context():
+            self._ids.update(pending)
+            current_app.redis_client.hset(self.REDIS_KEY, mapping=pending)
+
+
+# 프로세스 전역 기술 캐시
+skill_registry = SkillRegistry()
+
+
+@event.listens_for(Session, 'after_commit')
+def _publish_pending_skills(session):
+    skill_registry.publish_pending(session)
+
+
+@event.listens_for(Session, 'after_rollback')
+def _discard_pending_skills(session):
+    session.info.pop(SkillRegistry.PENDING_KEY, None)
@@ -0,0 +1,126 @@
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from flask import current_app
+from flask_jwt_extended import get_jti
+from ..error_log import ServiceUnavailableError
+from ..extensions import jwt, KST
+from ..models import db, Token
+from .cache_service import ResilientRedis, REDIS_UNAVAILABLE_ERRORS
+
+
+class TokenStore:
+    """
+    Redis 기반 토큰 세션 저장소
+    - token_session_{user_id}: 마지막으로 발급한 access/refresh 토큰의 jti 및 만료 시각 (refresh 만료 시간 후 자동 삭제)
+    - token_revoked_{jti}: 로그아웃/탈퇴로 폐기된 토큰 (토큰 만료 시각까지만 보관)
+    - TOKEN_AUDIT_DB가 켜져 있으면 tokens 테이블에 발급 내역을 백그라운드로 기록
+    """
+
+    SESSION_KEY = 'token_session_{user_id}'
+    REVOKED_KEY = 'token_revoked_{jti}'
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._pid = None
+        self._executor = None
+
+    def save_session(self, user_id, access_token, refresh_token=None):
+        """
+        로그인(access + refresh) 또는 토큰 갱신(access만) 후 세션 저장
+        """
+        config = current_app.config
+        now = time.time()
+        session = {'access_jti': get_jti(access_token), 'access_exp': int(now + config['JWT_ACCESS_TOKEN_EXPIRES'])}
+        if refresh_token:
+            session.update({'refresh_jti': get_jti(refresh_token), 'refresh_exp': int(now + config['JWT_REFRESH_TOKEN_EXPIRES'])})
+
+        key = self.SESSION_KEY.format(user_id=user_id)
+        pipe = current_app.redis_client.pipeline()
+        pipe.hset(key, mapping=session)
+        if refresh_token:
+            pipe.expire(key, config['JWT_REFRESH_TOKEN_EXPIRES'])
+        pipe.execute()
+
+        if config['TOKEN_AUDIT_DB']:
+            self._audit(user_id, access_token, refresh_token, session)
+
+    def revoke(self, jti, expires_at):
+        """
+        토큰 폐기 (만료 시각까지 폐기 목록에 보관)
+        """
+        ttl = int(expires_at - time.time())
+        if ttl > 0:
+            current_app.redis_client.set(self.REVOKED_KEY.format(jti=jti), 1, ex=ttl)
+
+    def revoke_session(self, user_id):
+        """
+        사용자의 마지막 세션(access/refresh 토큰) 폐기 (로그아웃/회원 탈퇴)
+        """
+        key = self.SESSION_KEY.format(user_id=user_id)
+        session = current_app.redis_client.hgetall(key)
+        for kind in ('access', 'refresh'):
+            if session.get(f'{kind}_jti'):
+                self.revoke(session[f'{kind}_jti'], int(session[f'{kind}_exp']))
+        current_app.redis_client.delete(key)
+
+    def is_revoked(self, jwt_payload):
+        """
+        폐기 여부 확인 (Redis에 연결할 수 없으면 폐기된 토큰을 통과시키지 않도록 503 반환)
+        - @jwt_required() 엔드포인트에서만 503으로 응답, 토큰을 선택적으로 확인하는 곳(공고 목록의 북마크 여부 등)은 비로그인으로 처리
+        """
+        redis_client = current_app.redis_client
+        key = self.REVOKED_KEY.format(jti=jwt_payload['jti'])
+        try:
+            if isinstance(redis_client, ResilientRedis):
+                return redis_client.call_strict('exists', key) > 0
+            return redis_client.exists(key) > 0
+        except REDIS_UNAVAILABLE_ERRORS:
+            raise ServiceUnavailableError("인증 서버에 일시적으로 연결할 수 없습니다. 잠시 후 다시 시도해주세요.")
+
+    def _audit(self, user_id, access_token, refresh_token, session):
+        if self._pid != os.getpid():
+            with self._lock:
+                if self._pid != os.getpid():
+                    self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='token-audit')
+                    self._pid = os.getpid()
+        app = current_app._get_current_object()
+        self._executor.submit(_write_token_audit, app, user_id, access_token, refresh_token, session)
+
+
+def _write_token_audit(app, user_id, access_token, refresh_token, session):
+    """
+    tokens 테이블에 발급 내역 기록 (백그라운드 스레드, 실패해도 인증에는 영향 없음)
+    """
+    with app.app_context():
+        try:
+            access_expires_at = datetime.fromtimestamp(session['access_exp'], KST)
+            token = Token.query.filter_by(user_id=user_id).first()
+            if token:
+                token.access_token = access_token
+                token.access_expires_at = access_expires_at
+                if refresh_token:
+                    token.refresh_token = refresh_token
+                    token.refresh_expires_at = datetime.fromtimestamp(session['refresh_exp'], KST)
+            elif refresh_token:
+                db.session.add(Token(user_id=user_id, access_token=access_token, refresh_token=refresh_token,
+                                     access_expires_at=access_expires_at,
+                                     refresh_expires_at=datetime.fromtimestamp(session['refresh_exp'], KST)))
+            db.session.commit()
+        except Exception as e:
+            db.session.rollback()
+            app.logger.error(f"Token audit write failed for user {user_id}: {str(e)}")
+
+
+# 프로세스 전역 토큰 저장소
+token_store = TokenStore()
+
+
+@jwt.token_in_blocklist_loader
+def check_token_revoked(jwt_header, jwt_payload):
+    """
+    폐기된 토큰인지 확인 (모든 jwt_required 요청에서 호출)
+    """
+    return token_store.is_revoked(jwt_payload)
@@ -0,0 +1,35 @@
+from .models import db
+
+
+def release_connections(app, close=True):
+    """
+    DB 엔진 커넥션 풀과 Redis 클라이언트 정리 (다음 사용 시 현재 프로세스에서 새로 연결)
+    - close=False: fork된 자식 프로세스에서 부모와 공유된 소켓은 닫지 않고 버림
+    """
+    with app.app_context():
+        for engine in db.engines.values():
+            engine.dispose(close=close)
+    app.reset_redis_client(close=close)
+
+
+def warm_process_caches(app):
+    """
+    프로세스별 캐시 미리 적재 (기술명 -> skill_id), preload 시 마스터에서 한 번 실행하면 워커가 물려받음
+    """
+    from .services import skill_registry
+    with app.app_context():
+        skill_registry.warm()
+        db.session.remove()
+
+
+def warm_hot_pages(app):
+    """
+    자주 조회되는 페이지를 워커에서 한 번씩 요청 (Redis 캐시 채움, 워커별 SQL 컴파일/스키마 초기화)
+    """
+    client = app.test_client()
+    for path in app.config['WORKER_WARMUP_PATHS']:
+        try:
+            response = client.get(path)
+            app.logger.info(f"Warmup {path}: {response.status_code}")
+        except Exception as e:
+            app.logger.warning(f"Warmup failed for {path}: {str(e)}")
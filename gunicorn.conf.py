@@ -0,0 +1,82 @@
+# gunicorn 설정 (`gunicorn wsgi:app` 실행 시 현재 디렉터리의 이 파일을 자동으로 읽음)
+import multiprocessing
+import os
+import tempfile
+
+cpu_count = multiprocessing.cpu_count()
+
+bind = os.getenv("GUNICORN_BIND", "0.0.0.0:80")
+
+# 워커 수: CPU 코어 * 2 + 1 (상한 GUNICORN_MAX_WORKERS, 워커마다 DB 풀 DB_POOL_SIZE + DB_MAX_OVERFLOW개를 사용하므로 DB 최대 연결 수 고려)
+workers = int(os.getenv("GUNICORN_WORKERS", 0)) or min(cpu_count * 2 + 1, int(os.getenv("GUNICORN_MAX_WORKERS", 8)))
+# 워커당 스레드 수: 코어가 적으면 스레드를 늘려 I/O(DB, Redis, bcrypt) 대기 시간을 활용
+threads = int(os.getenv("GUNICORN_THREADS", 0)) or (4 if cpu_count <= 2 else 2)
+worker_class = "gthread" if threads > 1 else "sync"
+
+timeout = int(os.getenv("GUNICORN_TIMEOUT", 60))
+graceful_timeout = 30
+keepalive = 5
+# 메모리 누수 대비 주기적으로 워커 재시작 (동시에 재시작되지 않도록 jitter)
+max_requests = int(os.getenv("GUNICORN_MAX_REQUESTS", 5000))
+max_requests_jitter = 500
+
+# 마스터에서 앱을 한 번만 생성하고 워커는 fork로 물려받음 (워커 시작 시간 및 메모리 절약)
+preload_app = True
+
+# 워커별 지표 파일 디렉터리 (GET /metrics에서 모든 워커 합산, 앱 생성 전에 설정해야 Config에 반영됨)
+os.environ.setdefault("METRICS_MULTIPROC_DIR", os.path.join(tempfile.gettempdir(), "employment_app_metrics"))
+
+
+def on_starting(server):
+    """
+    마스터: 이전 실행에서 남은 지표 파일 삭제
+    """
+    from employment_app.error_log import clear_metrics_dir
+    clear_metrics_dir(os.environ["METRICS_MULTIPROC_DIR"])
+
+
+def when_ready(server):
+    """
+    마스터: 워커를 띄우기 전에 프로세스 캐시를 채우고, 사용한 DB/Redis 커넥션은 닫음 (워커와 소켓 공유 방지)
+    """
+    from wsgi import app
+    from employment_app.worker import warm_process_caches, release_connections
+    try:
+        warm_process_caches(app)
+    except Exception as e:
+        server.log.warning(f"Process cache warmup skipped: {e}")
+    release_connections(app)
+
+
+def post_fork(server, worker):
+    """
+    워커: 부모에게서 물려받은 커넥션 풀을 버리고 새로 연결하도록 초기화
+    """
+    from wsgi import app
+    from employment_app.worker import release_connections
+    release_connections(app, close=False)
+
+
+def post_worker_init(worker):
+    """
+    워커: 요청을 받기 전에 자주 조회되는 페이지 미리 요청
+    """
+    from wsgi import app
+    from employment_app.worker import warm_hot_pages
+    warm_hot_pages(app)
+
+
+def worker_exit(server, worker):
+    """
+    워커: 종료 직전 지표를 파일에 기록
+    """
+    from employment_app.error_log import metrics
+    metrics.flush()
+
+
+def child_exit(server, worker):
+    """
+    마스터: 종료된 워커의 누적 지표를 보관 파일에 합치고 워커 파일 삭제
+    """
+    from employment_app.error_log import archive_process_metrics
+    archive_process_metrics(os.environ["METRICS_MULTIPROC_DIR"], worker.pid)
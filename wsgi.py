@@ -1,4 +1,4 @@
 from employment_app import create_app
 
-app = create_app()  # create_app() 호출하여 앱 초기화
+app = create_app({"ENABLE_MIGRATE": False})  # create_app() 호출하여 앱 초기화 (서버 실행 시 마이그레이션 확장 생략)
 # gunicorn 전용